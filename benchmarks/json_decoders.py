@@ -0,0 +1,78 @@
+"""
+Compare JSON decoders which may be passed as ``json_loads`` to Swarm clients
+on a big synthetic ``reviews`` response.
+
+Usage::
+
+    python3 benchmarks/json_decoders.py [reviews count] [repeat]
+"""
+import importlib
+import json
+import sys
+import timeit
+
+
+def make_review(review_id: int) -> dict:
+    return {
+        'id': review_id,
+        'author': 'user{}'.format(review_id % 100),
+        'changes': [review_id * 10, review_id * 10 + 1],
+        'comments': [review_id % 7, review_id % 3],
+        'commits': [review_id * 10 + 1],
+        'commitStatus': [],
+        'created': 1402507043 + review_id,
+        'deployDetails': [],
+        'deployStatus': None,
+        'description': 'Review description for change {}\n'.format(review_id) * 5,
+        'participants': {
+            'user{}'.format(i): {'vote': {'value': 1, 'version': 2}, 'required': True}
+            for i in range(5)
+        },
+        'pending': bool(review_id % 2),
+        'projects': {'project{}'.format(review_id % 10): ['main', 'dev']},
+        'state': 'needsReview',
+        'stateLabel': 'Needs Review',
+        'testDetails': {'url': 'http://ci/job/{}'.format(review_id)},
+        'testStatus': 'pass',
+        'type': 'default',
+        'updated': 1402518492 + review_id,
+        'versions': [
+            {'change': review_id * 10 + v, 'user': 'swarm', 'time': 1402518492, 'pending': False}
+            for v in range(3)
+        ],
+    }
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    body = json.dumps({
+        'lastSeen': count,
+        'reviews': [make_review(i) for i in range(1, count + 1)],
+        'totalCount': count,
+    }).encode()
+
+    print('{} reviews, {:.1f} MB, best of {}'.format(count, len(body) / 2 ** 20, repeat))
+
+    decoders = [
+        ('json.loads(bytes)', json.loads),
+        ('json.loads(str)', lambda b: json.loads(b.decode())),
+    ]
+
+    for name in ('orjson', 'ujson'):
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            print('{:<20} not installed'.format(name))
+            continue
+        decoders.append(('{}.loads'.format(name), module.loads))
+
+    for name, loads in decoders:
+        assert loads(body)['totalCount'] == count
+        best = min(timeit.repeat(lambda: loads(body), number=1, repeat=repeat))
+        print('{:<20} {:8.2f} ms'.format(name, best * 1000))
+
+
+if __name__ == '__main__':
+    main()
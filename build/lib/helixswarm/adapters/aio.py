@@ -0,0 +1,997 @@
+import asyncio
+import ssl
+import time
+
+from http import HTTPStatus
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from aiohttp import (
+    BasicAuth,
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    CookieJar,
+    TCPConnector,
+)
+
+from helixswarm.adapters.tracing import add_phase, create_trace_config
+from helixswarm.batch import ReviewBatcher
+from helixswarm.cache import ResponseCache
+from helixswarm.coalesce import RequestCoalescer
+from helixswarm.exceptions import SwarmError, SwarmUnauthorizedError
+from helixswarm.hedge import HedgePolicy
+from helixswarm.metrics import RequestInfo, get_path_template
+from helixswarm.retry import RetryPolicy
+from helixswarm.stream import STREAM_CHUNK_SIZE, ItemParser
+from helixswarm.swarm import Response, ResponseEvicted, Swarm
+
+
+class RetryClientSession:
+
+    def __init__(self, policy: RetryPolicy, **kwargs: Any) -> None:
+        self.policy = policy
+        self.session = ClientSession(**kwargs)
+
+    async def request(self,
+                      method: str,
+                      url: str,
+                      *,
+                      info: Optional[RequestInfo] = None,
+                      **kwargs: Any
+                      ) -> ClientResponse:
+        started = time.monotonic()
+        retry = 0
+
+        while True:
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except (ClientError, asyncio.TimeoutError) as e:
+                delay = self.policy.get_delay(method, retry, started)
+                if delay is None:
+                    raise SwarmError from e
+            else:
+                delay = self.policy.get_delay(
+                    method, retry, started, status=response.status, headers=response.headers
+                )
+                if delay is None:
+                    return response
+
+                # connection goes back to pool instead of being held
+                response.release()
+
+            retry += 1
+            if info is not None:
+                info.retries = retry
+
+            await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        await self.session.close()
+
+
+async def _iter_chunks(response: ClientResponse) -> AsyncIterator[bytes]:
+    # connection goes back to pool even if consumer stops iterating
+    try:
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            yield chunk
+    finally:
+        response.release()
+
+
+class SwarmAsyncClient(Swarm):
+
+    session = None  # type: Union[ClientSession, RetryClientSession]
+    timeout = None
+    prefetch = 0
+    coalesce = False
+    coalescer = None  # type: Optional[RequestCoalescer]
+    timing = False
+    auth_update_callback = None
+    hedge = None  # type: Optional[HedgePolicy]
+
+    def __init__(self,
+                 url: str,
+                 user: str,
+                 password: str,
+                 *,
+                 verify: bool = True,
+                 timeout: Optional[float] = None,
+                 retry: Optional[dict] = None,
+                 auth_update_callback: Optional[Callable[[], Awaitable[Tuple[str, str]]]] = None,
+                 prefetch: int = 0,
+                 json_loads: Optional[Callable[[bytes], Any]] = None,
+                 pool: Optional[dict] = None,
+                 ssl_context: Optional[ssl.SSLContext] = None,
+                 cache: Optional[dict] = None,
+                 revalidate: Optional[dict] = None,
+                 coalesce: bool = False,
+                 hooks: Optional[List[Callable[[RequestInfo], None]]] = None,
+                 timing: bool = False,
+                 rate_limit: Optional[dict] = None,
+                 adaptive_concurrency: Optional[dict] = None,
+                 circuit_breaker: Optional[dict] = None,
+                 hedge: Optional[dict] = None,
+                 session_auth: bool = False,
+                 stream: bool = False,
+                 batch_reviews: Optional[dict] = None
+                 ) -> None:
+        """
+        Swarm async client class.
+
+        Args:
+            url (str):
+                URL of Swarm server, must include API version.
+
+            user (str):
+                User name.
+
+            password (str):
+                Password for user.
+
+            verify (Optional[bool]):
+                Verify SSL (default: true).
+
+            timeout (Optional[int])
+                HTTP request timeout.
+
+            retry (Optional[dict]):
+                Retry options to prevent failures if server restarting or
+                temporary network problem. Disabled by default use total > 0 to
+                enable. Sleep before each retry is random from zero to
+                ``factor * 2 ** retry`` seconds limited by ``max_sleep``, so
+                many clients don't retry at the same moment, `Retry-After`
+                header of response is used instead if server sends it.
+
+                - total: ``int`` Total retries count.
+                - factor: ``float`` Sleep factor between retries (default 1).
+                - statuses: ``List[int]`` HTTP statues retries on. (default [])
+                - methods: ``List[str]`` list of HTTP methods to retry, idempotent
+                    methods are used by default.
+                - max_sleep: ``float`` Maximal sleep between retries, retry
+                    isn't made if `Retry-After` is bigger (default 60).
+                - deadline: ``float`` Seconds since first attempt after which
+                    retries aren't made (default no limit).
+
+                Example:
+
+                .. code-block:: python
+
+                    retry = dict(
+                        total=10,
+                        factor=1,
+                        statuses=[500, 503],
+                        deadline=120
+                    )
+
+            auth_update_callback (Optional[Callable[[], Tuple[str, str]]):
+                Callback function which will be called on SwarmUnauthorizedError
+                to update user and password and retry request again.
+
+            prefetch (int):
+                How many pages to request ahead while iterating over paginated
+                results with ``iter()``, next page is requested as soon as
+                previous one arrives instead of waiting for consumer. Disabled
+                by default.
+
+            json_loads (Optional[Callable[[bytes], Any]]):
+                Function used to decode JSON responses, it gets raw response
+                body bytes, for instance ``orjson.loads`` or ``ujson.loads`` may
+                be used for big responses (default: ``json.loads``).
+
+            pool (Optional[dict]):
+                Connection pool options, connections are kept alive and reused
+                between requests.
+
+                - size: ``int`` Total number of simultaneous connections
+                    (default 100).
+                - per_host: ``int`` Number of simultaneous connections to the
+                    same host (default 0, no limit).
+                - keepalive_timeout: ``float`` Seconds to keep idle connection
+                    opened (default 15).
+                - dns_ttl: ``int`` Seconds to cache resolved host addresses
+                    (default 10).
+
+                Example:
+
+                .. code-block:: python
+
+                    pool = dict(
+                        size=200,
+                        per_host=50,
+                        keepalive_timeout=60,
+                        dns_ttl=300
+                    )
+
+            ssl_context (Optional[ssl.SSLContext]):
+                SSL context shared by all pooled connections, for instance with
+                custom CA certificates loaded once.
+
+            cache (Optional[dict]):
+                Cache of GET responses for rarely changed data, disabled by
+                default, use empty dict to enable it with default options. Any
+                non GET request made by client drops cached responses of the
+                same endpoint. Cache hits and misses are counted in
+                ``client.cache.hits`` and ``client.cache.misses``.
+
+                - size: ``int`` Maximum number of cached responses, least
+                    recently used are evicted (default 1024).
+                - ttl: ``Dict[str, float]`` Seconds to keep responses of each
+                    endpoint, endpoints which are not listed aren't cached.
+                    (default 60 seconds for `groups`, `projects`, `servers`,
+                    `users`, `version` and `workflows`)
+
+                Example:
+
+                .. code-block:: python
+
+                    cache = dict(
+                        size=256,
+                        ttl={'projects': 300, 'version': 3600}
+                    )
+
+            revalidate (Optional[dict]):
+                Revalidate GET responses using `ETag` and `Last-Modified`
+                validators, disabled by default, use empty dict to enable it with
+                default options. When server answers `304 Not Modified` stored
+                response body is decoded instead of downloading it again,
+                number of such responses is counted in
+                ``client.validators.revalidated``.
+
+                - size: ``int`` Maximum number of stored responses, least
+                    recently used are evicted (default 1024).
+
+            coalesce (bool):
+                Identical GET requests made at the same time share one HTTP
+                request and its decoded response (default: false).
+
+            hooks (Optional[List[Callable[[RequestInfo], None]]]):
+                Functions called after each request with its
+                :class:`helixswarm.metrics.RequestInfo`, such as method, path
+                template, status, size, timings, number of retries. Hooks are
+                called synchronously, so they must be fast and must not raise,
+                :class:`helixswarm.metrics.HistogramCollector` can be used to
+                collect latency histograms.
+
+            timing (bool):
+                Measure phases of each request passed to hooks in
+                ``RequestInfo.phases`` using aiohttp tracing: `queued`, `dns`,
+                `connect` (including TLS handshake), `ttfb` and `download`,
+                and whether pooled connection was reused (default: false).
+
+            rate_limit (Optional[dict]):
+                Limit rate of requests sent to server with token bucket shared
+                by all client coroutines, disabled by default. Requests wait for
+                free tokens before they are sent, so bulk jobs run at the
+                highest allowed rate. Responses served from cache don't take
+                tokens, transport retries aren't limited.
+
+                - rate: ``float`` Tokens added to bucket per second.
+                - burst: ``float`` Bucket size, how many tokens can be taken
+                    at once after idle period (default equal to rate).
+                - weights: ``Dict[str, float]`` Tokens taken by request of
+                    endpoint, for instance ``{'reviews': 2}`` (default 1).
+
+                Example:
+
+                .. code-block:: python
+
+                    rate_limit = dict(
+                        rate=10,
+                        burst=20,
+                        weights={'activity': 2, 'version': 0}
+                    )
+
+            adaptive_concurrency (Optional[dict]):
+                Adapt number of requests in flight to server load, disabled by
+                default, use empty dict to enable it with default options.
+                Window grows while latency stays flat and shrinks on `429` and
+                `503` responses, timeouts and latency spikes, requests over it
+                wait. Current window is ``client.concurrency_limiter.limit``
+                and ``RequestInfo.concurrency_limit`` passed to hooks.
+
+                - initial: ``int`` Initial window (default 10).
+                - minimum: ``int`` Minimal window (default 1).
+                - maximum: ``int`` Maximal window (default 100).
+                - backoff: ``float`` Window multiplier on overload
+                    (default 0.5).
+                - tolerance: ``float`` Latency spike is latency bigger than
+                    average multiplied by it (default 2).
+
+            circuit_breaker (Optional[dict]):
+                Fail fast while server is down, disabled by default, use empty
+                dict to enable it with default options. After number of
+                failed requests in a row (connection errors, timeouts and
+                `5xx` responses) requests raise `SwarmCircuitOpenError`
+                without reaching server, when timeout passes one probe
+                request is let through to check if server is back. State is
+                ``client.circuit_breaker.state`` and
+                ``RequestInfo.circuit_state`` passed to hooks.
+
+                - failures: ``int`` Failed requests in a row which open
+                    breaker (default 5).
+                - reset_timeout: ``float`` Seconds before probe request
+                    (default 30).
+
+            hedge (Optional[dict]):
+                Cut tail latency of GET requests, disabled by default, use
+                empty dict to enable it with default options. If request isn't
+                answered within percentile of recent latency of its endpoint,
+                duplicate request is sent, the first response wins and the
+                other request is cancelled. Duplicate takes tokens of
+                `rate_limit` and is skipped if there are none. Number of
+                duplicates is ``client.hedge.hedged`` and
+                ``RequestInfo.hedged`` passed to hooks.
+
+                - percentile: ``float`` Percentile of latency to wait before
+                    sending duplicate (default 95).
+                - window: ``int`` Number of recent latencies of endpoint kept
+                    (default 100).
+                - min_samples: ``int`` Number of latencies needed before
+                    requests are hedged (default 20).
+                - budget: ``float`` Fraction of requests which can be hedged
+                    (default 0.05).
+
+            session_auth (bool):
+                Authenticate once by creating Swarm session and reuse its
+                cookie instead of sending user and password with each
+                request, so server doesn't check them against Perforce
+                server every time (default: false). Expired session is
+                renewed transparently, requests creating session are passed
+                to hooks as `Swarm.init_session` operation.
+
+            stream (bool):
+                Parse pages of ``iter()`` methods incrementally while they are
+                downloaded and yield items as soon as they are decoded, so
+                peak memory doesn't depend on page size (default: false).
+                Streamed pages aren't cached, revalidated, hedged or
+                prefetched and `json_loads` isn't used for them.
+
+            batch_reviews (Optional[dict]):
+                Merge ``reviews.get_info()`` calls made at the same time into
+                one ``reviews?ids[]=...`` request, disabled by default, use
+                empty dict to enable it with default options. Calls with
+                different `fields` are merged separately, missing review
+                raises `SwarmNotFoundError` as usual.
+
+                - window: ``float`` Seconds calls are collected for
+                    (default 0.005).
+                - size: ``int`` Maximal number of reviews in one request,
+                    it's sent at once when reached (default 50).
+
+        Returns:
+            SwarmAsyncClient: instance
+        """
+        super().__init__()
+
+        self.host, self.version = self._get_host_and_api_version(url)
+
+        self.session_auth = session_auth
+        self._credentials = BasicAuth(user, password)
+        self.auth = None if session_auth else self._credentials  # type: Optional[BasicAuth]
+
+        self.auth_update_callback = auth_update_callback
+        self._auth_lock = None  # type: Optional[asyncio.Lock]
+
+        if retry:
+            self.retry = self._create_retry_policy(retry)
+
+        if cache is not None:
+            self.cache = self._create_cache(cache)
+
+        if revalidate is not None:
+            self.validators = self._create_validators(revalidate)
+
+        self.connector = self._create_connector(pool or {}, ssl_context)
+
+        session_kwargs = dict(connector=self.connector)  # type: Dict[str, Any]
+
+        if timing:
+            session_kwargs['trace_configs'] = [create_trace_config()]
+
+        # session cookie is accepted from server given by IP address too
+        self.cookie_jar = CookieJar(unsafe=True)
+        session_kwargs['cookie_jar'] = self.cookie_jar
+
+        if self.retry is not None:
+            self.session = RetryClientSession(self.retry, **session_kwargs)
+        else:
+            self.session = ClientSession(**session_kwargs)
+
+        self.verify = verify
+
+        if timeout:
+            self.timeout = ClientTimeout(total=timeout)
+
+        if prefetch < 0:
+            raise SwarmError('Invalid `prefetch` argument must be >= 0')
+
+        self.prefetch = prefetch
+
+        if json_loads:
+            self.json_loads = json_loads
+
+        self.coalesce = coalesce
+        if coalesce:
+            self.coalescer = RequestCoalescer()
+        self.hooks = list(hooks or [])
+        self.timing = timing
+        self.stream = stream
+
+        if rate_limit is not None:
+            self.rate_limiter = self._create_rate_limiter(rate_limit)
+
+        if adaptive_concurrency is not None:
+            self.concurrency_limiter = self._create_concurrency_limiter(adaptive_concurrency)
+
+        if circuit_breaker is not None:
+            self.circuit_breaker = self._create_circuit_breaker(circuit_breaker)
+
+        if hedge is not None:
+            self.hedge = self._create_hedge_policy(hedge)
+
+        if batch_reviews is not None:
+            self.review_batcher = self._create_review_batcher(batch_reviews)
+
+    @classmethod
+    def _create_connector(cls,
+                          pool: dict,
+                          ssl_context: Optional[ssl.SSLContext]
+                          ) -> TCPConnector:
+        cls._validate_pool_argument(pool)
+
+        connector_kwargs = dict()  # type: Dict[str, Any]
+
+        for key, name in (('size', 'limit'),
+                          ('per_host', 'limit_per_host'),
+                          ('keepalive_timeout', 'keepalive_timeout'),
+                          ('dns_ttl', 'ttl_dns_cache')):
+            if key in pool:
+                connector_kwargs[name] = pool[key]
+
+        if ssl_context is not None:
+            connector_kwargs['ssl'] = ssl_context
+
+        return TCPConnector(**connector_kwargs)
+
+    @staticmethod
+    def _create_hedge_policy(hedge: dict) -> HedgePolicy:
+        for key in hedge:
+            if key not in ('percentile', 'window', 'min_samples', 'budget'):
+                raise SwarmError('Unknown key in hedge argument: ' + key)
+
+        policy = HedgePolicy(**hedge)
+
+        if not 0 < policy.percentile < 100:
+            raise SwarmError('Invalid `percentile` in hedge argument must be > 0 and < 100')
+
+        if not 0 < policy.min_samples <= policy.window:
+            raise SwarmError('Invalid hedge argument must be 0 < min_samples <= window')
+
+        if not 0 < policy.budget <= 1:
+            raise SwarmError('Invalid `budget` in hedge argument must be > 0 and <= 1')
+
+        return policy
+
+    def _create_review_batcher(self, batch_reviews: dict) -> ReviewBatcher:
+        for key, value in batch_reviews.items():
+            if key not in ('window', 'size'):
+                raise SwarmError('Unknown key in batch_reviews argument: ' + key)
+
+            if value <= 0:
+                raise SwarmError(
+                    'Invalid `{}` in batch_reviews argument must be > 0'.format(key)
+                )
+
+        return ReviewBatcher(self, **batch_reviews)
+
+    async def close(self) -> None:  # type: ignore
+        await self.session.close()
+
+    def get_pool_usage(self) -> dict:
+        """
+        Get connection pool usage, it helps to choose pool size.
+
+        aiohttp has no public API or trace signals for released and idle
+        connections, so they are read from connector internals of aiohttp 3
+        which is pinned by requirements. They are None if connector doesn't
+        have them.
+
+        Returns:
+            dict: pool usage, `size` and `per_host` are pool limits (0 means
+            no limit), `in_use` and `idle` are current connections.
+        """
+        acquired = getattr(self.connector, '_acquired', None)
+        conns = getattr(self.connector, '_conns', None)
+
+        return dict(
+            size=self.connector.limit,
+            per_host=self.connector.limit_per_host,
+            in_use=None if acquired is None else len(acquired),
+            idle=None if conns is None else sum(len(c) for c in conns.values()),
+        )
+
+    async def gather(self,
+                     calls: Iterable[Awaitable[Any]],
+                     *,
+                     concurrency: int = 10,
+                     ordered: bool = False
+                     ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Run endpoint calls concurrently but no more than `concurrency` at the
+        same time, so server is not overloaded by thousands of simultaneous
+        requests. Calls are taken from iterable lazily.
+
+        Example:
+
+        .. code-block:: python
+
+            calls = (client.reviews.get_info(i) for i in review_ids)
+
+            async for index, review in client.gather(calls, concurrency=20):
+                if isinstance(review, SwarmError):
+                    ...
+
+        Args:
+            calls (Iterable[Awaitable[Any]]):
+                Calls to run, for instance endpoint coroutines.
+
+            concurrency (int):
+                Maximum number of calls running at the same time (default: 10).
+
+            ordered (bool):
+                Yield results in order of calls instead of completion order,
+                completed results are kept until all previous are yielded.
+
+        Returns:
+            AsyncIterator[Tuple[int, Any]]: index of call and its result, if
+            call failed its exception is yielded instead of result, so one
+            failed call doesn't cancel others.
+        """
+        if concurrency <= 0:
+            raise SwarmError('Invalid `concurrency` argument must be > 0')
+
+        indexed_calls = enumerate(calls)
+        pending = set()  # type: Set[asyncio.Future]
+        completed = dict()  # type: Dict[int, Any]
+        next_index = 0
+
+        async def run(index: int, call: Awaitable[Any]) -> Tuple[int, Any]:
+            try:
+                return index, await call
+            except Exception as e:  # pylint: disable=broad-except
+                return index, e
+
+        def fill() -> None:
+            while len(pending) < concurrency:
+                item = next(indexed_calls, None)
+                if item is None:
+                    break
+                pending.add(asyncio.ensure_future(run(*item)))
+
+        try:
+            fill()
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+                fill()
+
+                for task in done:
+                    index, result = task.result()
+                    if ordered:
+                        completed[index] = result
+                    else:
+                        yield index, result
+
+                while next_index in completed:
+                    yield next_index, completed.pop(next_index)
+                    next_index += 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+            # avoid never awaited warnings if iteration was stopped earlier
+            for _, call in indexed_calls:
+                if asyncio.iscoroutine(call):
+                    call.close()
+
+    async def _request(self,  # type: ignore
+                       method: str,
+                       path: str,
+                       fcb: Optional[Callable] = None,
+                       *,
+                       operation: Optional[str] = None,
+                       **kwargs: Any
+                       ) -> dict:
+        is_cached, cached, fcb = self._lookup_cache(method, path, fcb, kwargs)
+        if is_cached:
+            return cached
+
+        info = self._create_request_info(method, path, operation)
+        started = time.perf_counter()
+
+        try:
+            return await self._authorized_request(method, path, fcb, kwargs, info=info)
+        except BaseException as e:
+            if info is not None:
+                info.error = e
+            raise
+        finally:
+            self._invalidate_cache(method, path)
+            if info is not None:
+                self._call_hooks(info, started)
+
+    async def _authorized_request(self,  # type: ignore
+                                  method: str,
+                                  path: str,
+                                  fcb: Optional[Callable],
+                                  kwargs: dict,
+                                  *,
+                                  info: Optional[RequestInfo] = None
+                                  ) -> dict:
+        generation = self._auth_generation
+
+        # session is opened by the first request
+        if self.session_auth and generation == 0:
+            await self._update_auth(generation)
+            generation = self._auth_generation
+
+        try:
+            return await self.request(self._callback, method, path, fcb, info=info, **kwargs)
+        except SwarmUnauthorizedError:
+            if self.auth_update_callback is None and not self.session_auth:
+                raise
+            await self._update_auth(generation)
+            if info is not None:
+                info.auth_refreshed = True
+            return await self.request(self._callback, method, path, fcb, info=info, **kwargs)
+
+    async def request(self,  # type: ignore
+                      callback: Callable,
+                      method: str,
+                      path: str,
+                      fcb: Optional[Callable] = None,
+                      *,
+                      info: Optional[RequestInfo] = None,
+                      **kwargs: Any
+                      ) -> dict:
+
+        if self.timeout and 'timeout' not in kwargs:
+            kwargs['timeout'] = self.timeout
+
+        coalescer = self.coalescer
+        if coalescer is not None and method.upper() == 'GET' and \
+                set(kwargs) <= {'params', 'timeout'}:
+            # function callback is applied by each caller separately
+            decoded_body = await coalescer.request(
+                ResponseCache.make_key(method, path, kwargs.get('params')),
+                lambda: self._send(callback, method, path, info=info, **kwargs),
+                info,
+            )
+            return fcb(decoded_body) if fcb else decoded_body
+
+        return await self._send(callback, method, path, fcb, info=info, **kwargs)
+
+    async def _send(self,
+                    callback: Callable,
+                    method: str,
+                    path: str,
+                    fcb: Optional[Callable] = None,
+                    *,
+                    info: Optional[RequestInfo] = None,
+                    **kwargs: Any
+                    ) -> Any:
+
+        key = self._add_validators(method, path, kwargs)
+        stream = kwargs.pop('stream', False)
+
+        # fails fast before waiting for limiters if server is down
+        probe = self._acquire_circuit(info)
+        status = None  # type: Optional[int]
+        failed = False
+
+        try:
+            if self.rate_limiter is not None:
+                throttled = await self.rate_limiter.acquire_async(path)
+                if info is not None:
+                    info.throttled += throttled
+
+            if info is not None and isinstance(self.session, RetryClientSession):
+                kwargs['info'] = info
+
+            if info is not None and self.timing:
+                kwargs['trace_request_ctx'] = info
+
+            limiter = self.concurrency_limiter
+            if limiter is not None:
+                await limiter.acquire_async()
+                if info is not None:
+                    info.concurrency_limit = limiter.limit
+
+            sent = time.perf_counter()
+            timed_out = False
+
+            try:
+                if self.hedge is not None and method.upper() == 'GET' and not stream:
+                    response, body = await self._hedge(method, path, info, kwargs)
+                else:
+                    response, body = await self._fetch(method, path, info, kwargs, stream=stream)
+                status = response.status
+            except Exception as e:
+                failed = True
+                # retry session wraps error of the last attempt
+                timed_out = isinstance(e, asyncio.TimeoutError) or \
+                    isinstance(e.__cause__, asyncio.TimeoutError)
+                raise
+            finally:
+                if limiter is not None:
+                    self._release_concurrency(sent, status, timed_out)
+
+        finally:
+            self._release_circuit(probe, status, failed, info)
+
+        if stream and status == HTTPStatus.OK:
+            if info is not None:
+                info.status = status
+            return _iter_chunks(response)
+
+        try:
+            return self._handle_response(
+                callback,
+                Response(response.status, body, response.headers),
+                fcb,
+                key=key,
+                info=info,
+            )
+        except ResponseEvicted:
+            self._remove_validators(kwargs)
+            for name in ('info', 'trace_request_ctx'):
+                kwargs.pop(name, None)
+            return await self._send(callback, method, path, fcb, info=info, **kwargs)
+
+    async def _fetch(self,
+                     method: str,
+                     path: str,
+                     info: Optional[RequestInfo],
+                     kwargs: dict,
+                     *,
+                     stream: bool = False
+                     ) -> Tuple[ClientResponse, bytes]:
+        # session is created with own credentials
+        kwargs.setdefault('auth', self.auth)
+
+        response = await self.session.request(
+            method,
+            '{host}/api/v{version}/{path}'.format(
+                host=self.host,
+                version=self.version,
+                path=path,
+            ),
+            ssl=self.verify,
+            **kwargs
+        )
+
+        # body is read by consumer, errors are small and read as usual
+        if stream and response.status == HTTPStatus.OK:
+            return response, b''
+
+        started = time.perf_counter()
+        body = await response.read()
+
+        if info is not None and self.timing:
+            add_phase(info, 'download', time.perf_counter() - started)
+
+        return response, body
+
+    async def _hedge(self,
+                     method: str,
+                     path: str,
+                     info: Optional[RequestInfo],
+                     kwargs: dict
+                     ) -> Tuple[ClientResponse, bytes]:
+        policy = self.hedge
+        assert policy is not None
+
+        # duplicate doesn't report retries and phases, they belong to the
+        # first request
+        hedge_kwargs = {
+            key: value for key, value in kwargs.items()
+            if key not in ('info', 'trace_request_ctx')
+        }
+
+        def fetch(duplicate: bool) -> Awaitable[Tuple[ClientResponse, bytes]]:
+            if not duplicate:
+                return self._fetch(method, path, info, kwargs)
+
+            if info is not None:
+                info.hedged = True
+            return self._fetch(method, path, None, hedge_kwargs)
+
+        # duplicate is skipped rather than delayed by rate limit, it's sent
+        # only to cut latency and mustn't make server busier than allowed
+        limiter = self.rate_limiter
+
+        return await policy.run(
+            get_path_template(path),
+            fetch,
+            None if limiter is None else lambda: limiter.try_acquire(path),
+        )
+
+    async def _paginate(self,  # type: ignore
+                        path: str,
+                        key: str,
+                        params: dict,
+                        operation: Optional[str] = None
+                        ) -> AsyncIterator[dict]:
+        if self.stream:
+            next_params = params  # type: Optional[dict]
+
+            while next_params is not None:
+                response = dict()  # type: dict
+                items = self._stream_page(path, key, next_params, response, operation=operation)
+                async for item in items:
+                    yield item
+                next_params = self._get_next_page_params(next_params, response)
+
+            return
+
+        if self.prefetch:
+            pages = self._prefetch_pages(path, key, params, operation)
+        else:
+            pages = self._fetch_pages(path, key, params, operation)
+
+        async for page in pages:
+            for item in page:
+                yield item
+
+    async def _fetch_pages(self,
+                           path: str,
+                           key: str,
+                           params: dict,
+                           operation: Optional[str]
+                           ) -> AsyncIterator[list]:
+        next_params = params  # type: Optional[dict]
+
+        while next_params is not None:
+            response = await self._request('GET', path, params=next_params, operation=operation)
+            yield self._get_page_items(response, key)
+            next_params = self._get_next_page_params(next_params, response)
+
+    async def _request_many(self,  # type: ignore
+                            method: str,
+                            path: str,
+                            params_list: List[dict],
+                            fcb: Callable[[List[dict]], Any],
+                            *,
+                            operation: Optional[str] = None
+                            ) -> Any:
+        responses = await asyncio.gather(*[
+            self._request(method, path, params=params, operation=operation)
+            for params in params_list
+        ])
+        return fcb(responses)
+
+    async def _stream_page(self,
+                           path: str,
+                           key: str,
+                           params: dict,
+                           fields: dict,
+                           *,
+                           operation: Optional[str]
+                           ) -> AsyncIterator[dict]:
+        """
+        Yields items of page as they are received, other values of response,
+        such as `lastSeen`, are stored to `fields`.
+        """
+        parser = ItemParser(key)
+
+        chunks = await self._request('GET', path, params=params, stream=True, operation=operation)
+        async for chunk in chunks:  # type: ignore
+            for item in parser.feed(chunk):
+                yield item
+
+        for item in parser.close():
+            yield item
+
+        fields.update(parser.fields)
+
+    async def _prefetch_pages(self,
+                              path: str,
+                              key: str,
+                              params: dict,
+                              operation: Optional[str]
+                              ) -> AsyncIterator[list]:
+        # next page is requested as soon as previous one arrives, so network
+        # round-trip overlaps with consumer processing, queue size limits how
+        # many pages can be fetched ahead
+        queue = asyncio.Queue(maxsize=self.prefetch)  # type: asyncio.Queue
+
+        async def producer() -> None:
+            try:
+                async for page in self._fetch_pages(path, key, params, operation):
+                    await queue.put(page)
+            except Exception as e:  # pylint: disable=broad-except
+                await queue.put(e)
+            else:
+                await queue.put(None)
+
+        task = asyncio.ensure_future(producer())
+
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            task.cancel()
+
+    async def _update_auth(self, generation: int) -> Any:
+        # lock is created in running loop, it's bound to loop before Python 3.10
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+
+        # the first caller updates credentials, the others wait for it and
+        # retry with new ones
+        async with self._auth_lock:
+            if generation != self._auth_generation:
+                return
+
+            if self.session_auth:
+                await self._open_session()
+            elif self.auth_update_callback is not None:
+                await self._update_credentials()
+
+            self._auth_generation += 1
+
+    async def _update_credentials(self) -> None:
+        assert self.auth_update_callback is not None
+
+        user, password = await self.auth_update_callback()
+        self._credentials = BasicAuth(user, password)
+
+        if not self.session_auth:
+            self.auth = self._credentials
+
+    async def _open_session(self) -> None:
+        try:
+            await self._login()
+        except SwarmUnauthorizedError:
+            if self.auth_update_callback is None:
+                raise
+            await self._update_credentials()
+            await self._login()
+
+    async def _login(self) -> None:
+        # cookie of expired session is dropped, so it doesn't get in the way
+        self.cookie_jar.clear()
+
+        info = self._create_session_info()
+        started = time.perf_counter()
+
+        try:
+            await self.request(
+                self._callback, 'POST', 'session', info=info, auth=self._credentials
+            )
+        except BaseException as e:
+            if info is not None:
+                info.error = e
+            raise
+        finally:
+            if info is not None:
+                self._call_hooks(info, started)
@@ -0,0 +1,763 @@
+import ssl
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from requests import Response as HTTPResponse
+from requests import Session
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from helixswarm.exceptions import SwarmUnauthorizedError
+from helixswarm.metrics import RequestInfo
+from helixswarm.retry import RetryPolicy
+from helixswarm.stream import STREAM_CHUNK_SIZE, ItemParser
+from helixswarm.swarm import Response, ResponseEvicted, Swarm, SwarmError
+
+
+class ConnectionTiming(threading.local):
+    """
+    Phases of request made by current thread, pooled connection is used by
+    one thread at a time, so connections report own phases here.
+    """
+    phases = None  # type: Optional[Dict[str, float]]
+    reused = True
+    headers_received = 0.0
+
+    def start(self) -> None:
+        self.phases = dict()
+        self.reused = True
+        self.headers_received = 0.0
+
+    def add(self, name: str, started: float) -> float:
+        elapsed = time.perf_counter() - started
+
+        if self.phases is not None:
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+        return elapsed
+
+    def stop(self, info: RequestInfo) -> None:
+        if self.headers_received:
+            self.add('download', self.headers_received)
+
+        info.phases = self.phases
+        info.connection_reused = self.reused
+        self.phases = None
+
+
+connection_timing = ConnectionTiming()
+
+
+class TimedHTTPConnection(HTTPConnection):
+    connect_time = 0.0
+
+    def _new_conn(self) -> Any:
+        # name resolution and TCP connect are done together by urllib3
+        started = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self.connect_time = connection_timing.add('connect', started)
+
+    def connect(self) -> None:
+        connection_timing.reused = False
+        super().connect()
+
+    def getresponse(self, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().getresponse(*args, **kwargs)
+        finally:
+            connection_timing.add('ttfb', started)
+            connection_timing.headers_received = time.perf_counter()
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):  # type: ignore
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+
+        # handshake is the rest of connect after TCP connection is made
+        connection_timing.add('tls', started + self.connect_time)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class SSLContextHTTPAdapter(HTTPAdapter):
+
+    def __init__(self,
+                 ssl_context: Optional[ssl.SSLContext] = None,
+                 timing: bool = False,
+                 **kwargs: Any
+                 ) -> None:
+        # must be set before parent constructor which creates pool manager
+        self.ssl_context = ssl_context
+        self.timing = timing
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        if self.ssl_context is not None:
+            kwargs['ssl_context'] = self.ssl_context
+
+        super().init_poolmanager(*args, **kwargs)
+
+        if self.timing:
+            self.poolmanager.pool_classes_by_scheme = {
+                'http': TimedHTTPConnectionPool,
+                'https': TimedHTTPSConnectionPool,
+            }
+
+
+def _iter_content(response: HTTPResponse) -> Iterator[bytes]:
+    # connection goes back to pool even if consumer stops iterating
+    with response:
+        yield from response.iter_content(STREAM_CHUNK_SIZE)
+
+
+class RetrySession(Session):
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        super().__init__()
+        self.policy = policy
+
+    def request(self,  # type: ignore
+                method: str,
+                url: str,
+                *args: Any,
+                info: Optional[RequestInfo] = None,
+                **kwargs: Any
+                ) -> HTTPResponse:
+        # other arguments of Session.request are passed as is
+        started = time.monotonic()
+        retry = 0
+
+        while True:
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (RequestsConnectionError, Timeout) as e:
+                delay = self.policy.get_delay(method, retry, started)
+                if delay is None:
+                    raise SwarmError from e
+            else:
+                delay = self.policy.get_delay(
+                    method, retry, started, status=response.status_code, headers=response.headers
+                )
+                if delay is None:
+                    return response
+
+                # connection goes back to pool instead of being held
+                response.close()
+
+            retry += 1
+            if info is not None:
+                info.retries = retry
+
+            time.sleep(delay)
+
+
+class SwarmClient(Swarm):
+
+    auth_update_callback = None
+    timing = False
+
+    def __init__(self,
+                 url: str,
+                 user: str,
+                 password: str,
+                 *,
+                 verify: bool = True,
+                 timeout: Optional[float] = None,
+                 retry: Optional[dict] = None,
+                 auth_update_callback: Optional[Callable[[], Tuple[str, str]]] = None,
+                 json_loads: Optional[Callable[[bytes], Any]] = None,
+                 pool: Optional[dict] = None,
+                 ssl_context: Optional[ssl.SSLContext] = None,
+                 cache: Optional[dict] = None,
+                 revalidate: Optional[dict] = None,
+                 hooks: Optional[List[Callable[[RequestInfo], None]]] = None,
+                 timing: bool = False,
+                 rate_limit: Optional[dict] = None,
+                 adaptive_concurrency: Optional[dict] = None,
+                 circuit_breaker: Optional[dict] = None,
+                 session_auth: bool = False,
+                 stream: bool = False
+                 ) -> None:
+        """
+        Swarm client class.
+
+        Args:
+            url (str):
+                URL of Swarm server, must include API version.
+
+            user (str):
+                User name.
+
+            password (str):
+                Password for user.
+
+            verify (Optional[bool])
+                Verify SSL (default: true).
+
+            timeout (Optional[float]):
+                HTTP request timeout.
+
+            retry (Optional[dict]):
+                Retry options to prevent failures if server restarting or
+                temporary network problem. Disabled by default use total > 0 to
+                enable. Sleep before each retry is random from zero to
+                ``factor * 2 ** retry`` seconds limited by ``max_sleep``, so
+                many clients don't retry at the same moment, `Retry-After`
+                header of response is used instead if server sends it.
+
+                - total: ``int`` Total retries count.
+                - factor: ``float`` Sleep factor between retries (default 1).
+                - statuses: ``List[int]`` HTTP statues retries on. (default [])
+                - methods: ``List[str]`` list of HTTP methods to retry, idempotent
+                    methods are used by default.
+                - max_sleep: ``float`` Maximal sleep between retries, retry
+                    isn't made if `Retry-After` is bigger (default 60).
+                - deadline: ``float`` Seconds since first attempt after which
+                    retries aren't made (default no limit).
+
+                Example:
+
+                .. code-block:: python
+
+                    retry = dict(
+                        total=10,
+                        factor=1,
+                        statuses=[500, 503],
+                        deadline=120
+                    )
+
+            auth_update_callback (Optional[Callable[[], Tuple[str, str]]])
+                Callback function which will be called on SwarmUnauthorizedError
+                to update user and password and retry request again.
+
+            json_loads (Optional[Callable[[bytes], Any]])
+                Function used to decode JSON responses, it gets raw response
+                body bytes, for instance ``orjson.loads`` or ``ujson.loads`` may
+                be used for big responses (default: ``json.loads``).
+
+            pool (Optional[dict]):
+                Connection pool options, connections are kept alive and reused
+                between requests, pool should be big enough for all threads
+                using client simultaneously otherwise extra connections are
+                discarded after each request.
+
+                - size: ``int`` Maximum number of connections kept in pool
+                    (default 10).
+                - per_host: ``int`` Same as ``size``, takes precedence over it,
+                    client works with single host.
+                - keepalive_timeout: ``float`` Accepted for compatibility with
+                    async client and ignored, idle connections are kept until
+                    server closes them.
+                - dns_ttl: ``int`` Accepted for compatibility with async client
+                    and ignored.
+
+                Example:
+
+                .. code-block:: python
+
+                    pool = dict(
+                        size=32
+                    )
+
+            ssl_context (Optional[ssl.SSLContext])
+                SSL context shared by all pooled connections, for instance with
+                custom CA certificates loaded once.
+
+            cache (Optional[dict]):
+                Cache of GET responses for rarely changed data, disabled by
+                default, use empty dict to enable it with default options. Any
+                non GET request made by client drops cached responses of the
+                same endpoint. Cache hits and misses are counted in
+                ``client.cache.hits`` and ``client.cache.misses``.
+
+                - size: ``int`` Maximum number of cached responses, least
+                    recently used are evicted (default 1024).
+                - ttl: ``Dict[str, float]`` Seconds to keep responses of each
+                    endpoint, endpoints which are not listed aren't cached.
+                    (default 60 seconds for `groups`, `projects`, `servers`,
+                    `users`, `version` and `workflows`)
+
+                Example:
+
+                .. code-block:: python
+
+                    cache = dict(
+                        size=256,
+                        ttl={'projects': 300, 'version': 3600}
+                    )
+
+            revalidate (Optional[dict]):
+                Revalidate GET responses using `ETag` and `Last-Modified`
+                validators, disabled by default, use empty dict to enable it with
+                default options. When server answers `304 Not Modified` stored
+                response body is decoded instead of downloading it again,
+                number of such responses is counted in
+                ``client.validators.revalidated``.
+
+                - size: ``int`` Maximum number of stored responses, least
+                    recently used are evicted (default 1024).
+
+            hooks (Optional[List[Callable[[RequestInfo], None]]]):
+                Functions called after each request with its
+                :class:`helixswarm.metrics.RequestInfo`, such as method, path
+                template, status, size, timings, number of retries. Hooks are
+                called synchronously, so they must be fast and must not raise,
+                :class:`helixswarm.metrics.HistogramCollector` can be used to
+                collect latency histograms.
+
+            timing (bool):
+                Measure phases of each request passed to hooks in
+                ``RequestInfo.phases``: `connect` (name resolution and TCP
+                connect together), `tls`, `ttfb` and `download`, and whether
+                pooled connection was reused (default: false).
+
+            rate_limit (Optional[dict]):
+                Limit rate of requests sent to server with token bucket shared
+                by all client threads, disabled by default. Requests wait for
+                free tokens before they are sent, so bulk jobs run at the
+                highest allowed rate. Responses served from cache don't take
+                tokens, transport retries aren't limited.
+
+                - rate: ``float`` Tokens added to bucket per second.
+                - burst: ``float`` Bucket size, how many tokens can be taken
+                    at once after idle period (default equal to rate).
+                - weights: ``Dict[str, float]`` Tokens taken by request of
+                    endpoint, for instance ``{'reviews': 2}`` (default 1).
+
+                Example:
+
+                .. code-block:: python
+
+                    rate_limit = dict(
+                        rate=10,
+                        burst=20,
+                        weights={'activity': 2, 'version': 0}
+                    )
+
+            adaptive_concurrency (Optional[dict]):
+                Adapt number of requests in flight to server load, disabled by
+                default, use empty dict to enable it with default options.
+                Window grows while latency stays flat and shrinks on `429` and
+                `503` responses, timeouts and latency spikes, requests over it
+                wait. Current window is ``client.concurrency_limiter.limit``
+                and ``RequestInfo.concurrency_limit`` passed to hooks.
+
+                - initial: ``int`` Initial window (default 10).
+                - minimum: ``int`` Minimal window (default 1).
+                - maximum: ``int`` Maximal window (default 100).
+                - backoff: ``float`` Window multiplier on overload
+                    (default 0.5).
+                - tolerance: ``float`` Latency spike is latency bigger than
+                    average multiplied by it (default 2).
+
+            circuit_breaker (Optional[dict]):
+                Fail fast while server is down, disabled by default, use empty
+                dict to enable it with default options. After number of
+                failed requests in a row (connection errors, timeouts and
+                `5xx` responses) requests raise `SwarmCircuitOpenError`
+                without reaching server, when timeout passes one probe
+                request is let through to check if server is back. State is
+                ``client.circuit_breaker.state`` and
+                ``RequestInfo.circuit_state`` passed to hooks.
+
+                - failures: ``int`` Failed requests in a row which open
+                    breaker (default 5).
+                - reset_timeout: ``float`` Seconds before probe request
+                    (default 30).
+
+            session_auth (bool):
+                Authenticate once by creating Swarm session and reuse its
+                cookie instead of sending user and password with each
+                request, so server doesn't check them against Perforce
+                server every time (default: false). Expired session is
+                renewed transparently, requests creating session are passed
+                to hooks as `Swarm.init_session` operation.
+
+            stream (bool):
+                Parse pages of ``iter()`` methods incrementally while they are
+                downloaded and yield items as soon as they are decoded, so
+                peak memory doesn't depend on page size (default: false).
+                Streamed pages aren't cached or revalidated and `json_loads`
+                isn't used for them.
+
+        Returns:
+            SwarmClient: class instance.
+        """
+        super().__init__()
+
+        self.host, self.version = self._get_host_and_api_version(url)
+
+        if retry:
+            self.retry = self._create_retry_policy(retry)
+            self.session = RetrySession(self.retry)  # type: Session
+        else:
+            self.session = Session()
+
+        self.timeout = timeout
+        self.verify = verify
+
+        self.session_auth = session_auth
+        self._credentials = (user, password)
+        if not session_auth:
+            self.session.auth = self._credentials
+
+        self.auth_update_callback = auth_update_callback
+        self._auth_lock = threading.Lock()
+
+        if json_loads:
+            self.json_loads = json_loads
+
+        if cache is not None:
+            self.cache = self._create_cache(cache)
+
+        if revalidate is not None:
+            self.validators = self._create_validators(revalidate)
+
+        self.hooks = list(hooks or [])
+        self.timing = timing
+        self.stream = stream
+
+        if rate_limit is not None:
+            self.rate_limiter = self._create_rate_limiter(rate_limit)
+
+        if adaptive_concurrency is not None:
+            self.concurrency_limiter = self._create_concurrency_limiter(adaptive_concurrency)
+
+        if circuit_breaker is not None:
+            self.circuit_breaker = self._create_circuit_breaker(circuit_breaker)
+
+        adapter_kwargs = dict()  # type: Dict[str, Any]
+
+        pool = pool or {}
+        self._validate_pool_argument(pool)
+        self.pool_size = pool.get('per_host', pool.get('size', DEFAULT_POOLSIZE))
+        adapter_kwargs['pool_maxsize'] = self.pool_size
+
+        adapter = SSLContextHTTPAdapter(
+            ssl_context=ssl_context,
+            timing=timing,
+            **adapter_kwargs
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def get_pool_usage(self) -> dict:
+        """
+        Get connection pool usage, it helps to choose pool size, many opened
+        connections comparing with requests count means that connections are
+        not reused.
+
+        Returns:
+            dict: pool usage, `size` and `per_host` are maximum connections
+            kept per host, `in_use` and `idle` are current connections,
+            `connections` and `requests` are total numbers of opened
+            connections and requests made.
+        """
+        usage = dict(
+            size=self.pool_size,
+            per_host=self.pool_size,
+            in_use=0,
+            idle=0,
+            connections=0,
+            requests=0,
+        )
+
+        for adapter in set(self.session.adapters.values()):
+            manager = getattr(adapter, 'poolmanager', None)
+            if manager is None:
+                continue
+
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+
+                # empty slots of pool queue are filled with None
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+                usage['idle'] += idle
+                usage['in_use'] += pool.pool.maxsize - pool.pool.qsize()
+                usage['connections'] += pool.num_connections
+                usage['requests'] += pool.num_requests
+
+        return usage
+
+    def map(self,
+            fn: Callable[[Any], Any],
+            iterable: Iterable[Any],
+            *,
+            max_workers: Optional[int] = None
+            ) -> List[Any]:
+        """
+        Call endpoint function for each item concurrently using thread pool,
+        for instance get many reviews at once.
+
+        Example:
+
+        .. code-block:: python
+
+            client = SwarmClient(url, user, password, pool=dict(size=16))
+            reviews = client.map(client.reviews.get_info, review_ids)
+
+            for review in reviews:
+                if isinstance(review, SwarmError):
+                    ...
+
+        Args:
+            fn (Callable[[Any], Any]):
+                Function called with each item, usually bound endpoint method.
+
+            iterable (Iterable[Any]):
+                Items to call function with.
+
+            max_workers (Optional[int]):
+                Number of threads, can't be bigger than connection pool size
+                (default: connection pool size). With `adaptive_concurrency`
+                enabled requests of threads over current window wait.
+
+        Returns:
+            List[Any]: results in the same order as items, if call failed
+            its exception is placed instead of result, so one failed item
+            doesn't break others.
+        """
+        if max_workers is None:
+            max_workers = self.pool_size
+
+        if max_workers <= 0:
+            raise SwarmError('Invalid `max_workers` argument must be > 0')
+
+        if max_workers > self.pool_size:
+            raise SwarmError(
+                'max_workers ({}) exceeds connection pool size ({}), '
+                'increase it using `pool` argument'.format(max_workers, self.pool_size)
+            )
+
+        def call(item: Any) -> Any:
+            try:
+                return fn(item)
+            except Exception as e:  # pylint: disable=broad-except
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(call, iterable))
+
+    def request(self,
+                callback: Callable,
+                method: str,
+                path: str,
+                fcb: Optional[Callable] = None,
+                *,
+                info: Optional[RequestInfo] = None,
+                **kwargs: Any
+                ) -> dict:
+
+        if self.timeout and 'timeout' not in kwargs:
+            kwargs['timeout'] = self.timeout
+
+        key = self._add_validators(method, path, kwargs)
+
+        # fails fast before waiting for limiters if server is down
+        probe = self._acquire_circuit(info)
+        status = None  # type: Optional[int]
+        failed = False
+
+        try:
+            if self.rate_limiter is not None:
+                throttled = self.rate_limiter.acquire(path)
+                if info is not None:
+                    info.throttled += throttled
+
+            limiter = self.concurrency_limiter
+            if limiter is not None:
+                limiter.acquire()
+                if info is not None:
+                    info.concurrency_limit = limiter.limit
+
+            if info is not None and self.retry is not None:
+                kwargs['info'] = info
+
+            timing = self.timing and info is not None
+            if timing:
+                connection_timing.start()
+
+            sent = time.perf_counter()
+            timed_out = False
+
+            try:
+                response = self.session.request(
+                    method,
+                    '{host}/api/v{version}/{path}'.format(
+                        host=self.host,
+                        version=self.version,
+                        path=path,
+                    ),
+                    verify=self.verify,
+                    **kwargs
+                )
+                status = response.status_code
+            except Exception as e:
+                failed = True
+                # retry session wraps error of the last attempt
+                timed_out = isinstance(e, Timeout) or isinstance(e.__cause__, Timeout)
+                raise
+            finally:
+                if timing:
+                    connection_timing.stop(info)  # type: ignore
+                if limiter is not None:
+                    self._release_concurrency(sent, status, timed_out)
+        finally:
+            self._release_circuit(probe, status, failed, info)
+
+        # errors are small, they are decoded as usual
+        if kwargs.get('stream') and status == HTTPStatus.OK:
+            if info is not None:
+                info.status = status
+            return _iter_content(response)  # type: ignore
+
+        try:
+            return self._handle_response(
+                callback,
+                Response(response.status_code, response.content, response.headers),
+                fcb,
+                key=key,
+                info=info,
+            )
+        except ResponseEvicted:
+            self._remove_validators(kwargs)
+            kwargs.pop('info', None)
+            return self.request(callback, method, path, fcb, info=info, **kwargs)
+
+    def _paginate(self,
+                  path: str,
+                  key: str,
+                  params: dict,
+                  operation: Optional[str] = None
+                  ) -> Iterator[dict]:
+        next_params = params  # type: Optional[dict]
+
+        while next_params is not None:
+            if self.stream:
+                response = dict()  # type: dict
+                yield from self._stream_page(path, key, next_params, response, operation=operation)
+            else:
+                response = self._request('GET', path, params=next_params, operation=operation)
+                yield from self._get_page_items(response, key)
+
+            next_params = self._get_next_page_params(next_params, response)
+
+    def _request_many(self,
+                      method: str,
+                      path: str,
+                      params_list: List[dict],
+                      fcb: Callable[[List[dict]], Any],
+                      *,
+                      operation: Optional[str] = None
+                      ) -> Any:
+        def _request_params(params: dict) -> dict:
+            return self._request(method, path, params=params, operation=operation)
+
+        responses = self.map(_request_params, params_list)
+
+        for response in responses:
+            if isinstance(response, Exception):
+                raise response
+
+        return fcb(responses)
+
+    def _stream_page(self,
+                     path: str,
+                     key: str,
+                     params: dict,
+                     fields: dict,
+                     *,
+                     operation: Optional[str] = None
+                     ) -> Iterator[dict]:
+        """
+        Yields items of page as they are received, other values of response,
+        such as `lastSeen`, are stored to `fields`.
+        """
+        parser = ItemParser(key)
+
+        for chunk in self._request('GET', path, params=params, stream=True, operation=operation):
+            yield from parser.feed(chunk)
+
+        yield from parser.close()
+        fields.update(parser.fields)
+
+    def _update_auth(self, generation: int) -> None:
+        # the first caller updates credentials, the others wait for it and
+        # retry with new ones
+        with self._auth_lock:
+            if generation != self._auth_generation:
+                return
+
+            if self.session_auth:
+                self._open_session()
+            elif self.auth_update_callback is not None:
+                self._update_credentials()
+
+            self._auth_generation += 1
+
+    def _update_credentials(self) -> None:
+        assert self.auth_update_callback is not None
+
+        user, password = self.auth_update_callback()
+        self._credentials = (user, password)
+
+        if not self.session_auth:
+            self.session.auth = self._credentials
+
+    def _open_session(self) -> None:
+        try:
+            self._login()
+        except SwarmUnauthorizedError:
+            if self.auth_update_callback is None:
+                raise
+            self._update_credentials()
+            self._login()
+
+    def _login(self) -> None:
+        # cookie of expired session is dropped, so it doesn't get in the way
+        self.session.cookies.clear()
+
+        info = self._create_session_info()
+        started = time.perf_counter()
+
+        try:
+            self.request(self._callback, 'POST', 'session', info=info, auth=self._credentials)
+        except BaseException as e:
+            if info is not None:
+                info.error = e
+            raise
+        finally:
+            if info is not None:
+                self._call_hooks(info, started)
@@ -0,0 +1,118 @@
+import time
+
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession, TraceConfig
+
+from helixswarm.metrics import RequestInfo
+
+# phases of async client requests are measured by aiohttp trace signals,
+# their session and params arguments aren't used
+
+
+def add_phase(info: RequestInfo, name: str, elapsed: float) -> None:
+    if info.phases is None:
+        info.phases = dict()
+
+    info.phases[name] = info.phases.get(name, 0.0) + elapsed
+
+
+async def _on_request_start(_session: ClientSession,
+                            context: SimpleNamespace,
+                            _params: Any
+                            ) -> None:
+    context.started = context.connected = time.perf_counter()
+    context.dns = 0.0
+
+
+async def _on_connection_queued_start(_session: ClientSession,
+                                      context: SimpleNamespace,
+                                      _params: Any
+                                      ) -> None:
+    context.queued = time.perf_counter()
+
+
+async def _on_connection_queued_end(_session: ClientSession,
+                                    context: SimpleNamespace,
+                                    _params: Any
+                                    ) -> None:
+    if context.trace_request_ctx is not None:
+        add_phase(context.trace_request_ctx, 'queued', time.perf_counter() - context.queued)
+
+
+async def _on_dns_resolvehost_start(_session: ClientSession,
+                                    context: SimpleNamespace,
+                                    _params: Any
+                                    ) -> None:
+    context.resolving = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(_session: ClientSession,
+                                  context: SimpleNamespace,
+                                  _params: Any
+                                  ) -> None:
+    context.dns = time.perf_counter() - context.resolving
+
+    if context.trace_request_ctx is not None:
+        add_phase(context.trace_request_ctx, 'dns', context.dns)
+
+
+async def _on_connection_create_start(_session: ClientSession,
+                                      context: SimpleNamespace,
+                                      _params: Any
+                                      ) -> None:
+    context.connecting = time.perf_counter()
+
+
+async def _on_connection_create_end(_session: ClientSession,
+                                    context: SimpleNamespace,
+                                    _params: Any
+                                    ) -> None:
+    context.connected = time.perf_counter()
+
+    info = context.trace_request_ctx
+    if info is not None:
+        # aiohttp has no separate TLS handshake signal, it's part of connect
+        add_phase(info, 'connect', context.connected - context.connecting - context.dns)
+        info.connection_reused = False
+
+
+async def _on_connection_reuseconn(_session: ClientSession,
+                                   context: SimpleNamespace,
+                                   _params: Any
+                                   ) -> None:
+    context.connected = time.perf_counter()
+
+    info = context.trace_request_ctx
+    if info is not None and info.connection_reused is None:
+        info.connection_reused = True
+
+
+async def _on_request_end(_session: ClientSession,
+                          context: SimpleNamespace,
+                          _params: Any
+                          ) -> None:
+    if context.trace_request_ctx is not None:
+        add_phase(context.trace_request_ctx, 'ttfb', time.perf_counter() - context.connected)
+
+
+def create_trace_config() -> TraceConfig:
+    """
+    Create trace config measuring phases of requests which have
+    :class:`helixswarm.metrics.RequestInfo` as `trace_request_ctx`.
+    """
+    # signals are typed differently across aiohttp versions
+    trace_config = TraceConfig()  # type: Any
+
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_connection_queued_start.append(_on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(_on_connection_queued_end)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_request_end.append(_on_request_end)
+
+    return trace_config
@@ -0,0 +1,106 @@
+import threading
+import time
+
+from typing import Optional
+
+from helixswarm.exceptions import SwarmCircuitOpenError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker around Swarm transport. After `failures` failed requests
+    in a row (connection errors, timeouts and `5xx` responses) it opens and
+    requests fail fast with `SwarmCircuitOpenError` without reaching the
+    server. When `reset_timeout` seconds pass it half-opens and lets one
+    probe request through, success of the probe closes it, failure opens it
+    again.
+
+    Breaker is shared by threads of sync client and by coroutines of async
+    client, but not by both at the same time.
+
+    Attributes:
+        state (str): `closed`, `open` or `half_open`.
+        trips (int): number of times breaker was opened.
+    """
+
+    def __init__(self, *, failures: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failures = failures
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.trips = 0
+
+        self._failed = 0
+        self._opened = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str:
+        """
+        Check whether request can be sent.
+
+        Returns:
+            str: breaker state request is sent in.
+
+        Raises:
+            SwarmCircuitOpenError: if breaker is open or probe request is
+            already in flight.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                remaining = self._opened + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise SwarmCircuitOpenError(
+                        'Circuit breaker is open, retry in {:.1f} seconds'.format(remaining)
+                    )
+
+                self.state = HALF_OPEN
+
+            if self.state == HALF_OPEN:
+                if self._probing:
+                    raise SwarmCircuitOpenError('Circuit breaker is half-open, probe is in flight')
+
+                self._probing = True
+
+            return self.state
+
+    def release(self, success: Optional[bool], probe: bool = False) -> str:
+        """
+        Record result of request sent after `acquire()`.
+
+        Args:
+            success (Optional[bool]):
+                Whether server handled request, None if request was
+                cancelled before result was known, then nothing is counted.
+
+            probe (bool):
+                Whether request was sent as probe, `acquire()` returned
+                `half_open`.
+
+        Returns:
+            str: breaker state after request.
+        """
+        with self._lock:
+            if probe:
+                self._probing = False
+
+            if success is None:
+                return self.state
+
+            if success:
+                self._failed = 0
+                # requests sent before breaker opened can't close it
+                if probe:
+                    self.state = CLOSED
+                return self.state
+
+            self._failed += 1
+            if probe or (self.state == CLOSED and self._failed >= self.failures):
+                self.state = OPEN
+                self._opened = time.monotonic()
+                self.trips += 1
+
+            return self.state
@@ -0,0 +1,80 @@
+import asyncio
+import copy
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from helixswarm.metrics import RequestInfo
+
+
+class RequestCoalescer:
+    """
+    Merges identical requests of async client made while the first one is
+    in flight, they wait for its decoded response instead of making own
+    request.
+
+    The first caller gets response itself, the others get copies made
+    before any caller is resumed, so caller changing its response doesn't
+    affect the others.
+    """
+
+    def __init__(self) -> None:
+        # key -> [task, number of callers, info of the first caller, copies]
+        self._in_flight = dict()  # type: Dict[Hashable, list]
+
+    async def request(self,
+                      key: Hashable,
+                      send: Callable[[], Awaitable[Any]],
+                      info: Optional[RequestInfo] = None
+                      ) -> Any:
+        """
+        Make request by calling `send` unless identical one is in flight.
+
+        Args:
+            key (Hashable):
+                Identity of request, for instance method, path and params.
+
+            send (Callable[[], Awaitable[Any]]):
+                Function making request and returning decoded response.
+
+            info (Optional[RequestInfo]):
+                Info of caller passed to hooks, joined callers get status and
+                size of the first request.
+
+        Returns:
+            Any: decoded response.
+        """
+        in_flight = self._in_flight.get(key)
+        is_leader = in_flight is None
+        if in_flight is None:
+            task = asyncio.ensure_future(send())
+            in_flight = self._in_flight[key] = [task, 0, info, []]
+            task.add_done_callback(self._get_done_callback(key))
+        elif info is not None:
+            info.coalesced = True
+
+        in_flight[1] += 1
+        try:
+            decoded_body = await asyncio.shield(in_flight[0])
+        finally:
+            leader = in_flight[2]
+            if info is not None and leader is not None and leader is not info:
+                info.status = leader.status
+                info.bytes_received = leader.bytes_received
+
+        if is_leader:
+            return decoded_body
+
+        return in_flight[3].pop()
+
+    def _get_done_callback(self, key: Hashable) -> Callable[[asyncio.Future], None]:
+        def done(task: asyncio.Future) -> None:
+            in_flight = self._in_flight.pop(key)
+
+            # mark exception as retrieved, if all callers were cancelled
+            if task.cancelled() or task.exception() is not None:
+                return
+
+            # runs before waiting callers are resumed
+            in_flight[3] = [copy.deepcopy(task.result()) for _ in range(in_flight[1] - 1)]
+
+        return done
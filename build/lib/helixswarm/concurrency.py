@@ -0,0 +1,144 @@
+import threading
+import time
+
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Optional
+
+if TYPE_CHECKING:
+    from asyncio import Future
+
+# statuses meaning that server is overloaded
+OVERLOAD_STATUSES = frozenset([429, 503])
+
+# weight of new latency sample in moving average
+LATENCY_SMOOTHING = 0.1
+
+
+class ConcurrencyLimiter:
+    """
+    Adaptive limit of requests in flight using AIMD (additive increase,
+    multiplicative decrease). While window is fully used and latency stays
+    flat it grows by one request per window of successful requests, on
+    `429`/`503` responses, timeouts or latency spikes it's multiplied by
+    `backoff`, at most once per average round trip, so requests sent with
+    old window don't shrink it several times.
+
+    Limiter is shared by threads of sync client and by coroutines of async
+    client, but not by both at the same time.
+
+    Attributes:
+        in_flight (int): number of requests currently sent.
+        decreases (int): number of times window was decreased.
+    """
+
+    def __init__(self,
+                 *,
+                 initial: int = 10,
+                 minimum: int = 1,
+                 maximum: int = 100,
+                 backoff: float = 0.5,
+                 tolerance: float = 2.0
+                 ) -> None:
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.in_flight = 0
+        self.decreases = 0
+
+        self._window = float(initial)
+        self._latency = None  # type: Optional[float]
+        self._decreased = 0.0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters = deque()  # type: Deque[Future]
+
+    @property
+    def limit(self) -> int:
+        """
+        Current window, maximum number of requests in flight.
+        """
+        return max(self.minimum, min(self.maximum, int(self._window)))
+
+    def acquire(self) -> None:
+        """
+        Wait until request can be sent.
+        """
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+
+            self.in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """
+        Wait until request can be sent without blocking event loop, waiting
+        requests are sent in order of arrival.
+        """
+        # only async client needs asyncio, sync one doesn't pay for its import
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        with self._lock:
+            if self.in_flight < self.limit and not self._waiters:
+                self.in_flight += 1
+                return
+
+            waiter = asyncio.get_event_loop().create_future()
+            self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    # slot was already given to this request
+                    self.in_flight -= 1
+                    self._wake()
+            raise
+
+    def release(self, elapsed: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Mark request as done and adjust window.
+
+        Args:
+            elapsed (Optional[float]):
+                Seconds request took, None if request failed for reason not
+                related to server load, then window isn't changed.
+
+            overloaded (bool):
+                Whether server is overloaded, for instance request timed out.
+        """
+        with self._condition:
+            if elapsed is not None:
+                self._update(elapsed, overloaded)
+
+            self.in_flight -= 1
+            self._wake()
+
+    def _update(self, elapsed: float, overloaded: bool) -> None:
+        if self._latency is None:
+            self._latency = elapsed
+
+        if overloaded or elapsed > self.tolerance * self._latency:
+            now = time.monotonic()
+            if now - self._decreased >= self._latency:
+                self._window = max(self.minimum, self._window * self.backoff)
+                self._decreased = now
+                self.decreases += 1
+        elif self.in_flight >= self.limit:
+            # grow only if window is really used
+            self._window = min(self.maximum, self._window + 1 / self._window)
+
+        self._latency += LATENCY_SMOOTHING * (elapsed - self._latency)
+
+    def _wake(self) -> None:
+        self._condition.notify(max(0, self.limit - self.in_flight))
+
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
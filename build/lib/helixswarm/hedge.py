@@ -0,0 +1,139 @@
+import asyncio
+import time
+
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+# maximum number of hedged requests which can be sent in a row
+MAX_TOKENS = 10.0
+
+
+class HedgePolicy:
+    """
+    Hedging of idempotent GET requests of async client. If request isn't
+    answered within `percentile` of recent latency of its endpoint, such as
+    `reviews/{id}`, duplicate request is sent, the first response wins and
+    the other request is cancelled.
+
+    Number of duplicates is limited by `budget`, fraction of requests which
+    can be hedged, so slow server doesn't get twice as many requests.
+    Requests aren't hedged until `min_samples` latencies of endpoint are
+    known.
+
+    Attributes:
+        hedged (int): number of duplicate requests sent.
+        won (int): number of times duplicate answered first.
+    """
+
+    def __init__(self,
+                 *,
+                 percentile: float = 95,
+                 window: int = 100,
+                 min_samples: int = 20,
+                 budget: float = 0.05
+                 ) -> None:
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.budget = budget
+        self.hedged = 0
+        self.won = 0
+
+        self._latencies = dict()  # type: Dict[str, Deque[float]]
+        self._tokens = 1.0
+
+    def get_delay(self, endpoint: str) -> Optional[float]:
+        """
+        Get seconds to wait before sending duplicate request, every request
+        also earns `budget` of duplicate.
+
+        Args:
+            endpoint (str):
+                Path template, for instance `reviews/{id}`.
+
+        Returns:
+            Optional[float]: seconds, None if there are not enough samples.
+        """
+        self._tokens = min(MAX_TOKENS, self._tokens + self.budget)
+
+        latencies = self._latencies.get(endpoint)
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+
+        return ordered[index]
+
+    def acquire(self) -> bool:
+        """
+        Check budget and take one duplicate request from it.
+        """
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        self.hedged += 1
+        return True
+
+    def record(self, endpoint: str, elapsed: float) -> None:
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+
+        latencies.append(elapsed)
+
+    async def run(self,
+                  endpoint: str,
+                  fetch: Callable[[bool], Awaitable[Any]],
+                  allow: Optional[Callable[[], bool]] = None
+                  ) -> Any:
+        """
+        Make request and its duplicate if request isn't answered in time.
+
+        Args:
+            endpoint (str):
+                Path template, for instance `reviews/{id}`.
+
+            fetch (Callable[[bool], Awaitable[Any]]):
+                Function making request, its argument is True for duplicate.
+
+            allow (Optional[Callable[[], bool]]):
+                Function called when budget allows duplicate, it's not sent
+                if False is returned.
+
+        Returns:
+            Any: the first successful result, error of the first request is
+            raised if all requests failed.
+        """
+        delay = self.get_delay(endpoint)
+
+        first = asyncio.ensure_future(fetch(False))
+        tasks = [first]
+        started = [time.perf_counter()]
+
+        try:
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+
+                if not first.done() and self._tokens >= 1 and (allow is None or allow()):
+                    self.acquire()
+                    tasks.append(asyncio.ensure_future(fetch(True)))
+                    started.append(time.perf_counter())
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for index, task in enumerate(tasks):
+                    if task in done and task.exception() is None:
+                        self.record(endpoint, time.perf_counter() - started[index])
+                        if index:
+                            self.won += 1
+                        return task.result()
+
+            return first.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -0,0 +1,223 @@
+import bisect
+import threading
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# paths which second part is not an identifier
+STATIC_PATHS = {
+    'dashboards/action',
+    'login/saml',
+    'reviews/archive',
+}
+
+# seconds, upper bounds of latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0
+)
+
+
+def get_path_template(path: str) -> str:
+    """
+    Get path template with identifiers replaced, so requests of the same
+    endpoint can be grouped together, for instance `reviews/{id}/vote` for
+    `reviews/1234/vote`.
+    """
+    parts = path.strip('/').split('/')
+
+    if len(parts) > 1 and '/'.join(parts[:2]) not in STATIC_PATHS:
+        parts[1] = '{id}'
+
+    return '/'.join(parts)
+
+
+@dataclass
+class RequestInfo:
+    """
+    Information about request passed to client hooks after request is done.
+
+    Attributes:
+        method (str): HTTP method.
+        path (str): requested path, for instance `reviews/1234`.
+        endpoint (str): path template, for instance `reviews/{id}`.
+        status (Optional[int]): HTTP status of response, None if no response.
+        bytes_received (int): size of response body.
+        elapsed (float): seconds spent on the whole request including
+            retries and authentication update.
+        decode_time (float): seconds spent decoding and processing body.
+        retries (int): number of retries made.
+        auth_refreshed (bool): whether credentials were updated using
+            `auth_update_callback` and request was repeated.
+        coalesced (bool): whether response of identical in-flight request was
+            used instead of making own request.
+        error (Optional[BaseException]): exception raised by request if any.
+        operation (Optional[str]): endpoint class and method which made
+            request, for instance `Reviews.get_info`, None if unknown.
+        phases (Optional[Dict[str, float]]): seconds spent in each phase of
+            request if client `timing` is enabled, only phases which really
+            happened are present: `queued` waiting for free connection,
+            `dns`, `connect`, `tls`, `ttfb` from sending request till
+            response headers and `download` of response body.
+        connection_reused (Optional[bool]): whether request was sent using
+            pooled connection, None if client `timing` is disabled.
+        throttled (float): seconds waited for client rate limiter.
+        concurrency_limit (Optional[int]): adaptive concurrency window when
+            request was sent, None if it's disabled.
+        circuit_state (Optional[str]): circuit breaker state after request,
+            `closed`, `open` or `half_open`, None if it's disabled.
+        hedged (bool): whether duplicate request was sent because the first
+            one was slow.
+    """
+    method: str
+    path: str
+    endpoint: str
+    status: Optional[int] = None
+    bytes_received: int = 0
+    elapsed: float = 0.0
+    decode_time: float = 0.0
+    retries: int = 0
+    auth_refreshed: bool = False
+    coalesced: bool = False
+    error: Optional[BaseException] = None
+    operation: Optional[str] = None
+    phases: Optional[Dict[str, float]] = None
+    connection_reused: Optional[bool] = None
+    throttled: float = 0.0
+    concurrency_limit: Optional[int] = None
+    circuit_state: Optional[str] = None
+    hedged: bool = False
+
+
+class EndpointStats:
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.errors = 0
+        self.statuses = dict()  # type: Dict[Optional[int], int]
+        self.elapsed_sum = 0.0
+        self.elapsed_max = 0.0
+        self.decode_time_sum = 0.0
+        self.bytes_received_sum = 0
+        self.retries_sum = 0
+        self.auth_refreshes = 0
+        self.new_connections = 0
+
+    def add(self, info: RequestInfo) -> None:
+        self.counts[bisect.bisect_left(self.buckets, info.elapsed)] += 1
+        self.count += 1
+        self.statuses[info.status] = self.statuses.get(info.status, 0) + 1
+        self.elapsed_sum += info.elapsed
+        self.elapsed_max = max(self.elapsed_max, info.elapsed)
+        self.decode_time_sum += info.decode_time
+        self.bytes_received_sum += info.bytes_received
+        self.retries_sum += info.retries
+        self.auth_refreshes += info.auth_refreshed
+        self.new_connections += info.connection_reused is False
+
+        if info.error is not None:
+            self.errors += 1
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        Estimate latency percentile as upper bound of histogram bucket, if it
+        falls into last bucket maximum latency is returned.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = percentile / 100 * self.count
+        total = 0
+
+        for index, count in enumerate(self.counts):
+            total += count
+            if total >= rank and count:
+                if index == len(self.buckets):
+                    return self.elapsed_max
+                return min(self.buckets[index], self.elapsed_max)
+
+        return self.elapsed_max
+
+    def as_dict(self) -> dict:
+        return dict(
+            count=self.count,
+            errors=self.errors,
+            statuses=dict(self.statuses),
+            elapsed_sum=self.elapsed_sum,
+            elapsed_mean=self.elapsed_sum / self.count if self.count else 0.0,
+            elapsed_max=self.elapsed_max,
+            p50=self.get_percentile(50),
+            p95=self.get_percentile(95),
+            p99=self.get_percentile(99),
+            decode_time_sum=self.decode_time_sum,
+            bytes_received_sum=self.bytes_received_sum,
+            retries_sum=self.retries_sum,
+            auth_refreshes=self.auth_refreshes,
+            new_connections=self.new_connections,
+            buckets=list(zip(self.buckets + (float('inf'),), self.counts)),
+        )
+
+
+class HistogramCollector:
+    """
+    In-memory collector of request statistics grouped by HTTP method and path
+    template, it's a client hook.
+
+    Example:
+
+    .. code-block:: python
+
+        collector = HistogramCollector()
+        client = SwarmClient(url, user, password, hooks=[collector])
+        ...
+        for (method, endpoint), stats in collector.get_slowest(5):
+            print(method, endpoint, stats['p95'])
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._stats = dict()  # type: Dict[Tuple[str, str], EndpointStats]
+        self._lock = threading.Lock()
+
+    def __call__(self, info: RequestInfo) -> None:
+        key = (info.method, info.endpoint)
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats(self.buckets)
+            stats.add(info)
+
+    def get_stats(self) -> Dict[Tuple[str, str], dict]:
+        """
+        Get statistics of each endpoint.
+
+        Returns:
+            Dict[Tuple[str, str], dict]: statistics by method and path template.
+        """
+        with self._lock:
+            return {key: stats.as_dict() for key, stats in self._stats.items()}
+
+    def get_slowest(self,
+                    count: int = 10,
+                    percentile: float = 95
+                    ) -> List[Tuple[Tuple[str, str], dict]]:
+        """
+        Get endpoints with the highest latency percentile.
+
+        Returns:
+            List[Tuple[Tuple[str, str], dict]]: method and path template with
+            statistics, slowest first.
+        """
+        with self._lock:
+            ordered = sorted(
+                self._stats.items(),
+                key=lambda item: item[1].get_percentile(percentile),
+                reverse=True,
+            )
+            return [(key, stats.as_dict()) for key, stats in ordered[:count]]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,674 @@
+import importlib
+import json
+import re
+import time
+
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from http import HTTPStatus
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from helixswarm.breaker import HALF_OPEN, CircuitBreaker
+from helixswarm.cache import VALIDATOR_HEADERS, ResponseCache, ValidatorCache
+from helixswarm.concurrency import OVERLOAD_STATUSES, ConcurrencyLimiter
+from helixswarm.exceptions import (
+    SwarmError,
+    SwarmNotFoundError,
+    SwarmUnauthorizedError,
+)
+from helixswarm.helpers import minimal_version
+from helixswarm.metrics import RequestInfo, get_path_template
+from helixswarm.ratelimit import RateLimiter
+from helixswarm.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    # batcher is used only by async client, it imports asyncio
+    from helixswarm.batch import ReviewBatcher
+
+Response = namedtuple('Response', ['status', 'body', 'headers'], defaults=[None])
+
+
+class ResponseEvicted(Exception):
+    """
+    Stored response was evicted while its conditional request was in flight,
+    so `304 Not Modified` can't be served and request is sent again without
+    validators.
+    """
+
+
+class Endpoint:
+    """
+    Endpoint class is imported and instantiated on first access, so only
+    endpoints which are really used cost time to import.
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+        self.attribute = name.lower()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attribute = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        endpoint_class = getattr(importlib.import_module(self.module), self.name)
+        endpoint = endpoint_class(instance)
+
+        # non-data descriptor, so next time instance attribute is used
+        instance.__dict__[self.attribute] = endpoint
+        return endpoint
+
+
+class Swarm(ABC):
+
+    auth_update_callback = None
+    json_loads = staticmethod(json.loads)  # type: Callable[[bytes], Any]
+    cache = None  # type: Optional[ResponseCache]
+    validators = None  # type: Optional[ValidatorCache]
+    hooks = ()  # type: Sequence[Callable[[RequestInfo], None]]
+    rate_limiter = None  # type: Optional[RateLimiter]
+    retry = None  # type: Optional[RetryPolicy]
+    concurrency_limiter = None  # type: Optional[ConcurrencyLimiter]
+    circuit_breaker = None  # type: Optional[CircuitBreaker]
+    review_batcher = None  # type: Optional[ReviewBatcher]
+
+    session_auth = False
+    stream = False
+
+    # incremented on each credentials or session update, so concurrent
+    # callers which got 401 with the same credentials update them only once
+    _auth_generation = 0
+
+    activities = Endpoint('helixswarm.endpoints.activities', 'Activities')
+    changes = Endpoint('helixswarm.endpoints.changes', 'Changes')
+    comments = Endpoint('helixswarm.endpoints.comments', 'Comments')
+    groups = Endpoint('helixswarm.endpoints.groups', 'Groups')
+    projects = Endpoint('helixswarm.endpoints.projects', 'Projects')
+    reviews = Endpoint('helixswarm.endpoints.reviews', 'Reviews')
+    servers = Endpoint('helixswarm.endpoints.servers', 'Servers')
+    users = Endpoint('helixswarm.endpoints.users', 'Users')
+    workflows = Endpoint('helixswarm.endpoints.workflows', 'Workflows')
+
+    @staticmethod
+    def _get_host_and_api_version(url: str) -> Tuple[str, str]:
+        match = re.match(r'.+(/api/v(\d+(?:\.\d+)?))', url)
+        if not match:
+            raise SwarmError('Please specify using API version in host URL')
+
+        host = url[:match.start(1)].strip('/')
+        version = match.group(2)
+        return host, version
+
+    @staticmethod
+    def _create_retry_policy(retry: dict) -> RetryPolicy:
+        for key in retry:
+            if key not in ('total', 'factor', 'statuses', 'methods', 'max_sleep', 'deadline'):
+                raise SwarmError('Unknown key in retry argument: ' + key)
+
+        if retry.get('total', 0) <= 0:
+            raise SwarmError('Invalid `total` in retry argument must be > 0')
+
+        if retry.get('factor', 1) < 0:
+            raise SwarmError('Invalid `factor` in retry argument must be >= 0')
+
+        for key in ('max_sleep', 'deadline'):
+            if retry.get(key) is not None and retry[key] <= 0:
+                raise SwarmError('Invalid `{}` in retry argument must be > 0'.format(key))
+
+        return RetryPolicy(**retry)
+
+    @staticmethod
+    def _validate_pool_argument(pool: dict) -> None:
+        for key in pool:
+            if key not in ('size', 'per_host', 'keepalive_timeout', 'dns_ttl'):
+                raise SwarmError('Unknown key in pool argument: ' + key)
+
+        for key in ('size', 'per_host'):
+            if key in pool and pool[key] <= 0:
+                raise SwarmError('Invalid `{}` in pool argument must be > 0'.format(key))
+
+    @staticmethod
+    def _create_cache(cache: dict) -> ResponseCache:
+        for key in cache:
+            if key not in ('size', 'ttl'):
+                raise SwarmError('Unknown key in cache argument: ' + key)
+
+        if cache.get('size', 1) <= 0:
+            raise SwarmError('Invalid `size` in cache argument must be > 0')
+
+        return ResponseCache(**cache)
+
+    @staticmethod
+    def _create_validators(revalidate: dict) -> ValidatorCache:
+        for key in revalidate:
+            if key != 'size':
+                raise SwarmError('Unknown key in revalidate argument: ' + key)
+
+        if revalidate.get('size', 1) <= 0:
+            raise SwarmError('Invalid `size` in revalidate argument must be > 0')
+
+        return ValidatorCache(**revalidate)
+
+    @staticmethod
+    def _create_rate_limiter(rate_limit: dict) -> RateLimiter:
+        for key in rate_limit:
+            if key not in ('rate', 'burst', 'weights'):
+                raise SwarmError('Unknown key in rate_limit argument: ' + key)
+
+        if rate_limit.get('rate', 0) <= 0:
+            raise SwarmError('Invalid `rate` in rate_limit argument must be > 0')
+
+        if rate_limit.get('burst', 1) <= 0:
+            raise SwarmError('Invalid `burst` in rate_limit argument must be > 0')
+
+        for endpoint, weight in rate_limit.get('weights', {}).items():
+            if weight < 0:
+                raise SwarmError(
+                    'Invalid `{}` weight in rate_limit argument must be >= 0'.format(endpoint)
+                )
+
+        return RateLimiter(**rate_limit)
+
+    @staticmethod
+    def _create_concurrency_limiter(concurrency: dict) -> ConcurrencyLimiter:
+        for key in concurrency:
+            if key not in ('initial', 'minimum', 'maximum', 'backoff', 'tolerance'):
+                raise SwarmError('Unknown key in adaptive_concurrency argument: ' + key)
+
+        limiter = ConcurrencyLimiter(**concurrency)
+
+        if not 0 < limiter.minimum <= limiter.initial <= limiter.maximum:
+            raise SwarmError(
+                'Invalid adaptive_concurrency argument must be 0 < minimum <= initial <= maximum'
+            )
+
+        if not 0 < limiter.backoff < 1:
+            raise SwarmError(
+                'Invalid `backoff` in adaptive_concurrency argument must be > 0 and < 1'
+            )
+
+        if limiter.tolerance <= 1:
+            raise SwarmError('Invalid `tolerance` in adaptive_concurrency argument must be > 1')
+
+        return limiter
+
+    @staticmethod
+    def _create_circuit_breaker(circuit_breaker: dict) -> CircuitBreaker:
+        for key, value in circuit_breaker.items():
+            if key not in ('failures', 'reset_timeout'):
+                raise SwarmError('Unknown key in circuit_breaker argument: ' + key)
+
+            if value <= 0:
+                raise SwarmError(
+                    'Invalid `{}` in circuit_breaker argument must be > 0'.format(key)
+                )
+
+        return CircuitBreaker(**circuit_breaker)
+
+    @staticmethod
+    def _get_page_items(response: dict, key: str) -> list:
+        items = response.get(key) or []
+
+        # comments are returned as object keyed by comment id
+        if isinstance(items, dict):
+            return list(items.values())
+
+        return items
+
+    @staticmethod
+    def _get_next_page_params(params: dict, response: dict) -> Optional[dict]:
+        last_seen = response.get('lastSeen')
+
+        # server returns `lastSeen` as null when there is nothing left, also
+        # stop if cursor doesn't move to avoid infinite loop
+        if last_seen is None or last_seen == params.get('after'):
+            return None
+
+        return dict(params, after=last_seen)
+
+    def _callback(self, response: Response, fcb: Callable) -> dict:
+        if response.status == HTTPStatus.UNAUTHORIZED:
+            raise SwarmUnauthorizedError
+
+        try:
+            decoded_body = self.json_loads(response.body)
+        except ValueError as e:
+            # json, orjson and ujson decode errors are all subclasses of it
+            raise SwarmError from e
+
+        # function callback used to support both sync and async syntax
+        fcb = fcb or (lambda response: response)  # type: ignore
+
+        if response.status == HTTPStatus.NOT_FOUND:
+            # temporary workaround, need to check Swarm source code
+            # coments.add() may return SwarmError (404) with valid json and comment #2
+            if 'error' not in decoded_body:
+                return fcb(decoded_body)
+
+            raise SwarmNotFoundError(decoded_body)
+
+        if response.status != HTTPStatus.OK:
+            raise SwarmError(response.body.decode(errors='replace'))
+
+        return fcb(decoded_body)
+
+    @abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_pool_usage(self) -> dict:
+        raise NotImplementedError
+
+    @abstractmethod
+    def request(self,
+                callback: Callable,
+                method: str,
+                path: str,
+                fcb: Optional[Callable] = None,
+                *,
+                info: Optional[RequestInfo] = None,
+                **kwargs: Any
+                ) -> dict:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _paginate(self,
+                  path: str,
+                  key: str,
+                  params: dict,
+                  operation: Optional[str] = None
+                  ) -> Union[Iterator[dict], AsyncIterator[dict]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _request_many(self,
+                      method: str,
+                      path: str,
+                      params_list: List[dict],
+                      fcb: Callable[[List[dict]], Any],
+                      *,
+                      operation: Optional[str] = None
+                      ) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _update_auth(self, generation: int) -> Union[None, Coroutine]:
+        raise NotImplementedError
+
+    def _lookup_cache(self,
+                      method: str,
+                      path: str,
+                      fcb: Optional[Callable],
+                      kwargs: dict
+                      ) -> Tuple[bool, Any, Optional[Callable]]:
+        """
+        Returns whether response is cached, cached result and function
+        callback which stores decoded response in cache, it's shared by sync
+        and async clients.
+        """
+        # streamed response is never decoded as a whole
+        if self.cache is None or method.upper() != 'GET' or kwargs.get('stream'):
+            return False, None, fcb
+
+        ttl = self.cache.get_ttl(path)
+        if ttl is None:
+            return False, None, fcb
+
+        cache = self.cache
+        key = cache.make_key(method, path, kwargs.get('params'))
+
+        fcb = fcb or (lambda response: response)
+        cached = cache.get(key)
+        if cached is not None:
+            return True, fcb(cached), fcb
+
+        def store(response: dict) -> dict:
+            cache.set(key, response, ttl)  # type: ignore
+            return fcb(response)  # type: ignore
+
+        return False, None, store
+
+    def _add_validators(self,
+                        method: str,
+                        path: str,
+                        kwargs: dict
+                        ) -> Optional[Hashable]:
+        """
+        Adds validators of previously received response to request headers,
+        returns key for `_revalidate()` or None if request is not conditional.
+        """
+        if self.validators is None or method.upper() != 'GET' or kwargs.get('stream'):
+            return None
+
+        key = ResponseCache.make_key(method, path, kwargs.get('params'))
+
+        headers = self.validators.get_headers(key)
+        if headers:
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **headers)
+
+        return key
+
+    @staticmethod
+    def _remove_validators(kwargs: dict) -> None:
+        headers = {
+            name: value for name, value in (kwargs.get('headers') or {}).items()
+            if name not in VALIDATOR_HEADERS
+        }
+
+        if headers:
+            kwargs['headers'] = headers
+        else:
+            kwargs.pop('headers', None)
+
+    def _revalidate(self,
+                    key: Hashable,
+                    response: Response,
+                    callback: Callable,
+                    fcb: Optional[Callable]
+                    ) -> Any:
+        """
+        Decodes stored body on `304 Not Modified` instead of downloading it,
+        otherwise stores validators with body of successful response.
+        """
+        validators = self.validators
+        assert validators is not None
+
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            body = validators.get(key)
+            if body is None:
+                raise ResponseEvicted
+
+            return callback(response._replace(status=HTTPStatus.OK, body=body), fcb)
+
+        headers = validators.get_validators(response.headers or {})
+        result = callback(response, fcb)
+
+        # body is stored only if it's decoded successfully
+        if response.status == HTTPStatus.OK and headers:
+            validators.set(key, headers, response.body)
+
+        return result
+
+    def _handle_response(self,
+                         callback: Callable,
+                         response: Response,
+                         fcb: Optional[Callable],
+                         *,
+                         key: Optional[Hashable] = None,
+                         info: Optional[RequestInfo] = None
+                         ) -> Any:
+        if info is not None:
+            info.status = response.status
+            info.bytes_received = len(response.body)
+
+        started = time.perf_counter()
+
+        try:
+            if key is not None:
+                return self._revalidate(key, response, callback, fcb)
+
+            return callback(response, fcb)
+        finally:
+            if info is not None:
+                info.decode_time = time.perf_counter() - started
+
+    def _create_request_info(self,
+                             method: str,
+                             path: str,
+                             operation: Optional[str]
+                             ) -> Optional[RequestInfo]:
+        if not self.hooks:
+            return None
+
+        return RequestInfo(
+            method.upper(),
+            path,
+            get_path_template(path),
+            operation=operation,
+        )
+
+    def _create_session_info(self) -> Optional[RequestInfo]:
+        if not self.hooks:
+            return None
+
+        return RequestInfo('POST', 'session', 'session', operation='Swarm.init_session')
+
+    def _call_hooks(self, info: RequestInfo, started: float) -> None:
+        info.elapsed = time.perf_counter() - started
+
+        for hook in self.hooks:
+            hook(info)
+
+    def _release_concurrency(self,
+                             started: float,
+                             status: Optional[int],
+                             timed_out: bool
+                             ) -> None:
+        assert self.concurrency_limiter is not None
+
+        # other errors, such as refused connection, say nothing about load
+        if status is None and not timed_out:
+            self.concurrency_limiter.release()
+            return
+
+        self.concurrency_limiter.release(
+            time.perf_counter() - started,
+            timed_out or status in OVERLOAD_STATUSES,
+        )
+
+    def _acquire_circuit(self, info: Optional[RequestInfo]) -> bool:
+        """
+        Returns whether request is probe of half-open breaker.
+        """
+        if self.circuit_breaker is None:
+            return False
+
+        try:
+            state = self.circuit_breaker.acquire()
+        except SwarmError:
+            if info is not None:
+                info.circuit_state = self.circuit_breaker.state
+            raise
+
+        return state == HALF_OPEN
+
+    def _release_circuit(self,
+                         probe: bool,
+                         status: Optional[int],
+                         failed: bool,
+                         info: Optional[RequestInfo]
+                         ) -> None:
+        if self.circuit_breaker is None:
+            return
+
+        # request cancelled before anything was sent or received
+        if status is None and not failed:
+            success = None  # type: Optional[bool]
+        else:
+            success = not failed and status < 500  # type: ignore
+
+        state = self.circuit_breaker.release(success, probe)
+        if info is not None:
+            info.circuit_state = state
+
+    def _invalidate_cache(self, method: str, path: str) -> None:
+        if self.cache is not None and method.upper() != 'GET':
+            self.cache.invalidate(path)
+
+    def _request(self,
+                 method: str,
+                 path: str,
+                 fcb: Optional[Callable] = None,
+                 *,
+                 operation: Optional[str] = None,
+                 **kwargs: Any
+                 ) -> dict:
+        is_cached, cached, fcb = self._lookup_cache(method, path, fcb, kwargs)
+        if is_cached:
+            return cached
+
+        info = self._create_request_info(method, path, operation)
+        started = time.perf_counter()
+
+        try:
+            return self._authorized_request(method, path, fcb, kwargs, info=info)
+        except BaseException as e:
+            if info is not None:
+                info.error = e
+            raise
+        finally:
+            self._invalidate_cache(method, path)
+            if info is not None:
+                self._call_hooks(info, started)
+
+    def _authorized_request(self,
+                            method: str,
+                            path: str,
+                            fcb: Optional[Callable],
+                            kwargs: dict,
+                            *,
+                            info: Optional[RequestInfo] = None
+                            ) -> dict:
+        generation = self._auth_generation
+
+        # session is opened by the first request
+        if self.session_auth and generation == 0:
+            self._update_auth(generation)
+            generation = self._auth_generation
+
+        try:
+            return self.request(self._callback, method, path, fcb, info=info, **kwargs)
+        except SwarmUnauthorizedError:
+            if self.auth_update_callback is None and not self.session_auth:
+                raise
+            self._update_auth(generation)
+            if info is not None:
+                info.auth_refreshed = True
+            return self.request(self._callback, method, path, fcb, info=info, **kwargs)
+
+    def get_version(self) -> dict:
+        """
+        Show server version information. This can be used to determine the
+        currently-installed Swarm version, and also to check that Swarm's API
+        is responding as expected.
+
+        Returns:
+            dict: server version.
+        """
+        return self._request('GET', 'version', operation='Swarm.get_version')
+
+    @minimal_version(9)
+    def check_auth(self, token: Optional[str] = None) -> dict:
+        """
+        Checking the 2FA authentication.
+
+        Returns:
+            dict: check result.
+        """
+        if token:
+            return self._request(
+                'POST',
+                'checkauth',
+                data=dict(token=token),
+                operation='Swarm.check_auth'
+            )
+
+        return self._request('GET', 'checkauth', operation='Swarm.check_auth')
+
+    @minimal_version(9)
+    def get_auth_methods(self) -> dict:
+        """
+        Returns the complete list of methods of 2FA.
+
+        Returns:
+            dict: auth methods.
+        """
+        return self._request('GET', 'listmethods', operation='Swarm.get_auth_methods')
+
+    @minimal_version(9)
+    def init_auth(self, method: str) -> dict:
+        """
+        Initiating the 2FA authentication.
+
+        Args:
+            method (str): the Method in which you want to use.
+
+        Returns:
+            dict: result response.
+        """
+        return self._request(
+            'POST',
+            'initauth',
+            data=dict(method=method),
+            operation='Swarm.init_auth'
+        )
+
+    @minimal_version(9)
+    def check_session(self) -> dict:
+        """
+        Get the current effective user details.
+
+        Returns:
+            dict: result response.
+        """
+        return self._request('GET', 'session', operation='Swarm.check_session')
+
+    @minimal_version(9)
+    def init_session(self) -> dict:
+        """
+        Create a new Swarm session using the given credentials.
+
+        Returns:
+            dict: result response.
+        """
+        return self._request('POST', 'session', operation='Swarm.init_session')
+
+    @minimal_version(9)
+    def destroy_session(self) -> dict:
+        """
+        Destroy the current session, for instance logout.
+
+        Returns:
+            dict: result response.
+        """
+        return self._request('DELETE', 'session', operation='Swarm.destroy_session')
+
+    @minimal_version(9)
+    def login(self, saml: Optional[bool] = None) -> dict:
+        """
+        Login to Swarm.
+
+        Returns:
+            dict: result response.
+        """
+        if saml is not None:
+            return self._request('POST', 'login/saml', operation='Swarm.login')
+
+        return self._request('POST', 'login', operation='Swarm.login')
+
+    @minimal_version(9)
+    def logout(self) -> dict:
+        """
+        Logout of Swarm.
+
+        Returns:
+            dict: result response.
+        """
+        return self._request('POST', 'logout', operation='Swarm.logout')
@@ -0,0 +1,158 @@
+import re
+
+import pytest
+import requests
+import responses
+
+from helixswarm import (
+    SwarmAsyncClient,
+    SwarmCircuitOpenError,
+    SwarmClient,
+    SwarmError,
+)
+from helixswarm.breaker import CircuitBreaker
+from helixswarm.exporters import PrometheusExporter, StatsdExporter
+from helixswarm.metrics import RequestInfo
+
+
+@pytest.mark.parametrize('circuit_breaker', [
+    dict(failures=0),
+    dict(reset_timeout=-1),
+    dict(strange=1),
+])
+def test_circuit_breaker_argument_validation(circuit_breaker):
+    with pytest.raises(SwarmError):
+        SwarmClient('http://server/api/v9', 'user', 'password', circuit_breaker=circuit_breaker)
+
+
+def test_breaker(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('helixswarm.breaker.time.monotonic', lambda: now[0])
+
+    breaker = CircuitBreaker(failures=2, reset_timeout=10)
+
+    # success resets run of failures
+    for success in (False, True, False):
+        assert breaker.acquire() == 'closed'
+        assert breaker.release(success) == 'closed'
+
+    breaker.acquire()
+    assert breaker.release(False) == 'open'
+    assert breaker.trips == 1
+
+    with pytest.raises(SwarmCircuitOpenError):
+        breaker.acquire()
+
+    # only one probe is let through
+    now[0] += 10
+    assert breaker.acquire() == 'half_open'
+
+    with pytest.raises(SwarmCircuitOpenError):
+        breaker.acquire()
+
+    # failed probe opens breaker again
+    assert breaker.release(False, probe=True) == 'open'
+    assert breaker.trips == 2
+
+    now[0] += 10
+    breaker.acquire()
+
+    # late result of request sent before breaker opened doesn't close it
+    assert breaker.release(True) == 'half_open'
+
+    assert breaker.release(True, probe=True) == 'closed'
+
+    # cancelled probe lets next one through
+    breaker.state = 'half_open'
+    breaker.acquire()
+    breaker.release(None, probe=True)
+    assert breaker.acquire() == 'half_open'
+
+
+@responses.activate
+def test_circuit_breaker(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('helixswarm.breaker.time.monotonic', lambda: now[0])
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        status=500
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/2'),
+        body=requests.ConnectionError('refused')
+    )
+
+    infos = []
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        circuit_breaker=dict(failures=2, reset_timeout=30),
+        hooks=[infos.append],
+    )
+
+    with pytest.raises(SwarmError):
+        client.reviews.get_info(1)
+
+    with pytest.raises(requests.ConnectionError):
+        client.reviews.get_info(2)
+
+    # fails fast without reaching server
+    with pytest.raises(SwarmCircuitOpenError):
+        client.reviews.get_info(1)
+
+    assert len(responses.calls) == 2
+    assert [info.circuit_state for info in infos] == ['closed', 'open', 'open']
+    assert isinstance(infos[2].error, SwarmCircuitOpenError)
+
+    responses.replace(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        json={'review': {'id': 1}}
+    )
+
+    now[0] += 30
+    assert client.reviews.get_info(1) == {'review': {'id': 1}}
+    assert client.circuit_breaker.state == 'closed'
+    assert infos[3].circuit_state == 'closed'
+
+
+@pytest.mark.asyncio
+async def test_async_circuit_breaker(aiohttp_mock):
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        circuit_breaker=dict(failures=1),
+    )
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews/1'), status=503)
+
+    with pytest.raises(SwarmError):
+        await client.reviews.get_info(1)
+
+    with pytest.raises(SwarmCircuitOpenError):
+        await client.reviews.get_info(1)
+
+    assert client.circuit_breaker.trips == 1
+
+    await client.close()
+
+
+def test_circuit_state_gauge():
+    packets = []
+    prometheus = PrometheusExporter()
+    statsd = StatsdExporter(sink=packets.append)
+
+    info = RequestInfo('GET', 'version', 'version', circuit_state='open')
+    prometheus(info)
+    statsd(info)
+
+    text = prometheus.render()
+    assert 'helixswarm_circuit_state{state="open"} 1\n' in text
+    assert 'helixswarm_circuit_state{state="closed"} 0\n' in text
+    assert b'helixswarm.circuit_open:1|g' in packets[0]
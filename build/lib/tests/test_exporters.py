@@ -0,0 +1,155 @@
+import re
+
+import pytest
+import responses
+
+from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from helixswarm.exporters import PrometheusExporter, StatsdExporter, get_labels
+from helixswarm.metrics import RequestInfo
+
+
+def test_get_labels():
+    info = RequestInfo('GET', 'reviews/1', 'reviews/{id}', operation='Reviews.get_info')
+    assert get_labels(info) == ('Reviews', 'get_info')
+
+    info = RequestInfo('GET', 'reviews/1', 'reviews/{id}')
+    assert get_labels(info) == ('Reviews', 'GET')
+
+
+def test_prometheus_render():
+    exporter = PrometheusExporter(buckets=(0.1, 1.0), max_pending=2)
+
+    for elapsed in (0.05, 0.5, 2.0):
+        exporter(RequestInfo(
+            'GET', 'reviews/1', 'reviews/{id}', 200, elapsed=elapsed,
+            operation='Reviews.get_info',
+        ))
+
+    exporter(RequestInfo(
+        'GET', 'reviews/2', 'reviews/{id}', elapsed=0.25,
+        error=SwarmError(), operation='Reviews.get_info',
+    ))
+
+    text = exporter.render()
+    labels = 'endpoint="Reviews",method="get_info"'
+
+    assert 'helixswarm_requests_total{%s,status="200"} 3' % labels in text
+    assert 'helixswarm_requests_total{%s,status="none"} 1' % labels in text
+    assert 'helixswarm_request_errors_total{%s,error="SwarmError"} 1' % labels in text
+    assert 'helixswarm_request_duration_seconds_bucket{%s,le="0.1"} 1' % labels in text
+    assert 'helixswarm_request_duration_seconds_bucket{%s,le="1.0"} 3' % labels in text
+    assert 'helixswarm_request_duration_seconds_bucket{%s,le="+Inf"} 4' % labels in text
+    assert 'helixswarm_request_duration_seconds_sum{%s} 2.8' % labels in text
+    assert 'helixswarm_request_duration_seconds_count{%s} 4' % labels in text
+
+    exporter.reset()
+    assert 'Reviews' not in exporter.render()
+
+
+def test_statsd():
+    packets = []
+    exporter = StatsdExporter(prefix='swarm', sink=packets.append)
+
+    exporter(RequestInfo(
+        'GET', 'reviews/1', 'reviews/{id}', 404, elapsed=0.0125,
+        error=SwarmError(), operation='Reviews.get_info',
+    ))
+
+    assert packets == [
+        b'swarm.reviews.get_info.requests:1|c\n'
+        b'swarm.reviews.get_info.status.404:1|c\n'
+        b'swarm.reviews.get_info.errors:1|c\n'
+        b'swarm.reviews.get_info.duration:12.500|ms'
+    ]
+
+
+def test_statsd_close():
+    exporter = StatsdExporter('127.0.0.1', 8125)
+    exporter.close()
+    assert exporter.sink.socket.fileno() == -1
+
+    # custom sink isn't closed
+    StatsdExporter(sink=lambda packet: None).close()
+
+
+@responses.activate
+def test_operation_labels():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/version'),
+        json={'year': '2018'}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        json={'review': {'id': 1}}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews'),
+        json={'lastSeen': None, 'reviews': [{'id': 1}]}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/activity'),
+        json={'lastSeen': None, 'activity': []}
+    )
+
+    infos = []
+    client = SwarmClient('http://server/api/v9', 'user', 'password', hooks=[infos.append])
+
+    client.get_version()
+    client.reviews.get_info(1)
+    list(client.reviews.iter())
+    list(client.activities.iter())
+
+    assert [info.operation for info in infos] == [
+        'Swarm.get_version',
+        'Reviews.get_info',
+        'Reviews.iter',
+        'Activities.iter',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_operation_labels(aiohttp_mock):
+    exporter = PrometheusExporter()
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        prefetch=1,
+        hooks=[exporter],
+    )
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/comments.*'),
+        payload={'lastSeen': None, 'comments': {}},
+    )
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews/1'), payload={'review': {'id': 1}})
+
+    await client.reviews.get_info(1)
+    assert [comment async for comment in client.comments.iter()] == []
+
+    text = exporter.render()
+    assert 'endpoint="Reviews",method="get_info",status="200"' in text
+    assert 'endpoint="Comments",method="iter",status="200"' in text
+
+    await client.close()
+
+
+def test_concurrency_limit_gauge():
+    packets = []
+    prometheus = PrometheusExporter()
+    statsd = StatsdExporter(sink=packets.append)
+
+    info = RequestInfo('GET', 'version', 'version', 200, concurrency_limit=8)
+    prometheus(info)
+    statsd(info)
+
+    assert 'helixswarm_concurrency_limit 8\n' in prometheus.render()
+    assert b'helixswarm.concurrency_limit:8|g' in packets[0]
@@ -0,0 +1,188 @@
+import asyncio
+import re
+import time
+
+import pytest
+
+from helixswarm import SwarmAsyncClient, SwarmError
+from helixswarm.hedge import HedgePolicy
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('hedge', [
+    dict(percentile=100),
+    dict(min_samples=0),
+    dict(window=10, min_samples=20),
+    dict(budget=2),
+    dict(strange=1),
+])
+async def test_hedge_argument_validation(hedge):
+    with pytest.raises(SwarmError):
+        SwarmAsyncClient('http://server/api/v9', 'user', 'password', hedge=hedge)
+
+
+def test_hedge_policy():
+    policy = HedgePolicy(percentile=90, window=10, min_samples=5, budget=0.5)
+
+    for elapsed in range(1, 5):
+        policy.record('reviews/{id}', elapsed)
+
+    assert policy.get_delay('reviews/{id}') is None
+
+    # window keeps only recent latencies
+    for elapsed in range(5, 21):
+        policy.record('reviews/{id}', elapsed)
+
+    assert policy.get_delay('reviews/{id}') == 20
+    assert policy.get_delay('projects') is None
+
+    # every request earns half of duplicate
+    assert policy.acquire()
+    assert policy.acquire()
+    assert not policy.acquire()
+
+    policy.get_delay('reviews/{id}')
+    policy.get_delay('reviews/{id}')
+    assert policy.acquire()
+    assert policy.hedged == 3
+
+
+@pytest.mark.asyncio
+async def test_hedge(aiohttp_mock):
+    infos = []
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        hedge=dict(min_samples=1),
+        hooks=[infos.append],
+    )
+
+    client.hedge.record('reviews/{id}', 0.01)
+
+    calls = []
+
+    async def callback(url, **_kwargs):
+        calls.append(url)
+        # first request is stuck on slow worker
+        if len(calls) == 1:
+            await asyncio.sleep(5)
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        payload={'review': {'id': 1}},
+        callback=callback,
+        repeat=True,
+    )
+
+    started = time.perf_counter()
+    assert await client.reviews.get_info(1) == {'review': {'id': 1}}
+    assert time.perf_counter() - started < 1
+
+    assert len(calls) == 2
+    assert infos[0].hedged
+    assert infos[0].status == 200
+    assert client.hedge.hedged == client.hedge.won == 1
+
+    # budget is spent
+    calls.clear()
+    aiohttp_mock.clear()
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        payload={'review': {'id': 1}},
+        callback=callback,
+        repeat=True,
+    )
+
+    task = asyncio.ensure_future(client.reviews.get_info(1))
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert len(calls) == 1
+    assert not infos[1].hedged
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hedge_rate_limit(aiohttp_mock):
+    infos = []
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        hedge=dict(min_samples=1, budget=1),
+        rate_limit=dict(rate=10, burst=2),
+        hooks=[infos.append],
+    )
+
+    client.hedge.record('reviews/{id}', 0.01)
+
+    calls = []
+
+    async def callback(url, **_kwargs):
+        calls.append(url)
+        if len(calls) == 1:
+            await asyncio.sleep(0.2)
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        payload={'review': {'id': 1}},
+        callback=callback,
+        repeat=True,
+    )
+
+    # bucket has tokens for request and its duplicate
+    assert await client.reviews.get_info(1) == {'review': {'id': 1}}
+    assert len(calls) == 2
+    assert infos[0].hedged
+
+    # bucket is empty, duplicate is skipped rather than delayed
+    calls.clear()
+    assert await client.reviews.get_info(1) == {'review': {'id': 1}}
+    assert len(calls) == 1
+    assert not infos[1].hedged
+    assert infos[1].throttled > 0
+
+    assert client.hedge.hedged == 1
+    assert client.rate_limiter.throttled == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hedge_errors(aiohttp_mock):
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        hedge=dict(min_samples=1, budget=1),
+    )
+
+    client.hedge.record('reviews/{id}', 0.01)
+
+    async def callback(_url, **_kwargs):
+        await asyncio.sleep(0.05)
+
+    # both requests failed, error of the first one is raised
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        exception=asyncio.TimeoutError('first'),
+        callback=callback,
+    )
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        exception=asyncio.TimeoutError('second'),
+    )
+
+    with pytest.raises(asyncio.TimeoutError, match='first'):
+        await client.reviews.get_info(1)
+
+    assert client.hedge.hedged == 1
+    assert client.hedge.won == 0
+
+    await client.close()
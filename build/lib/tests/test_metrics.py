@@ -0,0 +1,202 @@
+import asyncio
+import re
+import threading
+
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses
+
+from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from helixswarm.metrics import (
+    HistogramCollector,
+    RequestInfo,
+    get_path_template,
+)
+
+
+@pytest.mark.parametrize('path, template', [
+    ('version', 'version'),
+    ('reviews', 'reviews'),
+    ('reviews/1234', 'reviews/{id}'),
+    ('reviews/1234/vote', 'reviews/{id}/vote'),
+    ('/projects/swarm/', 'projects/{id}'),
+    ('reviews/archive', 'reviews/archive'),
+])
+def test_get_path_template(path, template):
+    assert get_path_template(path) == template
+
+
+def test_histogram_collector():
+    collector = HistogramCollector(buckets=(0.1, 0.5, 1.0))
+
+    for elapsed in [0.05] * 90 + [0.3] * 9 + [2.0]:
+        collector(RequestInfo('GET', 'reviews/1', 'reviews/{id}', 200, elapsed=elapsed))
+
+    collector(RequestInfo('GET', 'version', 'version', None, elapsed=0.01, error=SwarmError()))
+
+    stats = collector.get_stats()
+    reviews = stats[('GET', 'reviews/{id}')]
+    assert reviews['count'] == 100
+    assert reviews['errors'] == 0
+    assert reviews['statuses'] == {200: 100}
+    assert reviews['p50'] == 0.1
+    assert reviews['p95'] == 0.5
+    assert reviews['p99'] == 0.5
+    assert reviews['elapsed_max'] == 2.0
+    assert reviews['buckets'][-1] == (float('inf'), 1)
+
+    assert stats[('GET', 'version')]['errors'] == 1
+
+    slowest = collector.get_slowest(1)
+    assert [key for key, _ in slowest] == [('GET', 'reviews/{id}')]
+
+    collector.reset()
+    assert collector.get_stats() == {}
+
+
+@responses.activate
+def test_hooks():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        json={'review': {'id': 1}},
+        status=HTTPStatus.UNAUTHORIZED
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        json={'review': {'id': 1}}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/2'),
+        body='not json'
+    )
+
+    infos = []
+    collector = HistogramCollector()
+
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        auth_update_callback=lambda: ('user', 'password_new'),
+        hooks=[infos.append, collector],
+    )
+
+    client.reviews.get_info(1)
+
+    with pytest.raises(SwarmError):
+        client.reviews.get_info(2)
+
+    assert len(infos) == 2
+
+    info = infos[0]
+    assert info.method == 'GET'
+    assert info.path == 'reviews/1'
+    assert info.endpoint == 'reviews/{id}'
+    assert info.status == 200
+    assert info.bytes_received == len(b'{"review": {"id": 1}}')
+    assert info.auth_refreshed
+    assert info.error is None
+    assert info.elapsed >= info.decode_time > 0
+
+    assert isinstance(infos[1].error, SwarmError)
+    assert collector.get_stats()[('GET', 'reviews/{id}')]['count'] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_hooks(aiohttp_mock):
+    infos = []
+
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        coalesce=True,
+        hooks=[infos.append],
+    )
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews/1'), payload={'review': {'id': 1}})
+
+    await asyncio.gather(client.reviews.get_info(1), client.reviews.get_info(1))
+
+    assert len(infos) == 2
+    assert [info.coalesced for info in infos].count(True) == 1
+    assert all(info.status == 200 for info in infos)
+    assert all(info.bytes_received == infos[0].bytes_received > 0 for info in infos)
+
+    await client.close()
+
+
+class JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = b'{"review": {"id": 1}}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name='server_url')
+def server_url_fixture():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), JsonHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield 'http://127.0.0.1:{}/api/v9'.format(server.server_address[1])
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_timing(server_url):
+    infos = []
+    client = SwarmClient(server_url, 'user', 'password', hooks=[infos.append], timing=True)
+
+    client.reviews.get_info(1)
+    client.reviews.get_info(1)
+    client.close()
+
+    assert infos[0].connection_reused is False
+    assert set(infos[0].phases) == {'connect', 'ttfb', 'download'}
+
+    assert infos[1].connection_reused is True
+    assert set(infos[1].phases) == {'ttfb', 'download'}
+
+
+def test_timing_disabled(server_url):
+    infos = []
+    client = SwarmClient(server_url, 'user', 'password', hooks=[infos.append])
+
+    client.reviews.get_info(1)
+    client.close()
+
+    assert infos[0].phases is None
+    assert infos[0].connection_reused is None
+
+
+@pytest.mark.asyncio
+async def test_async_timing(server_url):
+    infos = []
+    client = SwarmAsyncClient(server_url, 'user', 'password', hooks=[infos.append], timing=True)
+
+    await client.reviews.get_info(1)
+    await client.reviews.get_info(1)
+    await client.close()
+
+    assert infos[0].connection_reused is False
+    assert {'connect', 'ttfb', 'download'} <= set(infos[0].phases)
+
+    assert infos[1].connection_reused is True
+    assert set(infos[1].phases) == {'ttfb', 'download'}
@@ -0,0 +1,166 @@
+import json
+import re
+
+from urllib.parse import parse_qsl, urlparse
+
+import pytest
+import responses
+
+from multidict import MultiDict
+
+from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from helixswarm.mirror import ReviewMirror, get_review_ids
+
+REVIEWS = {
+    1: {
+        'id': 1,
+        'author': 'alice',
+        'state': 'approved',
+        'projects': {'swarm': ['main']},
+        'participants': {'alice': [], 'bob': {'vote': 1}},
+    },
+    2: {
+        'id': 2,
+        'author': 'bob',
+        'state': 'needsReview',
+        'projects': {'swarm': ['main'], 'p4': ['dev']},
+        'participants': {'bob': []},
+    },
+    3: {
+        'id': 3,
+        'author': 'carol',
+        'state': 'needsReview',
+        'projects': [],
+        'participants': ['carol', 'alice'],
+    },
+}
+
+
+@pytest.fixture(name='server')
+def server_fixture():
+    state = dict(reviews=dict(REVIEWS), activity=[{'id': 10, 'topic': 'reviews/3'}])
+    queries = []
+
+    def reviews(request):
+        queries.append(urlparse(request.url).query)
+        query = MultiDict(parse_qsl(urlparse(request.url).query))
+
+        ids = [int(i) for i in query.getall('ids[]', [])]
+        found = sorted(state['reviews'].values(), key=lambda r: -r['id'])
+        if ids:
+            found = [review for review in found if review['id'] in ids]
+
+        # two reviews per page, `after` is the last seen id
+        if 'after' in query:
+            found = [review for review in found if review['id'] < int(query['after'])]
+        found = found[:int(query.get('max', 2))]
+
+        data = {
+            'lastSeen': found[-1]['id'] if found and not ids else None,
+            'reviews': found,
+        }
+        return 200, {}, json.dumps(data)
+
+    def activity(request):
+        query = MultiDict(parse_qsl(urlparse(request.url).query))
+        found = state['activity']
+        if 'after' in query:
+            found = [entry for entry in found if entry['id'] < int(query['after'])]
+        found = found[:int(query.get('max', 2))]
+
+        data = {
+            'lastSeen': found[-1]['id'] if found else None,
+            'activity': found,
+        }
+        return 200, {}, json.dumps(data)
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add_callback(responses.GET, re.compile(r'.*/api/v\d+/reviews.*'), callback=reviews)
+        mock.add_callback(responses.GET, re.compile(r'.*/api/v\d+/activity.*'), callback=activity)
+        yield state, queries
+
+
+def test_get_review_ids():
+    assert get_review_ids({'topic': 'reviews/12', 'streams': ['review-12', 'user-bob']}) == {12}
+    assert get_review_ids({'topic': 'changes/5', 'streams': ['review-7']}) == {7}
+    assert get_review_ids({'topic': '', 'streams': None}) == set()
+
+
+@pytest.mark.asyncio
+async def test_arguments():
+    client = SwarmClient('http://server/api/v9', 'user', 'password')
+
+    with pytest.raises(SwarmError):
+        ReviewMirror(client, page_size=0)
+
+    async_client = SwarmAsyncClient('http://server/api/v9', 'user', 'password')
+
+    with pytest.raises(SwarmError):
+        ReviewMirror(async_client)
+
+    await async_client.close()
+
+
+def test_sync(server, tmp_path):
+    state, queries = server
+    client = SwarmClient('http://server/api/v9', 'user', 'password')
+    path = str(tmp_path / 'reviews.db')
+
+    mirror = ReviewMirror(client, path, page_size=2)
+    assert mirror.last_activity is None
+
+    # initial load is paginated
+    assert mirror.sync() == 3
+    assert mirror.last_activity == 10
+    assert len(queries) == 3
+
+    def ids(**kwargs):
+        return [review['id'] for review in mirror.get(**kwargs)]
+
+    assert ids() == [3, 2, 1]
+    assert ids(limit=1) == [3]
+    assert ids(authors=['alice', 'bob']) == [2, 1]
+    assert ids(states=['needsReview']) == [3, 2]
+    assert ids(projects=['swarm']) == [2, 1]
+    assert ids(projects=['p4'], states=['approved']) == []
+    assert ids(participants=['alice']) == [3, 1]
+    assert ids(participants=['bob'], projects=['swarm']) == [2, 1]
+    assert mirror.get(authors=['bob']) == [REVIEWS[2]]
+
+    # review 2 is updated, review 3 removed and review 4 is not a review
+    state['reviews'][2] = dict(REVIEWS[2], state='approved', participants={'dave': []})
+    del state['reviews'][3]
+    state['activity'] = [
+        {'id': 14, 'topic': 'changes/4', 'streams': []},
+        {'id': 13, 'topic': 'reviews/2', 'streams': ['review-2']},
+        {'id': 12, 'topic': 'reviews/3', 'streams': ['review-3']},
+        {'id': 11, 'topic': 'reviews/2', 'streams': ['review-2']},
+        {'id': 10, 'topic': 'reviews/3', 'streams': ['review-3']},
+        {'id': 9, 'topic': 'reviews/1', 'streams': ['review-1']},
+    ]
+    del queries[:]
+
+    assert mirror.sync() == 2
+    assert mirror.last_activity == 14
+
+    # only reviews mentioned in activity are requested
+    assert queries == ['max=2&ids%5B%5D=2&ids%5B%5D=3']
+
+    assert ids() == [2, 1]
+    assert ids(states=['approved']) == [2, 1]
+    assert ids(participants=['bob']) == [1]
+    assert ids(participants=['dave']) == [2]
+
+    # nothing happened since
+    del queries[:]
+    assert mirror.sync() == 0
+    assert mirror.last_activity == 14
+    assert queries == []
+
+    mirror.close()
+
+    # database file keeps mirror between runs
+    mirror = ReviewMirror(client, path)
+    assert mirror.last_activity == 14
+    assert [review['id'] for review in mirror.get()] == [2, 1]
+    mirror.close()
@@ -0,0 +1,133 @@
+import asyncio
+import re
+
+import pytest
+import responses
+
+from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from helixswarm.ratelimit import RateLimiter
+
+
+@pytest.fixture(name='clock')
+def clock_fixture(monkeypatch):
+    now = [100.0]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr('helixswarm.ratelimit.time.monotonic', lambda: now[0])
+    monkeypatch.setattr('helixswarm.ratelimit.time.sleep', sleep)
+
+    return now, sleeps
+
+
+@pytest.mark.parametrize('rate_limit', [
+    dict(),
+    dict(rate=0),
+    dict(rate=1, burst=0),
+    dict(rate=1, weights={'reviews': -1}),
+    dict(rate=1, strange=1),
+])
+def test_rate_limit_argument_validation(rate_limit):
+    with pytest.raises(SwarmError):
+        SwarmClient('http://server/api/v9', 'user', 'password', rate_limit=rate_limit)
+
+
+def test_token_bucket(clock):
+    now, _ = clock
+    limiter = RateLimiter(rate=2, burst=4, weights={'activity': 2, 'version': 0})
+
+    # full bucket allows burst
+    assert [limiter.reserve(1) for _ in range(4)] == [0, 0, 0, 0]
+
+    # then requests are spread evenly at rate
+    assert limiter.reserve(1) == 0.5
+    assert limiter.reserve(1) == 1.0
+    assert limiter.throttled == 2
+
+    # bucket is never filled over burst
+    now[0] += 100
+    assert limiter.reserve(4) == 0
+    assert limiter.reserve(1) == 0.5
+
+    assert limiter.get_weight('activity') == 2
+    assert limiter.get_weight('version') == 0
+    assert limiter.get_weight('reviews/1') == 1
+
+
+def test_try_acquire(clock):
+    now, _ = clock
+    limiter = RateLimiter(rate=2, burst=2, weights={'activity': 2})
+
+    # tokens are taken only if available, bucket isn't left in debt
+    assert limiter.try_acquire('reviews/1')
+    assert not limiter.try_acquire('activity')
+    assert limiter.try_acquire('reviews/1')
+    assert not limiter.try_acquire('reviews/1')
+    assert limiter.throttled == 0
+
+    now[0] += 0.5
+    assert limiter.reserve(1) == 0
+
+
+@responses.activate
+def test_rate_limit(clock):
+    _, sleeps = clock
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        json={'review': {'id': 1}}
+    )
+
+    infos = []
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        rate_limit=dict(rate=10, burst=2, weights={'reviews': 2}),
+        hooks=[infos.append],
+    )
+
+    for _ in range(3):
+        client.reviews.get_info(1)
+
+    assert sleeps == [pytest.approx(0.2), pytest.approx(0.2)]
+    assert [info.throttled for info in infos] == [0, pytest.approx(0.2), pytest.approx(0.2)]
+
+
+@pytest.mark.asyncio
+async def test_async_rate_limit(aiohttp_mock):
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        rate_limit=dict(rate=10, burst=1),
+    )
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews/1'), payload={'review': {'id': 1}})
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews/1'), payload={'review': {'id': 1}})
+
+    await client.reviews.get_info(1)
+    await client.reviews.get_info(1)
+    assert client.rate_limiter.throttled == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_rate_limit_cancel():
+    limiter = RateLimiter(rate=0.1, burst=1)
+    assert await limiter.acquire_async('reviews') == 0
+
+    task = asyncio.ensure_future(limiter.acquire_async('reviews'))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # tokens of cancelled request are returned
+    assert 9 < limiter.reserve(1) <= 10
@@ -0,0 +1,148 @@
+import re
+import time
+
+from email.utils import formatdate
+
+import pytest
+import responses
+
+from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from helixswarm.retry import RetryPolicy, parse_retry_after
+
+
+@pytest.mark.parametrize('retry', [
+    dict(total=1, factor=-1),
+    dict(total=1, max_sleep=0),
+    dict(total=1, deadline=0),
+])
+def test_retry_argument_validation(retry):
+    with pytest.raises(SwarmError):
+        SwarmClient('http://server/api/v9', 'user', 'password', retry=retry)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('strange') is None
+    assert parse_retry_after('120') == 120
+    assert parse_retry_after('-1') == 0
+    assert 55 < parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+
+
+def test_retry_policy(monkeypatch):
+    monkeypatch.setattr('helixswarm.retry.random.uniform', lambda low, high: high)
+
+    policy = RetryPolicy(total=10, factor=0.5, statuses=[503], max_sleep=3, deadline=5)
+    started = time.monotonic()
+
+    # exponential bound limited by max_sleep
+    assert [policy.get_delay('GET', retry, started) for retry in range(5)] == [
+        0.5, 1, 2, 3, 3
+    ]
+
+    # statuses, methods and total
+    assert policy.get_delay('GET', 0, started, status=500) is None
+    assert policy.get_delay('POST', 0, started) is None
+    assert policy.get_delay('GET', 10, started) is None
+
+    # server asks to wait
+    assert policy.get_delay('GET', 0, started, status=503, headers={'Retry-After': '2'}) == 2
+    assert policy.get_delay('GET', 0, started, status=503, headers={'Retry-After': '10'}) is None
+
+    # deadline of whole call
+    assert policy.get_delay('GET', 3, started - 4) is None
+
+
+@pytest.fixture(name='sleeps')
+def sleeps_fixture(monkeypatch):
+    sleeps = []
+
+    async def async_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr('helixswarm.adapters.sync.time.sleep', sleeps.append)
+    monkeypatch.setattr('helixswarm.adapters.aio.asyncio.sleep', async_sleep)
+
+    return sleeps
+
+
+RETRY = dict(total=3, statuses=[503], max_sleep=5)
+
+
+@responses.activate
+def test_retry_after(sleeps):
+    for _ in range(4):
+        responses.add(
+            responses.GET,
+            re.compile(r'.*/api/v\d+/version'),
+            status=503,
+            headers={'Retry-After': '2'},
+        )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/version'),
+        status=503,
+        headers={'Retry-After': '60'},
+    )
+
+    infos = []
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        retry=RETRY,
+        hooks=[infos.append],
+    )
+
+    # last response is returned once retries are exhausted, without sleep
+    with pytest.raises(SwarmError):
+        client.get_version()
+
+    assert sleeps == [2, 2, 2]
+    assert infos[0].retries == 3
+    assert len(responses.calls) == 4
+
+    # too long Retry-After isn't waited
+    with pytest.raises(SwarmError):
+        client.get_version()
+
+    assert len(sleeps) == 3
+    assert len(responses.calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_async_retry_after(aiohttp_mock, sleeps):
+    for _ in range(4):
+        aiohttp_mock.get(
+            re.compile(r'.*/api/v\d+/version'),
+            status=503,
+            headers={'Retry-After': '2'},
+        )
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/version'),
+        status=503,
+        headers={'Retry-After': '60'},
+    )
+
+    infos = []
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        retry=RETRY,
+        hooks=[infos.append],
+    )
+
+    with pytest.raises(SwarmError):
+        await client.get_version()
+
+    assert sleeps == [2, 2, 2]
+    assert infos[0].retries == 3
+
+    with pytest.raises(SwarmError):
+        await client.get_version()
+
+    assert len(sleeps) == 3
+
+    await client.close()
@@ -1,6 +1,17 @@
-from .adapters.aio import SwarmAsyncClient
-from .adapters.sync import SwarmClient
-from .exceptions import SwarmCompatibleError, SwarmError, SwarmNotFoundError
+import importlib
+
+from typing import TYPE_CHECKING, Any, List
+
+from .exceptions import (
+    SwarmCircuitOpenError,
+    SwarmCompatibleError,
+    SwarmError,
+    SwarmNotFoundError,
+)
+
+if TYPE_CHECKING:
+    from .adapters.aio import SwarmAsyncClient
+    from .adapters.sync import SwarmClient
 
 __version__ = '0.7.4'
 
@@ -10,6 +21,27 @@ __all__ = (
     'SwarmAsyncClient',
     # exceptions
     'SwarmError',
+    'SwarmCircuitOpenError',
     'SwarmCompatibleError',
     'SwarmNotFoundError',
 )
+
+# adapters are imported on first access, so short-living scripts using one
+# client don't pay for importing HTTP library of another one
+_ADAPTERS = {
+    'SwarmClient': '.adapters.sync',
+    'SwarmAsyncClient': '.adapters.aio',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _ADAPTERS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    value = getattr(importlib.import_module(_ADAPTERS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,122 @@
+import asyncio
+import copy
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from helixswarm.exceptions import SwarmNotFoundError
+
+
+class ReviewBatcher:
+    """
+    Merges `reviews.get_info()` calls of async client made within `window`
+    seconds into one `reviews?ids[]=...` request, at most `size` reviews at
+    once, every caller gets own review back. Calls with different `fields`
+    are batched separately.
+
+    Attributes:
+        batches (int): number of requests made.
+        loaded (int): number of reviews requested by them.
+    """
+
+    def __init__(self, swarm: Any, *, window: float = 0.005, size: int = 50) -> None:
+        self.swarm = swarm
+        self.window = window
+        self.size = size
+        self.batches = 0
+        self.loaded = 0
+
+        self._pending = dict()  # type: Dict[Tuple[str, ...], Dict[int, List[asyncio.Future]]]
+        self._timers = dict()  # type: Dict[Tuple[str, ...], asyncio.TimerHandle]
+
+        # event loop keeps only weak references to tasks, so pending batch
+        # could be garbage collected leaving its callers waiting forever
+        self._tasks = set()  # type: Set[asyncio.Future]
+
+    async def load(self, review_id: int, fields: Optional[List[str]] = None) -> dict:
+        """
+        Get review as `reviews.get_info()` does.
+
+        Args:
+            review_id (int):
+                Review id getting information from.
+
+            fields (Optional[List[str]]):
+                List of fields to show.
+
+        Returns:
+            dict: json response.
+
+        Raises:
+            SwarmNotFoundError: if review doesn't exist or isn't visible to
+            user.
+        """
+        loop = asyncio.get_event_loop()
+        key = tuple(fields or ())
+
+        batch = self._pending.setdefault(key, dict())
+        future = loop.create_future()
+        batch.setdefault(int(review_id), []).append(future)
+
+        if len(batch) >= self.size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: Tuple[str, ...]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(key)
+
+        task = asyncio.ensure_future(self._load(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, key: Tuple[str, ...], batch: Dict[int, List[asyncio.Future]]) -> None:
+        # id is needed to find review of each caller
+        fields = list(key)
+        if fields and 'id' not in fields:
+            fields.append('id')
+
+        params = self.swarm.reviews._get_params(ids=list(batch), limit=len(batch), fields=fields)
+
+        self.batches += 1
+        self.loaded += len(batch)
+
+        try:
+            response = await self.swarm._request(
+                'GET',
+                'reviews',
+                params=params,
+                operation='Reviews.get_info'
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        found = {review['id']: review for review in response.get('reviews') or []}
+
+        for review_id, futures in batch.items():
+            review = found.get(review_id)
+
+            for index, future in enumerate(futures):
+                if future.done():
+                    continue
+
+                if review is None:
+                    error = SwarmNotFoundError('Review {} not found'.format(review_id))
+                    future.set_exception(error)
+                    continue
+
+                # every caller of the same review gets own copy
+                result = copy.deepcopy(review) if index else review
+                if key and 'id' not in key:
+                    result = {name: value for name, value in result.items() if name != 'id'}
+
+                future.set_result({'review': result})
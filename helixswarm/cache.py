@@ -0,0 +1,175 @@
+import copy
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_TTL = {
+    'groups': 60,
+    'projects': 60,
+    'servers': 60,
+    'users': 60,
+    'version': 60,
+    'workflows': 60,
+}  # type: Dict[str, float]
+
+# request headers of conditional request
+VALIDATOR_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+
+class ResponseCache:
+    """
+    Size bounded LRU cache of decoded GET responses with TTL per endpoint.
+    Thread safe, so it can be shared between threads of sync client.
+
+    Attributes:
+        hits (int): number of responses served from cache.
+        misses (int): number of cacheable requests sent to server.
+    """
+
+    def __init__(self,
+                 *,
+                 size: int = 1024,
+                 ttl: Optional[Dict[str, float]] = None
+                 ) -> None:
+        self.size = size
+        self.ttl = DEFAULT_TTL if ttl is None else ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()  # type: OrderedDict[Hashable, Tuple[float, Any]]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_endpoint(path: str) -> str:
+        """
+        Get endpoint name of path, for instance `projects` for `projects/swarm`
+        """
+        return path.strip('/').split('/', 1)[0]
+
+    @staticmethod
+    def make_key(method: str, path: str, params: Optional[dict]) -> Hashable:
+        items = []
+
+        for name, value in sorted((params or {}).items()):
+            if isinstance(value, (list, tuple)):
+                value = tuple(value)
+            items.append((name, value))
+
+        return method.upper(), path.strip('/'), tuple(items)
+
+    def get_ttl(self, path: str) -> Optional[float]:
+        return self.ttl.get(self.get_endpoint(path))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return copy.deepcopy(entry[1])
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        value = copy.deepcopy(value)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        """
+        Remove all entries of the same endpoint as path, for instance any
+        change of `projects/swarm` drops cached `projects` list too.
+        """
+        endpoint = self.get_endpoint(path)
+
+        with self._lock:
+            for key in list(self._entries):
+                if self.get_endpoint(key[1]) == endpoint:  # type: ignore
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ValidatorCache:
+    """
+    Size bounded LRU store of raw GET response bodies with their `ETag` and
+    `Last-Modified` validators, used to revalidate responses with conditional
+    requests instead of downloading them again. Bodies are immutable bytes,
+    so they are shared without copying and decoded again on each
+    `304 Not Modified`, it's cheaper than deep copy of decoded response.
+
+    Attributes:
+        revalidated (int): number of `304 Not Modified` responses served.
+    """
+
+    def __init__(self, *, size: int = 1024) -> None:
+        self.size = size
+        self.revalidated = 0
+
+        self._entries = OrderedDict()  # type: OrderedDict[Hashable, Tuple[dict, bytes]]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_validators(headers: Any) -> Dict[str, str]:
+        """
+        Get request headers for conditional request from response headers.
+        """
+        validators = dict()  # type: Dict[str, str]
+
+        if headers.get('ETag'):
+            validators['If-None-Match'] = headers['ETag']
+
+        if headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = headers['Last-Modified']
+
+        return validators
+
+    def get_headers(self, key: Hashable) -> Dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return {}
+
+            self._entries.move_to_end(key)
+            return dict(entry[0])
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self.revalidated += 1
+
+        return entry[1]
+
+    def set(self, key: Hashable, validators: Dict[str, str], body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (validators, body)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Union
 
 
 class Activities:
@@ -6,6 +6,37 @@ class Activities:
     def __init__(self, swarm) -> None:
         self.swarm = swarm
 
+    def _get_params(self,
+                    *,
+                    change: Optional[int] = None,
+                    stream: Optional[str] = None,
+                    category: Optional[str] = None,
+                    after: Optional[int] = None,
+                    limit: Optional[int] = None,
+                    fields: Optional[List[str]] = None
+                    ) -> dict:
+        params = dict()  # type: Dict[str, Union[int, str]]
+
+        if change:
+            params['change'] = change
+
+        if stream:
+            params['stream'] = stream
+
+        if category:
+            params['type'] = category
+
+        if after:
+            params['after'] = after
+
+        if limit:
+            params['max'] = limit
+
+        if fields:
+            params['fields'] = ','.join(fields)
+
+        return params
+
     def get(self,
             *,
             change: Optional[int] = None,
@@ -52,27 +83,46 @@ class Activities:
         Returns:
             dict: json response.
         """
-        params = dict()  # type: Dict[str, Union[int, str]]
-
-        if change:
-            params['change'] = change
-
-        if stream:
-            params['stream'] = stream
-
-        if category:
-            params['type'] = category
-
-        if after:
-            params['after'] = after
+        params = self._get_params(
+            change=change,
+            stream=stream,
+            category=category,
+            after=after,
+            limit=limit,
+            fields=fields,
+        )
+
+        return self.swarm._request('GET', 'activity', params=params, operation='Activities.get')
+
+    def iter(self,
+             *,
+             change: Optional[int] = None,
+             stream: Optional[str] = None,
+             category: Optional[str] = None,
+             after: Optional[int] = None,
+             limit: Optional[int] = None,
+             fields: Optional[List[str]] = None
+             ) -> Union[Iterator[dict], AsyncIterator[dict]]:
+        """
+        Iterate over the whole activity list, following `lastSeen` from page
+        to page until the server has no more entries.
 
-        if limit:
-            params['max'] = limit
+        Accepts the same filters as :meth:`get`, except that `limit` sets the
+        page size and `after` the activity ID to start after.
 
-        if fields:
-            params['fields'] = ','.join(fields)
+        Returns:
+            Union[Iterator[dict], AsyncIterator[dict]]: activity entries one by one.
+        """
+        params = self._get_params(
+            change=change,
+            stream=stream,
+            category=category,
+            after=after,
+            limit=limit,
+            fields=fields,
+        )
 
-        return self.swarm._request('GET', 'activity', params=params)
+        return self.swarm._paginate('activity', 'activity', params, operation='Activities.iter')
 
     def create(self,
                *,
@@ -156,4 +206,4 @@ class Activities:
         if link:
             data['link'] = link
 
-        return self.swarm._request('POST', 'activity', data=data)
+        return self.swarm._request('POST', 'activity', data=data, operation='Activities.create')
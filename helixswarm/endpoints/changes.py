@@ -20,7 +20,8 @@ class Changes:
         """
         return self.swarm._request(
             'GET',
-            'changes/{}/affectsprojects'.format(change)
+            'changes/{}/affectsprojects'.format(change),
+            operation='Changes.get_affects_projects'
         )
 
     @minimal_version(8)
@@ -37,7 +38,8 @@ class Changes:
         """
         return self.swarm._request(
             'GET',
-            'changes/{}/defaultreviewers'.format(change)
+            'changes/{}/defaultreviewers'.format(change),
+            operation='Changes.get_default_reviewers'
         )
 
     @minimal_version(9)
@@ -59,5 +61,6 @@ class Changes:
         return self.swarm._request(
             'GET',
             'changes/{}/check'.format(change),
-            params=dict(type=category)
+            params=dict(type=category),
+            operation='Changes.get_check_status'
         )
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from helixswarm.exceptions import SwarmCompatibleError, SwarmError
 from helixswarm.helpers import minimal_version
@@ -9,6 +9,57 @@ class Comments:
     def __init__(self, swarm) -> None:
         self.swarm = swarm
 
+    def _get_params(self,
+                    *,
+                    after: Optional[int] = None,
+                    limit: Optional[int] = None,
+                    topic: Optional[str] = None,
+                    context_version: Optional[int] = None,
+                    ignore_archived: Optional[bool] = None,
+                    tasks_only: Optional[bool] = None,
+                    task_states: Optional[List[str]] = None,
+                    fields: Optional[List[str]] = None
+                    ) -> dict:
+        params = dict()  # type: Dict[str, Union[str, int, bool, List[str]]]
+
+        if after:
+            params['after'] = after
+
+        if limit:
+            params['max'] = limit
+
+        if topic:
+            params['topic'] = topic
+
+        if context_version:
+            params['context[version]'] = context_version
+
+        if ignore_archived:
+            params['ignoreArchived'] = ignore_archived
+            if float(self.swarm.version) < 5:
+                raise SwarmCompatibleError(
+                    'ignore_archived field is supported from API version >= 5'
+                )
+
+        if tasks_only:
+            params['tasksOnly'] = tasks_only
+            if float(self.swarm.version) < 5:
+                raise SwarmCompatibleError(
+                    'tasks_only field is supported from API version >= 5'
+                )
+
+        if task_states:
+            params['taskStates'] = task_states
+            if float(self.swarm.version) < 5:
+                raise SwarmCompatibleError(
+                    'task_states field is supported from API version >= 5'
+                )
+
+        if fields:
+            params['fields'] = ','.join(fields)
+
+        return params
+
     @minimal_version(3)
     def get(self,
             *,
@@ -66,45 +117,53 @@ class Comments:
         Returns:
             dict: json response.
         """
-        params = dict()  # type: Dict[str, Union[str, int, bool, List[str]]]
-
-        if after:
-            params['after'] = after
-
-        if limit:
-            params['max'] = limit
-
-        if topic:
-            params['topic'] = topic
-
-        if context_version:
-            params['context[version]'] = context_version
+        params = self._get_params(
+            after=after,
+            limit=limit,
+            topic=topic,
+            context_version=context_version,
+            ignore_archived=ignore_archived,
+            tasks_only=tasks_only,
+            task_states=task_states,
+            fields=fields,
+        )
 
-        if ignore_archived:
-            params['ignoreArchived'] = ignore_archived
-            if float(self.swarm.version) < 5:
-                raise SwarmCompatibleError(
-                    'ignore_archived field is supported from API version >= 5'
-                )
+        return self.swarm._request('GET', 'comments', params=params, operation='Comments.get')
 
-        if tasks_only:
-            params['tasksOnly'] = tasks_only
-            if float(self.swarm.version) < 5:
-                raise SwarmCompatibleError(
-                    'tasks_only field is supported from API version >= 5'
-                )
+    @minimal_version(3)
+    def iter(self,
+             *,
+             after: Optional[int] = None,
+             limit: Optional[int] = None,
+             topic: Optional[str] = None,
+             context_version: Optional[int] = None,
+             ignore_archived: Optional[bool] = None,
+             tasks_only: Optional[bool] = None,
+             task_states: Optional[List[str]] = None,
+             fields: Optional[List[str]] = None
+             ) -> Union[Iterator[dict], AsyncIterator[dict]]:
+        """
+        Iterate over all comments, following `lastSeen` from page to page
+        until the server has no more comments.
 
-        if task_states:
-            params['taskStates'] = task_states
-            if float(self.swarm.version) < 5:
-                raise SwarmCompatibleError(
-                    'task_states field is supported from API version >= 5'
-                )
+        Accepts the same filters as :meth:`get`, except that `limit` sets the
+        page size and `after` the comment ID to start after.
 
-        if fields:
-            params['fields'] = ','.join(fields)
+        Returns:
+            Union[Iterator[dict], AsyncIterator[dict]]: comments one by one.
+        """
+        params = self._get_params(
+            after=after,
+            limit=limit,
+            topic=topic,
+            context_version=context_version,
+            ignore_archived=ignore_archived,
+            tasks_only=tasks_only,
+            task_states=task_states,
+            fields=fields,
+        )
 
-        return self.swarm._request('GET', 'comments', params=params)
+        return self.swarm._paginate('comments', 'comments', params, operation='Comments.iter')
 
     @minimal_version(3)
     def add(self,
@@ -218,7 +277,7 @@ class Comments:
         if context_version:
             data['context[version]'] = context_version
 
-        return self.swarm._request('POST', 'comments', data=data)
+        return self.swarm._request('POST', 'comments', data=data, operation='Comments.add')
 
     @minimal_version(3)
     def edit(self,
@@ -290,6 +349,7 @@ class Comments:
             'PATCH',
             'comments/{}'.format(comment_id),
             data=data,
+            operation='Comments.edit',
         )
 
         return response
@@ -310,4 +370,9 @@ class Comments:
         Returns:
             dict: json response.
         """
-        return self.swarm._request('POST', 'comments', params=dict(topic=topic))
+        return self.swarm._request(
+            'POST',
+            'comments',
+            params=dict(topic=topic),
+            operation='Comments.notify'
+        )
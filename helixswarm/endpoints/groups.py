@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from helixswarm.exceptions import SwarmError
 from helixswarm.helpers import minimal_version
@@ -9,6 +9,29 @@ class Groups:
     def __init__(self, swarm) -> None:
         self.swarm = swarm
 
+    def _get_params(self,
+                    *,
+                    after: Optional[str] = None,
+                    limit: Optional[int] = None,
+                    fields: Optional[List[str]] = None,
+                    keywords: Optional[str] = None
+                    ) -> dict:
+        params = dict()  # type: Dict[str, Union[str, int]]
+
+        if after:
+            params['after'] = after
+
+        if limit:
+            params['max'] = limit
+
+        if fields:
+            params['fields'] = ','.join(fields)
+
+        if keywords:
+            params['keywords'] = keywords
+
+        return params
+
     @minimal_version(2)
     def get(self,
             *,
@@ -46,21 +69,41 @@ class Groups:
         Returns:
             dict: json response.
         """
-        params = dict()  # type: Dict[str, Union[str, int]]
+        params = self._get_params(
+            after=after,
+            limit=limit,
+            fields=fields,
+            keywords=keywords,
+        )
 
-        if after:
-            params['after'] = after
+        return self.swarm._request('GET', 'groups', params=params, operation='Groups.get')
 
-        if limit:
-            params['max'] = limit
+    @minimal_version(2)
+    def iter(self,
+             *,
+             after: Optional[str] = None,
+             limit: Optional[int] = None,
+             fields: Optional[List[str]] = None,
+             keywords: Optional[str] = None
+             ) -> Union[Iterator[dict], AsyncIterator[dict]]:
+        """
+        Iterate over the complete list of groups, following `lastSeen` from
+        page to page until the server has no more groups.
 
-        if fields:
-            params['fields'] = ','.join(fields)
+        Accepts the same filters as :meth:`get`, except that `limit` sets the
+        page size and `after` the group ID to start after.
 
-        if keywords:
-            params['keywords'] = keywords
+        Returns:
+            Union[Iterator[dict], AsyncIterator[dict]]: groups one by one.
+        """
+        params = self._get_params(
+            after=after,
+            limit=limit,
+            fields=fields,
+            keywords=keywords,
+        )
 
-        return self.swarm._request('GET', 'groups', params=params)
+        return self.swarm._paginate('groups', 'groups', params, operation='Groups.iter')
 
     @minimal_version(2)
     def get_info(self,
@@ -90,7 +133,8 @@ class Groups:
         response = self.swarm._request(
             'GET',
             'groups/{}'.format(identifier),
-            params=params
+            params=params,
+            operation='Groups.get_info'
         )
 
         return response
@@ -184,7 +228,7 @@ class Groups:
         if use_mailing_list:
             data['config[useMailingList]'] = use_mailing_list
 
-        return self.swarm._request('POST', 'groups', data=data)
+        return self.swarm._request('POST', 'groups', data=data, operation='Groups.create')
 
     @minimal_version(2)
     def edit(self,
@@ -274,7 +318,8 @@ class Groups:
         response = self.swarm._request(
             'PATCH',
             'groups/{}'.format(identifier),
-            data=data
+            data=data,
+            operation='Groups.edit'
         )
 
         return response
@@ -291,4 +336,8 @@ class Groups:
         Returns:
             dict: json response.
         """
-        return self.swarm._request('DELETE', 'groups/{}'.format(identifier))
+        return self.swarm._request(
+            'DELETE',
+            'groups/{}'.format(identifier),
+            operation='Groups.delete'
+        )
@@ -34,7 +34,7 @@ class Projects:
         if workflow:
             params['workflow'] = workflow
 
-        return self.swarm._request('GET', 'projects', params=params)
+        return self.swarm._request('GET', 'projects', params=params, operation='Projects.get')
 
     def get_info(self,
                  identifier: str,
@@ -63,7 +63,8 @@ class Projects:
         response = self.swarm._request(
             'GET',
             'projects/{}'.format(identifier),
-            params=params
+            params=params,
+            operation='Projects.get_info'
         )
 
         return response
@@ -202,7 +203,7 @@ class Projects:
         if minimum_up_votes:
             data['minimumUpVotes'] = minimum_up_votes
 
-        return self.swarm._request('POST', 'projects', data=data)
+        return self.swarm._request('POST', 'projects', data=data, operation='Projects.create')
 
     def edit(self,
              identifier: str,
@@ -351,7 +352,8 @@ class Projects:
         response = self.swarm._request(
             'PATCH',
             'projects/{}'.format(identifier),
-            data=data
+            data=data,
+            operation='Projects.edit'
         )
 
         return response
@@ -371,7 +373,8 @@ class Projects:
         """
         response = self.swarm._request(
             'DELETE',
-            'projects/{}'.format(identifier)
+            'projects/{}'.format(identifier),
+            operation='Projects.delete'
         )
 
         return response
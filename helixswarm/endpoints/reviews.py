@@ -1,14 +1,105 @@
-from typing import Callable, Dict, List, Optional, Tuple, Union
-
-from helixswarm.exceptions import SwarmCompatibleError, SwarmError
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from helixswarm.exceptions import (
+    SwarmCompatibleError,
+    SwarmError,
+    SwarmNotFoundError,
+)
 from helixswarm.helpers import minimal_version
 
+# number of ids requested at once, so URL doesn't exceed length limit
+IDS_CHUNK_SIZE = 100
+
 
 class Reviews:
 
     def __init__(self, swarm) -> None:
         self.swarm = swarm
 
+    def _get_params(self,
+                    *,
+                    after: Optional[int] = None,
+                    limit: Optional[int] = None,
+                    fields: Optional[List[str]] = None,
+                    authors: Optional[List[str]] = None,
+                    changes: Optional[List[int]] = None,
+                    has_reviewers: Optional[bool] = None,
+                    ids: Optional[List[int]] = None,
+                    keywords: Optional[str] = None,
+                    participants: Optional[List[str]] = None,
+                    projects: Optional[List[str]] = None,
+                    states: Optional[List[str]] = None,
+                    passes_tests: Optional[bool] = None,
+                    not_updated_since: Optional[str] = None,
+                    has_voted: Optional[str] = None,
+                    my_comments: Optional[bool] = None
+                    ) -> dict:
+        params = dict()  # type: Dict[str, Union[int, str, bool, List[str], List[int]]]
+
+        if after:
+            params['after'] = after
+
+        if limit:
+            params['max'] = limit
+
+        if fields:
+            params['fields'] = ','.join(fields)
+
+        if authors:
+            params['author'] = authors
+            if float(self.swarm.version) < 2:
+                raise SwarmCompatibleError(
+                    'author field is supported from API version >= 2'
+                )
+
+        if changes:
+            params['change'] = changes
+
+        if has_reviewers is not None:
+            params['hasReviewers'] = has_reviewers
+
+        if ids:
+            # PHP keeps only the last value of repeated key without brackets
+            params['ids[]'] = ids
+
+        if keywords:
+            params['keywords'] = keywords
+
+        if participants:
+            params['participants'] = participants
+
+        if projects:
+            params['project'] = projects
+
+        if states:
+            params['state'] = states
+
+        if passes_tests is not None:
+            params['passesTests'] = passes_tests
+
+        if not_updated_since:
+            params['notUpdatedSince'] = not_updated_since
+
+        if has_voted:
+            params['hasVoted'] = has_voted
+
+        if my_comments is not None:
+            params['myComments'] = my_comments
+
+        return params
+
     def get(self,
             *,
             after: Optional[int] = None,
@@ -101,58 +192,84 @@ class Reviews:
         Returns:
             dict: json response.
         """
-        params = dict()  # type: Dict[str, Union[int, str, bool, List[str], List[int]]]
-
-        if after:
-            params['after'] = after
-
-        if limit:
-            params['max'] = limit
-
-        if fields:
-            params['fields'] = ','.join(fields)
-
-        if authors:
-            params['author'] = authors
-            if float(self.swarm.version) < 2:
-                raise SwarmCompatibleError(
-                    'author field is supported from API version >= 2'
-                )
-
-        if changes:
-            params['change'] = changes
-
-        if has_reviewers is not None:
-            params['hasReviewers'] = has_reviewers
+        params = self._get_params(
+            after=after,
+            limit=limit,
+            fields=fields,
+            authors=authors,
+            changes=changes,
+            has_reviewers=has_reviewers,
+            ids=ids,
+            keywords=keywords,
+            participants=participants,
+            projects=projects,
+            states=states,
+            passes_tests=passes_tests,
+            not_updated_since=not_updated_since,
+            has_voted=has_voted,
+            my_comments=my_comments,
+        )
 
-        if ids:
-            params['ids'] = ids
+        return self.swarm._request('GET', 'reviews', params=params, operation='Reviews.get')
 
-        if keywords:
-            params['keywords'] = keywords
+    def iter(self,
+             *,
+             after: Optional[int] = None,
+             limit: Optional[int] = None,
+             fields: Optional[List[str]] = None,
+             authors: Optional[List[str]] = None,
+             changes: Optional[List[int]] = None,
+             has_reviewers: Optional[bool] = None,
+             ids: Optional[List[int]] = None,
+             keywords: Optional[str] = None,
+             participants: Optional[List[str]] = None,
+             projects: Optional[List[str]] = None,
+             states: Optional[List[str]] = None,
+             passes_tests: Optional[bool] = None,
+             not_updated_since: Optional[str] = None,
+             has_voted: Optional[str] = None,
+             my_comments: Optional[bool] = None
+             ) -> Union[Iterator[dict], AsyncIterator[dict]]:
+        """
+        Iterate over all available reviews, following `lastSeen` from page to
+        page until the server has no more results. Only one page is kept in
+        memory at a time.
 
-        if participants:
-            params['participants'] = participants
+        Accepts the same filters as :meth:`get`, except that `limit` sets the
+        page size and `after` the review ID to start after.
 
-        if projects:
-            params['project'] = projects
+        Example:
 
-        if states:
-            params['state'] = states
+        .. code-block:: python
 
-        if passes_tests is not None:
-            params['passesTests'] = passes_tests
+            for review in client.reviews.iter(states=['needsReview']):
+                print(review['id'])
 
-        if not_updated_since:
-            params['notUpdatedSince'] = not_updated_since
+            async for review in async_client.reviews.iter(states=['needsReview']):
+                print(review['id'])
 
-        if has_voted:
-            params['hasVoted'] = has_voted
-
-        if my_comments is not None:
-            params['myComments'] = my_comments
+        Returns:
+            Union[Iterator[dict], AsyncIterator[dict]]: reviews one by one.
+        """
+        params = self._get_params(
+            after=after,
+            limit=limit,
+            fields=fields,
+            authors=authors,
+            changes=changes,
+            has_reviewers=has_reviewers,
+            ids=ids,
+            keywords=keywords,
+            participants=participants,
+            projects=projects,
+            states=states,
+            passes_tests=passes_tests,
+            not_updated_since=not_updated_since,
+            has_voted=has_voted,
+            my_comments=my_comments,
+        )
 
-        return self.swarm._request('GET', 'reviews', params=params)
+        return self.swarm._paginate('reviews', 'reviews', params, operation='Reviews.iter')
 
     @minimal_version(6)
     def get_for_dashboard(self) -> dict:
@@ -162,12 +279,17 @@ class Reviews:
         Returns:
             dict: json response.
         """
-        return self.swarm._request('GET', 'dashboards/action')
+        return self.swarm._request(
+            'GET',
+            'dashboards/action',
+            operation='Reviews.get_for_dashboard'
+        )
 
     def _get_info(self,
                   review_id: int,
                   fields: Optional[List[str]] = None,
-                  callback: Optional[Callable] = None
+                  callback: Optional[Callable] = None,
+                  operation: str = 'Reviews.get_info'
                   ) -> dict:
         """
         Retrieve information about a review.
@@ -183,6 +305,9 @@ class Reviews:
             callback (Optional[Callable]):
                 Function callback for support both sync and async syntax.
 
+            operation (str):
+                Public method reported to hooks.
+
         Returns:
             dict: json response.
         """
@@ -195,7 +320,8 @@ class Reviews:
             'GET',
             'reviews/{}'.format(review_id),
             fcb=callback,
-            params=params
+            params=params,
+            operation=operation
         )
 
         return response
@@ -219,8 +345,83 @@ class Reviews:
         Returns:
             dict: json response.
         """
+        # concurrent calls of async client are merged into one request
+        if self.swarm.review_batcher is not None:
+            return self.swarm.review_batcher.load(review_id, fields)
+
         return self._get_info(review_id, fields)
 
+    def _get_many(self,
+                  ids: Iterable[int],
+                  fields: Optional[List[str]],
+                  chunk_size: int,
+                  callback: Callable[[List[int], Dict[int, dict]], Any],
+                  *,
+                  operation: str
+                  ) -> Any:
+        """
+        Request reviews by chunks of ids concurrently, callback gets unique
+        ids and found reviews by id.
+        """
+        if chunk_size <= 0:
+            raise SwarmError('Invalid `chunk_size` argument must be > 0')
+
+        ids = list(dict.fromkeys(int(review_id) for review_id in ids))
+
+        if fields and 'id' not in fields:
+            fields = list(fields) + ['id']
+
+        params_list = []
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            params_list.append(self._get_params(ids=chunk, limit=len(chunk), fields=fields))
+
+        def fcb(responses: List[dict]) -> Any:
+            found = dict()  # type: Dict[int, dict]
+            for response in responses:
+                for review in response.get('reviews') or []:
+                    found[review['id']] = review
+
+            return callback(ids, found)
+
+        return self.swarm._request_many('GET', 'reviews', params_list, fcb, operation=operation)
+
+    def get_many(self,
+                 ids: Iterable[int],
+                 *,
+                 fields: Optional[List[str]] = None,
+                 chunk_size: int = IDS_CHUNK_SIZE
+                 ) -> Union[dict, Awaitable[dict]]:
+        """
+        Get many reviews at once. Ids are split into chunks which are
+        requested concurrently, so URL doesn't exceed length limit.
+
+        Args:
+            ids (Iterable[int]):
+                Ids of reviews.
+
+            fields (Optional[List[str]]):
+                List of fields to show, `id` is always included. Omitting
+                this parameter or passing an empty value shows all fields.
+
+            chunk_size (int):
+                Maximal number of ids in one request (default: 100).
+
+        Returns:
+            Union[dict, Awaitable[dict]]: reviews by id in `reviews` key and
+            ids of reviews which don't exist or aren't visible to user in
+            `missing` key.
+        """
+        def callback(ids: List[int], found: Dict[int, dict]) -> dict:
+            return {
+                'reviews': {
+                    review_id: found[review_id] for review_id in ids if review_id in found
+                },
+                'missing': [review_id for review_id in ids if review_id not in found],
+            }
+
+        return self._get_many(ids, fields, chunk_size, callback, operation='Reviews.get_many')
+
     @minimal_version(9)
     def get_transitions(self,
                         review_id: int,
@@ -251,11 +452,28 @@ class Reviews:
         response = self.swarm._request(
             'GET',
             'reviews/{}/transitions'.format(review_id),
-            params=params
+            params=params,
+            operation='Reviews.get_transitions'
         )
 
         return response
 
+    @staticmethod
+    def _get_latest_revision_and_change(review: Optional[dict]) -> Tuple[int, int]:
+        if review is None or 'versions' not in review:
+            raise SwarmError('can`t find `versions` field in review data')
+
+        latest_revision = len(review['versions'])
+        if latest_revision == 0:
+            raise SwarmError('can`t get review revision, `versions` is empty')
+
+        latest_version = review['versions'][-1]
+        if 'change' not in latest_version:
+            raise SwarmError('no `change` field in latest versions block')
+
+        latest_change = int(latest_version['change'])
+        return latest_revision, latest_change
+
     def get_latest_revision_and_change(self, review_id: int) -> Tuple[int, int]:
         """
         Get latest revision and change (changelist) for a review.
@@ -268,30 +486,75 @@ class Reviews:
             Tuple[int, int]: revision and change respectively.
         """
         def callback(response: dict) -> Tuple[int, int]:
-            review = response.get('review')
-
-            if review is None or 'versions' not in review:
-                raise SwarmError('can`t find `versions` field in review data')
-
-            latest_revision = len(review['versions'])
-            if latest_revision == 0:
-                raise SwarmError('can`t get review revision, `versions` is empty')
-
-            latest_version = review['versions'][-1]
-            if 'change' not in latest_version:
-                raise SwarmError('no `change` field in latest versions block')
-
-            latest_change = int(latest_version['change'])
-            return latest_revision, latest_change
+            return self._get_latest_revision_and_change(response.get('review'))
 
         response = self._get_info(
             review_id,
             fields=['versions'],
-            callback=callback
+            callback=callback,
+            operation='Reviews.get_latest_revision_and_change'
         )
 
         return response  # type: ignore
 
+    def get_latest_revisions_and_changes(self,
+                                         review_ids: Iterable[int],
+                                         *,
+                                         chunk_size: int = IDS_CHUNK_SIZE
+                                         ) -> Union[dict, Awaitable[dict]]:
+        """
+        Get latest revision and change (changelist) for many reviews at once
+        using as few requests as possible.
+
+        Example:
+
+        .. code-block:: python
+
+            changes = client.reviews.get_latest_revisions_and_changes(review_ids)
+
+            for review_id, result in changes.items():
+                if isinstance(result, SwarmError):
+                    ...
+
+        Args:
+            review_ids (Iterable[int]):
+                Ids of reviews.
+
+            chunk_size (int):
+                Maximal number of ids in one request (default: 100).
+
+        Returns:
+            Union[dict, Awaitable[dict]]: revision and change by review id,
+            or `SwarmError` if they can't be got, for instance
+            `SwarmNotFoundError` if review doesn't exist.
+        """
+        def callback(ids: List[int],
+                     found: Dict[int, dict]
+                     ) -> Dict[int, Union[Tuple[int, int], SwarmError]]:
+            result = dict()  # type: Dict[int, Union[Tuple[int, int], SwarmError]]
+
+            for review_id in ids:
+                if review_id not in found:
+                    result[review_id] = SwarmNotFoundError(
+                        'Review {} not found'.format(review_id)
+                    )
+                    continue
+
+                try:
+                    result[review_id] = self._get_latest_revision_and_change(found[review_id])
+                except SwarmError as e:
+                    result[review_id] = e
+
+            return result
+
+        return self._get_many(
+            review_ids,
+            ['versions'],
+            chunk_size,
+            callback,
+            operation='Reviews.get_latest_revisions_and_changes'
+        )
+
     def create(self,
                change: int,
                *,
@@ -344,7 +607,7 @@ class Reviews:
                     'reviewer_groups field is supported from API version > 6'
                 )
 
-        return self.swarm._request('POST', 'reviews', json=data)
+        return self.swarm._request('POST', 'reviews', json=data, operation='Reviews.create')
 
     @minimal_version(9)
     def vote(self,
@@ -382,7 +645,8 @@ class Reviews:
         response = self.swarm._request(
             'POST',
             'reviews/{}/vote'.format(review_id),
-            data=data
+            data=data,
+            operation='Reviews.vote'
         )
 
         return response
@@ -420,7 +684,8 @@ class Reviews:
         response = self.swarm._request(
             'POST',
             'reviews/{}/changes/'.format(review_id),
-            data=data
+            data=data,
+            operation='Reviews.add_change'
         )
 
         return response
@@ -452,7 +717,12 @@ class Reviews:
             description=description
         )
 
-        return self.swarm._request('POST', 'reviews/archive', data=data)
+        return self.swarm._request(
+            'POST',
+            'reviews/archive',
+            data=data,
+            operation='Reviews.archive'
+        )
 
     def update(self,
                review_id: int,
@@ -489,7 +759,8 @@ class Reviews:
         response = self.swarm._request(
             'PATCH',
             'reviews/{}'.format(review_id),
-            data=data
+            data=data,
+            operation='Reviews.update'
         )
 
         return response
@@ -522,7 +793,8 @@ class Reviews:
         response = self.swarm._request(
             'POST',
             'reviews/{}/cleanup'.format(review_id),
-            data=data
+            data=data,
+            operation='Reviews.cleanup'
         )
 
         return response
@@ -541,7 +813,8 @@ class Reviews:
         """
         response = self.swarm._request(
             'POST',
-            'reviews/{}/obliterate'.format(review_id)
+            'reviews/{}/obliterate'.format(review_id),
+            operation='Reviews.obliterate'
         )
 
         return response
@@ -14,4 +14,4 @@ class Servers:
         Returns:
             dict: json response.
         """
-        return self.swarm._request('GET', 'servers')
+        return self.swarm._request('GET', 'servers', operation='Servers.get')
@@ -48,7 +48,7 @@ class Users:
         if group:
             params['group'] = group
 
-        return self.swarm._request('GET', 'users', params=params)
+        return self.swarm._request('GET', 'users', params=params, operation='Users.get')
 
     @minimal_version(9)
     def unfollow_all(self, name: str) -> dict:
@@ -64,4 +64,8 @@ class Users:
         Returns:
             dict: json response.
         """
-        return self.swarm._request('GET', 'users/{}/unfollowall'.format(name))
+        return self.swarm._request(
+            'GET',
+            'users/{}/unfollowall'.format(name),
+            operation='Users.unfollow_all'
+        )
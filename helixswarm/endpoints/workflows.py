@@ -38,7 +38,7 @@ class Workflows:
         if no_cache:
             params['noCache'] = no_cache
 
-        return self.swarm._request('GET', 'workflows', params=params)
+        return self.swarm._request('GET', 'workflows', params=params, operation='Workflows.get')
 
     @minimal_version(9)
     def get_info(self,
@@ -68,7 +68,8 @@ class Workflows:
         response = self.swarm._request(
             'GET',
             'workflows/{}'.format(identifier),
-            params=params
+            params=params,
+            operation='Workflows.get_info'
         )
 
         return response
@@ -150,7 +151,7 @@ class Workflows:
         if counted_votes:
             data['counted_votes'] = counted_votes
 
-        return self.swarm._request('POST', 'workflows', data=data)
+        return self.swarm._request('POST', 'workflows', data=data, operation='Workflows.create')
 
     @minimal_version(9)
     def edit(self,
@@ -239,7 +240,8 @@ class Workflows:
         response = self.swarm._request(
             'PATCH',
             'workflows/{}'.format(identifier),
-            data=data
+            data=data,
+            operation='Workflows.edit'
         )
 
         return response
@@ -258,7 +260,11 @@ class Workflows:
         Returns:
             dict: json response.
         """
-        return self.swarm._request('DELETE', 'workflows/{}'.format(identifier))
+        return self.swarm._request(
+            'DELETE',
+            'workflows/{}'.format(identifier),
+            operation='Workflows.delete'
+        )
 
     @minimal_version(9)
     def update(self,
@@ -346,7 +352,8 @@ class Workflows:
         response = self.swarm._request(
             'PUT',
             'workflows/{}'.format(identifier),
-            data=data
+            data=data,
+            operation='Workflows.update'
         )
 
         return response
@@ -20,3 +20,9 @@ class SwarmCompatibleError(SwarmError):
     """
     Raises when trying to use new API endpoints on old API version
     """
+
+
+class SwarmCircuitOpenError(SwarmError):
+    """
+    Raises when circuit breaker is open and request isn't sent
+    """
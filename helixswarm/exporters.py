@@ -0,0 +1,320 @@
+import socket
+import threading
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from helixswarm.breaker import CLOSED, HALF_OPEN, OPEN
+from helixswarm.cache import ResponseCache
+from helixswarm.metrics import DEFAULT_BUCKETS, RequestInfo
+
+# content type of rendered Prometheus metrics
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+CIRCUIT_STATES = (CLOSED, OPEN, HALF_OPEN)
+
+
+def get_labels(info: RequestInfo) -> Tuple[str, str]:
+    """
+    Get endpoint class and method name of request, for instance
+    `('Reviews', 'get_info')`, HTTP method is used if operation is unknown.
+    """
+    if info.operation is not None:
+        endpoint, _, method = info.operation.partition('.')
+        return endpoint, method
+
+    return ResponseCache.get_endpoint(info.path).capitalize(), info.method
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _format_labels(**labels: str) -> str:
+    return ','.join(
+        '{}="{}"'.format(name, _escape(value)) for name, value in labels.items()
+    )
+
+
+class PrometheusExporter:
+    """
+    Client hook collecting request rate, errors and duration per endpoint
+    class and method, rendered in Prometheus text format.
+
+    Hook only appends request to a queue, requests are aggregated when
+    metrics are rendered or queue grows over `max_pending`, so requests are
+    not blocked by each other or by scraping.
+
+    Example:
+
+    .. code-block:: python
+
+        exporter = PrometheusExporter()
+        client = SwarmAsyncClient(url, user, password, hooks=[exporter])
+        ...
+        # in handler of /metrics
+        return web.Response(
+            body=exporter.render(),
+            headers={'Content-Type': PROMETHEUS_CONTENT_TYPE},
+        )
+
+    Args:
+        namespace (Optional[str]): prefix of metric names.
+            Default: `helixswarm`
+        buckets (Optional[Tuple[float, ...]]): upper bounds of duration
+            histogram buckets in seconds.
+        max_pending (Optional[int]): how many requests can be queued before
+            they are aggregated by hook itself.
+            Default: 10000
+    """
+
+    def __init__(self,
+                 *,
+                 namespace: str = 'helixswarm',
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+                 max_pending: int = 10000
+                 ) -> None:
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self.max_pending = max_pending
+
+        # deque append and popleft are atomic, so they don't need lock
+        self._pending = deque()  # type: Deque[Tuple[str, str, str, float, Optional[str]]]
+        self._lock = threading.Lock()
+
+        self._requests = dict()  # type: Dict[Tuple[str, str, str], int]
+        self._errors = dict()  # type: Dict[Tuple[str, str, str], int]
+        self._durations = dict()  # type: Dict[Tuple[str, str], List[int]]
+        self._duration_sums = dict()  # type: Dict[Tuple[str, str], float]
+        self._concurrency_limit = None  # type: Optional[int]
+        self._circuit_state = None  # type: Optional[str]
+
+    def __call__(self, info: RequestInfo) -> None:
+        endpoint, method = get_labels(info)
+        error = None if info.error is None else type(info.error).__name__
+        status = 'none' if info.status is None else str(info.status)
+
+        self._pending.append((endpoint, method, status, info.elapsed, error))
+
+        if info.concurrency_limit is not None:
+            self._concurrency_limit = info.concurrency_limit
+
+        if info.circuit_state is not None:
+            self._circuit_state = info.circuit_state
+
+        if len(self._pending) <= self.max_pending:
+            return
+
+        # hook doesn't wait if another thread is aggregating, so `with` isn't used
+        if self._lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+            try:
+                self._aggregate()
+            finally:
+                self._lock.release()
+
+    def _aggregate(self) -> None:
+        while True:
+            try:
+                endpoint, method, status, elapsed, error = self._pending.popleft()
+            except IndexError:
+                break
+
+            self._requests[(endpoint, method, status)] = \
+                self._requests.get((endpoint, method, status), 0) + 1
+
+            if error is not None:
+                self._errors[(endpoint, method, error)] = \
+                    self._errors.get((endpoint, method, error), 0) + 1
+
+            # cumulative bucket counts, then count of all durations
+            key = (endpoint, method)
+            counts = self._durations.get(key)
+            if counts is None:
+                counts = self._durations[key] = [0] * (len(self.buckets) + 1)
+
+            for index, bound in enumerate(self.buckets):
+                if elapsed <= bound:
+                    counts[index] += 1
+
+            counts[-1] += 1
+            self._duration_sums[key] = self._duration_sums.get(key, 0.0) + elapsed
+
+    def render(self) -> str:
+        """
+        Get metrics in Prometheus text format.
+
+        Returns:
+            str: metrics.
+        """
+        requests = self.namespace + '_requests_total'
+        errors = self.namespace + '_request_errors_total'
+        duration = self.namespace + '_request_duration_seconds'
+        concurrency = self.namespace + '_concurrency_limit'
+        circuit = self.namespace + '_circuit_state'
+
+        with self._lock:
+            self._aggregate()
+
+            lines = [
+                '# HELP {} Requests made to Swarm server.'.format(requests),
+                '# TYPE {} counter'.format(requests),
+            ]
+
+            for (endpoint, method, status), count in sorted(self._requests.items()):
+                lines.append('{}{{{}}} {}'.format(
+                    requests,
+                    _format_labels(endpoint=endpoint, method=method, status=status),
+                    count,
+                ))
+
+            lines += [
+                '# HELP {} Requests failed with exception.'.format(errors),
+                '# TYPE {} counter'.format(errors),
+            ]
+
+            for (endpoint, method, error), count in sorted(self._errors.items()):
+                lines.append('{}{{{}}} {}'.format(
+                    errors,
+                    _format_labels(endpoint=endpoint, method=method, error=error),
+                    count,
+                ))
+
+            lines += [
+                '# HELP {} Request duration including retries.'.format(duration),
+                '# TYPE {} histogram'.format(duration),
+            ]
+
+            for (endpoint, method), counts in sorted(self._durations.items()):
+                labels = _format_labels(endpoint=endpoint, method=method)
+
+                for bound, count in zip(self.buckets, counts):
+                    lines.append('{}_bucket{{{},le="{}"}} {}'.format(
+                        duration, labels, bound, count
+                    ))
+
+                lines += [
+                    '{}_bucket{{{},le="+Inf"}} {}'.format(duration, labels, counts[-1]),
+                    '{}_sum{{{}}} {}'.format(
+                        duration, labels, self._duration_sums[(endpoint, method)]
+                    ),
+                    '{}_count{{{}}} {}'.format(duration, labels, counts[-1]),
+                ]
+
+            if self._concurrency_limit is not None:
+                lines += [
+                    '# HELP {} Adaptive concurrency window.'.format(concurrency),
+                    '# TYPE {} gauge'.format(concurrency),
+                    '{} {}'.format(concurrency, self._concurrency_limit),
+                ]
+
+            if self._circuit_state is not None:
+                lines += [
+                    '# HELP {} Circuit breaker state.'.format(circuit),
+                    '# TYPE {} gauge'.format(circuit),
+                ]
+
+                for state in CIRCUIT_STATES:
+                    lines.append('{}{{{}}} {}'.format(
+                        circuit,
+                        _format_labels(state=state),
+                        int(state == self._circuit_state),
+                    ))
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._requests.clear()
+            self._errors.clear()
+            self._durations.clear()
+            self._duration_sums.clear()
+            self._concurrency_limit = None
+            self._circuit_state = None
+
+
+class UdpSink:
+    """
+    Send StatsD packets over UDP, sending errors are ignored, so metrics
+    never break requests.
+    """
+
+    def __init__(self, host: str = 'localhost', port: int = 8125) -> None:
+        family, _, _, _, address = socket.getaddrinfo(host, port, type=socket.SOCK_DGRAM)[0]
+
+        self.address = address  # type: Any
+        self.socket = socket.socket(family, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+
+    def __call__(self, packet: bytes) -> None:
+        try:
+            self.socket.sendto(packet, self.address)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self.socket.close()
+
+
+class StatsdExporter:
+    """
+    Client hook sending request count, errors and duration per endpoint class
+    and method to StatsD, for instance:
+
+    .. code-block:: text
+
+        helixswarm.reviews.get_info.requests:1|c
+        helixswarm.reviews.get_info.status.200:1|c
+        helixswarm.reviews.get_info.duration:12.345|ms
+
+    Args:
+        host (Optional[str]): StatsD host.
+            Default: `localhost`
+        port (Optional[int]): StatsD port.
+            Default: 8125
+        prefix (Optional[str]): prefix of metric names.
+            Default: `helixswarm`
+        sink (Optional[Callable[[bytes], None]]): function sending packet,
+            by default it's sent over UDP to host and port.
+    """
+
+    def __init__(self,
+                 host: str = 'localhost',
+                 port: int = 8125,
+                 *,
+                 prefix: str = 'helixswarm',
+                 sink: Optional[Callable[[bytes], None]] = None
+                 ) -> None:
+        self.prefix = prefix
+        self.sink = UdpSink(host, port) if sink is None else sink
+
+    def close(self) -> None:
+        """
+        Close socket of default UDP sink, custom sink is left as is.
+        """
+        if isinstance(self.sink, UdpSink):
+            self.sink.close()
+
+    def __call__(self, info: RequestInfo) -> None:
+        endpoint, method = get_labels(info)
+        name = '{}.{}.{}'.format(self.prefix, endpoint.lower(), method.lower())
+
+        lines = ['{}.requests:1|c'.format(name)]
+
+        if info.status is not None:
+            lines.append('{}.status.{}:1|c'.format(name, info.status))
+
+        if info.error is not None:
+            lines.append('{}.errors:1|c'.format(name))
+
+        lines.append('{}.duration:{:.3f}|ms'.format(name, info.elapsed * 1000))
+
+        if info.concurrency_limit is not None:
+            lines.append('{}.concurrency_limit:{}|g'.format(self.prefix, info.concurrency_limit))
+
+        if info.circuit_state is not None:
+            lines.append('{}.circuit_open:{}|g'.format(
+                self.prefix, int(info.circuit_state != CLOSED)
+            ))
+
+        self.sink('\n'.join(lines).encode())
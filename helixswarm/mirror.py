@@ -0,0 +1,291 @@
+import json
+import re
+import sqlite3
+import threading
+
+from typing import Any, Iterable, List, Optional, Set
+
+from helixswarm.adapters.sync import SwarmClient
+from helixswarm.exceptions import SwarmError
+
+# activity entry belongs to review if it's topic or one of its streams
+REVIEW_TOPIC = re.compile(r'^reviews/(\d+)')
+REVIEW_STREAM = re.compile(r'^review-(\d+)$')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS reviews (
+    id INTEGER PRIMARY KEY,
+    author TEXT,
+    state TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reviews_author ON reviews (author);
+CREATE INDEX IF NOT EXISTS reviews_state ON reviews (state);
+
+CREATE TABLE IF NOT EXISTS review_projects (
+    project TEXT NOT NULL,
+    review_id INTEGER NOT NULL,
+    PRIMARY KEY (project, review_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS review_projects_review ON review_projects (review_id);
+
+CREATE TABLE IF NOT EXISTS review_participants (
+    participant TEXT NOT NULL,
+    review_id INTEGER NOT NULL,
+    PRIMARY KEY (participant, review_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS review_participants_review ON review_participants (review_id);
+
+CREATE TABLE IF NOT EXISTS mirror_state (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+'''
+
+
+def get_review_ids(activity: dict) -> Set[int]:
+    """
+    Get ids of reviews affected by activity entry, for instance review
+    update or comment on review.
+    """
+    ids = set()
+
+    match = REVIEW_TOPIC.match(activity.get('topic') or '')
+    if match:
+        ids.add(int(match.group(1)))
+
+    for stream in activity.get('streams') or []:
+        match = REVIEW_STREAM.match(stream)
+        if match:
+            ids.add(int(match.group(1)))
+
+    return ids
+
+
+class ReviewMirror:
+    """
+    Local SQLite mirror of reviews, so frequent queries by author, project,
+    state and participant are answered without requests to Swarm server.
+
+    The first `sync()` loads all reviews page by page, the next ones read
+    activity stream since the last seen entry and request again only reviews
+    mentioned there, reviews which are not returned anymore are removed.
+
+    Example:
+
+    .. code-block:: python
+
+        mirror = ReviewMirror(client, 'reviews.db')
+        mirror.sync()
+
+        reviews = mirror.get(projects=['swarm'], states=['needsReview'])
+
+    Args:
+        client (SwarmClient): sync client used to fetch reviews.
+        path (str): database file, by default it's kept in memory.
+        page_size (int): number of reviews and activity entries requested
+            at once.
+            Default: 100
+    """
+
+    def __init__(self,
+                 client: SwarmClient,
+                 path: str = ':memory:',
+                 *,
+                 page_size: int = 100
+                 ) -> None:
+        if not isinstance(client, SwarmClient):
+            raise SwarmError('ReviewMirror supports only SwarmClient')
+
+        if page_size <= 0:
+            raise SwarmError('Invalid `page_size` argument must be > 0')
+
+        self.client = client
+        self.page_size = page_size
+
+        # queries can be made from other threads than sync
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+
+    @property
+    def last_activity(self) -> Optional[int]:
+        """
+        Id of the last applied activity entry, None before the first sync.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM mirror_state WHERE key = 'last_activity'"
+            ).fetchone()
+
+        return None if row is None else row[0]
+
+    def sync(self) -> int:
+        """
+        Update mirror from Swarm server.
+
+        Returns:
+            int: number of stored or removed reviews.
+        """
+        last_activity = self.last_activity
+
+        if last_activity is None:
+            return self._load()
+
+        return self._update(last_activity)
+
+    def get(self,
+            *,
+            authors: Optional[List[str]] = None,
+            projects: Optional[List[str]] = None,
+            states: Optional[List[str]] = None,
+            participants: Optional[List[str]] = None,
+            limit: Optional[int] = None
+            ) -> List[dict]:
+        """
+        Get reviews matching all given filters from mirror, newest first.
+
+        Args:
+            authors (Optional[List[str]]):
+                Reviews by any of these authors.
+
+            projects (Optional[List[str]]):
+                Reviews affecting any of these projects.
+
+            states (Optional[List[str]]):
+                Reviews in any of these states, for instance `needsReview`.
+
+            participants (Optional[List[str]]):
+                Reviews with any of these participants.
+
+            limit (Optional[int]):
+                Maximum number of reviews to return.
+
+        Returns:
+            List[dict]: reviews as returned by Swarm.
+        """
+        conditions = []
+        args = []  # type: List[Any]
+
+        for column, values in (('author', authors), ('state', states)):
+            if values:
+                conditions.append('{} IN ({})'.format(column, ','.join('?' * len(values))))
+                args += values
+
+        for table, column, values in (('review_projects', 'project', projects),
+                                      ('review_participants', 'participant', participants)):
+            if values:
+                conditions.append('id IN (SELECT review_id FROM {} WHERE {} IN ({}))'.format(
+                    table, column, ','.join('?' * len(values))
+                ))
+                args += values
+
+        query = 'SELECT data FROM reviews'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY id DESC'
+
+        if limit is not None:
+            query += ' LIMIT ?'
+            args.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(query, args).fetchall()
+
+        return [json.loads(data) for data, in rows]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _load(self) -> int:
+        # remember position in activity stream before loading, so changes
+        # made during load are applied by the next sync
+        response = self.client.activities.get(limit=1)
+        activity = response.get('activity') or []
+        last_activity = activity[0]['id'] if activity else 0
+
+        count = 0
+        page = []
+
+        # sync client returns values, not awaitables
+        for review in self.client.reviews.iter(limit=self.page_size):  # type: ignore
+            page.append(review)
+            if len(page) >= self.page_size:
+                count += self._store(page, ())
+                page = []
+
+        count += self._store(page, (), last_activity)
+        return count
+
+    def _update(self, last_activity: int) -> int:
+        review_ids = set()  # type: Set[int]
+        newest = last_activity
+
+        # activity stream is returned newest first
+        for activity in self.client.activities.iter(limit=self.page_size):  # type: ignore
+            if activity['id'] <= last_activity:
+                break
+
+            newest = max(newest, activity['id'])
+            review_ids |= get_review_ids(activity)
+
+        if not review_ids:
+            return self._store([], (), newest)
+
+        response = self.client.reviews.get_many(sorted(review_ids), chunk_size=self.page_size)
+        return self._store(
+            list(response['reviews'].values()),  # type: ignore
+            response['missing'],  # type: ignore
+            newest
+        )
+
+    def _store(self,
+               reviews: List[dict],
+               removed: Iterable[int],
+               last_activity: Optional[int] = None
+               ) -> int:
+        removed = list(removed)
+
+        with self._lock, self._connection:
+            cursor = self._connection.cursor()
+
+            ids = [(review['id'],) for review in reviews] + [(i,) for i in removed]
+            cursor.executemany('DELETE FROM review_projects WHERE review_id = ?', ids)
+            cursor.executemany('DELETE FROM review_participants WHERE review_id = ?', ids)
+            cursor.executemany('DELETE FROM reviews WHERE id = ?', [(i,) for i in removed])
+
+            cursor.executemany(
+                'INSERT OR REPLACE INTO reviews (id, author, state, data) VALUES (?, ?, ?, ?)',
+                [
+                    (review['id'], review.get('author'), review.get('state'), json.dumps(review))
+                    for review in reviews
+                ]
+            )
+
+            # projects are object of branches and participants are object of
+            # votes in recent API versions, lists in old ones
+            cursor.executemany(
+                'INSERT OR IGNORE INTO review_projects (project, review_id) VALUES (?, ?)',
+                [
+                    (project, review['id'])
+                    for review in reviews for project in review.get('projects') or []
+                ]
+            )
+
+            cursor.executemany(
+                'INSERT OR IGNORE INTO review_participants (participant, review_id) VALUES (?, ?)',
+                [
+                    (participant, review['id'])
+                    for review in reviews for participant in review.get('participants') or []
+                ]
+            )
+
+            if last_activity is not None:
+                cursor.execute(
+                    "INSERT OR REPLACE INTO mirror_state (key, value) VALUES ('last_activity', ?)",
+                    (last_activity,)
+                )
+
+        return len(reviews) + len(removed)
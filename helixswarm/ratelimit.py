@@ -0,0 +1,123 @@
+import threading
+import time
+
+from typing import Dict, Optional
+
+from helixswarm.cache import ResponseCache
+
+
+class RateLimiter:
+    """
+    Token bucket limiting rate of requests sent to server. Bucket holds up
+    to `burst` tokens and is refilled with `rate` tokens per second, each
+    request takes tokens by weight of its endpoint.
+
+    Tokens are reserved under a short lock and caller sleeps outside of it,
+    so limiter is shared safely by threads of sync client and never blocks
+    event loop of async client. Waiting callers are served in order of
+    arrival at exactly `rate` once bucket is empty.
+
+    Attributes:
+        throttled (int): number of requests which had to wait.
+    """
+
+    def __init__(self,
+                 *,
+                 rate: float,
+                 burst: Optional[float] = None,
+                 weights: Optional[Dict[str, float]] = None
+                 ) -> None:
+        self.rate = rate
+        self.burst = rate if burst is None else burst
+        self.weights = weights or {}
+        self.throttled = 0
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def get_weight(self, path: str) -> float:
+        return self.weights.get(ResponseCache.get_endpoint(path), 1)
+
+    def reserve(self, tokens: float) -> float:
+        """
+        Take tokens from bucket, it may be left in debt.
+
+        Returns:
+            float: seconds to wait before request can be sent.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+
+            if self._tokens >= 0:
+                return 0.0
+
+            self.throttled += 1
+            return -self._tokens / self.rate
+
+    def try_acquire(self, path: str) -> bool:
+        """
+        Take tokens for request to path only if they are available now, for
+        optional requests which are skipped rather than delayed.
+
+        Returns:
+            bool: True if request can be sent.
+        """
+        tokens = self.get_weight(path)
+
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+
+            self._tokens -= tokens
+            return True
+
+    def refund(self, tokens: float) -> None:
+        """
+        Return tokens of request which wasn't sent.
+        """
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + tokens)
+
+    def acquire(self, path: str) -> float:
+        """
+        Wait until request to path can be sent.
+
+        Returns:
+            float: seconds waited.
+        """
+        delay = self.reserve(self.get_weight(path))
+        if delay:
+            time.sleep(delay)
+
+        return delay
+
+    async def acquire_async(self, path: str) -> float:
+        """
+        Wait until request to path can be sent without blocking event loop.
+
+        Returns:
+            float: seconds waited.
+        """
+        # only async client needs asyncio, sync one doesn't pay for its import
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        tokens = self.get_weight(path)
+
+        delay = self.reserve(tokens)
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.refund(tokens)
+                raise
+
+        return delay
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
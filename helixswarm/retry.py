@@ -0,0 +1,112 @@
+import random
+import time
+
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterable, Optional
+
+# idempotent methods which are safe to repeat
+DEFAULT_METHODS = ('DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE')
+
+# seconds, upper bound of sleep between attempts
+DEFAULT_MAX_SLEEP = 60.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Get seconds to wait from `Retry-After` header, it's either number of
+    seconds or HTTP date, None if it's missing or malformed.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, date.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Retry policy shared by sync and async clients, so both of them retry the
+    same way.
+
+    Sleep before retry is random between zero and exponentially growing
+    bound `factor * 2 ** retry` limited by `max_sleep` (full jitter), so
+    clients failed at the same moment don't retry together. If server sends
+    `Retry-After` header its value is used instead. Retry isn't made if
+    sleep would exceed `max_sleep` or `deadline` of the whole call.
+    """
+
+    def __init__(self,
+                 *,
+                 total: int,
+                 factor: float = 1,
+                 statuses: Iterable[int] = (),
+                 methods: Iterable[str] = DEFAULT_METHODS,
+                 max_sleep: float = DEFAULT_MAX_SLEEP,
+                 deadline: Optional[float] = None
+                 ) -> None:
+        self.total = total
+        self.factor = factor
+        self.statuses = list(statuses)
+        self.methods = [method.upper() for method in methods]
+        self.max_sleep = max_sleep
+        self.deadline = deadline
+
+    def get_backoff(self, retry: int) -> float:
+        return random.uniform(0, min(self.max_sleep, self.factor * 2 ** retry))
+
+    def get_delay(self,
+                  method: str,
+                  retry: int,
+                  started: float,
+                  *,
+                  status: Optional[int] = None,
+                  headers: Optional[Any] = None
+                  ) -> Optional[float]:
+        """
+        Get seconds to sleep before next attempt.
+
+        Args:
+            method (str):
+                HTTP method of request.
+
+            retry (int):
+                Number of retries already made.
+
+            started (float):
+                Time of first attempt, `time.monotonic()`.
+
+            status (Optional[int]):
+                HTTP status of failed attempt, None if it raised exception.
+
+            headers (Optional[Any]):
+                Response headers of failed attempt.
+
+        Returns:
+            Optional[float]: seconds to sleep, None if request must not be
+            retried.
+        """
+        if retry >= self.total or method.upper() not in self.methods:
+            return None
+
+        if status is not None and status not in self.statuses:
+            return None
+
+        delay = parse_retry_after(headers.get('Retry-After') if headers else None)
+        if delay is None:
+            delay = self.get_backoff(retry)
+        elif delay > self.max_sleep:
+            return None
+
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            return None
+
+        return delay
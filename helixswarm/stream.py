@@ -0,0 +1,238 @@
+import codecs
+import json
+import re
+
+from typing import Any, Dict, List
+
+from helixswarm.exceptions import SwarmError
+
+# bytes read from response at once while streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# number starts with one of the first characters and may be continued by
+# the others in the next chunk, for instance `1.` of `1.5` or `1e` of `1e3`
+NUMBER_START = frozenset('-0123456789')
+NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+_decoder = json.JSONDecoder()
+
+
+class _Incomplete(Exception):
+    """
+    More data is needed to decode value
+    """
+
+
+class ItemParser:
+    """
+    Incremental parser of JSON object response which yields items of its
+    `key` array as soon as they are received, other values of the object,
+    such as `lastSeen`, are stored in `fields`. Comments are returned as
+    object keyed by comment id, then its values are yielded.
+
+    Whole response is never kept in memory, only not parsed yet part of it,
+    so peak memory doesn't depend on page size.
+
+    Attributes:
+        fields (Dict[str, Any]): values of the object except items.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.fields = dict()  # type: Dict[str, Any]
+
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._state = 'start'
+        self._field = ''
+        self._closing = ''
+        self._final = False
+        self._items = []  # type: List[Any]
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parse next chunk of response.
+
+        Args:
+            chunk (bytes):
+                Part of response body.
+
+        Returns:
+            List[Any]: items completed by chunk.
+        """
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+
+        return self._parse(False)
+
+    def close(self) -> List[Any]:
+        """
+        Parse rest of response after it's fully received.
+
+        Returns:
+            List[Any]: remaining items.
+        """
+        self._buffer = self._buffer[self._pos:] + self._text.decode(b'', final=True)
+        self._pos = 0
+
+        items = self._parse(True)
+
+        if self._state != 'end':
+            raise SwarmError('Incomplete JSON response')
+
+        return items
+
+    def _next_char(self) -> str:
+        self._pos = WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore
+        return self._buffer[self._pos:self._pos + 1]
+
+    def _expect(self, expected: str) -> str:
+        char = self._next_char()
+        if char and char not in expected:
+            raise SwarmError('Invalid JSON response, unexpected {!r}'.format(char))
+
+        self._pos += len(char)
+        return char
+
+    def _decode(self) -> Any:
+        """
+        Decode value at current position, value at the end of buffer or
+        number followed by its characters may be not received completely.
+        """
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except ValueError as e:
+            if self._final:
+                raise SwarmError from e
+            raise _Incomplete from e
+
+        if not self._final:
+            if end == len(self._buffer):
+                raise _Incomplete
+
+            if self._buffer[self._pos] in NUMBER_START and self._buffer[end] in NUMBER_CHARS:
+                raise _Incomplete
+
+        self._pos = end
+        return value
+
+    def _parse(self, final: bool) -> List[Any]:
+        self._final = final
+        self._items = []
+
+        # every state handler returns False when more data is needed
+        handlers = {
+            'start': self._parse_start,
+            'first_field': self._parse_field,
+            'field': self._parse_field,
+            'colon': self._parse_colon,
+            'item_colon': self._parse_colon,
+            'value': self._parse_value,
+            'field_end': self._parse_field_end,
+            'first_item': self._parse_item,
+            'item': self._parse_item,
+            'item_value': self._parse_item_value,
+            'item_end': self._parse_item_end,
+            'end': self._parse_end,
+        }
+
+        try:
+            while handlers[self._state]():
+                pass
+        except _Incomplete:
+            pass
+
+        return self._items
+
+    def _parse_start(self) -> bool:
+        if not self._expect('{'):
+            return False
+
+        self._state = 'first_field'
+        return True
+
+    def _parse_field(self) -> bool:
+        char = self._next_char()
+        if not char:
+            return False
+
+        if char == '}' and self._state == 'first_field':
+            self._pos += 1
+            self._state = 'end'
+        else:
+            self._field = self._decode()
+            self._state = 'colon'
+
+        return True
+
+    def _parse_colon(self) -> bool:
+        if not self._expect(':'):
+            return False
+
+        self._state = 'value' if self._state == 'colon' else 'item_value'
+        return True
+
+    def _parse_value(self) -> bool:
+        char = self._next_char()
+        if not char:
+            return False
+
+        if self._field == self.key and char in '[{':
+            self._closing = ']' if char == '[' else '}'
+            self._pos += 1
+            self._state = 'first_item'
+        else:
+            self.fields[self._field] = self._decode()
+            self._state = 'field_end'
+
+        return True
+
+    def _parse_field_end(self) -> bool:
+        char = self._expect(',}')
+        if not char:
+            return False
+
+        self._state = 'field' if char == ',' else 'end'
+        return True
+
+    def _parse_item(self) -> bool:
+        char = self._next_char()
+        if not char:
+            return False
+
+        if char == self._closing and self._state == 'first_item':
+            self._pos += 1
+            self._state = 'field_end'
+        elif self._closing == '}':
+            # key of object item isn't needed
+            self._decode()
+            self._state = 'item_colon'
+        else:
+            self._state = 'item_value'
+
+        return True
+
+    def _parse_item_value(self) -> bool:
+        if not self._next_char():
+            return False
+
+        self._items.append(self._decode())
+        self._state = 'item_end'
+        return True
+
+    def _parse_item_end(self) -> bool:
+        char = self._expect(',' + self._closing)
+        if not char:
+            return False
+
+        self._state = 'item' if char == ',' else 'field_end'
+        return True
+
+    def _parse_end(self) -> bool:
+        if self._next_char():
+            raise SwarmError('Invalid JSON response, extra data')
+
+        return False
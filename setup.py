@@ -44,6 +44,7 @@ setup_args = dict(
 )
 
 install_requires = [
+    # get_pool_usage of async client reads connector internals of aiohttp 3
     'aiohttp>=3.6.2,<4',
     'requests>=2.24.0,<3.0.0',
     'urllib3>=1.26,<3',
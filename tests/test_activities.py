@@ -56,6 +56,27 @@ def test_activity_get():
     assert 'activity' in response
 
 
+@responses.activate
+def test_activity_iter():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/activity?.*'),
+        json={'activity': [{'id': 620}, {'id': 619}], 'lastSeen': 619}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/activity?.*'),
+        json={'activity': [], 'lastSeen': None}
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password')
+
+    activity = list(client.activities.iter(stream='review-290', limit=2))
+    assert [entry['id'] for entry in activity] == [620, 619]
+    assert 'after=619' in responses.calls[1].request.url
+
+
 @responses.activate
 def test_activity_create():
     data = {
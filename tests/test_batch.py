@@ -0,0 +1,90 @@
+import asyncio
+import gc
+import re
+
+import pytest
+
+from aioresponses import CallbackResult
+
+from helixswarm import SwarmAsyncClient, SwarmError, SwarmNotFoundError
+
+
+@pytest.mark.asyncio
+async def test_get_info_batch(aiohttp_mock):
+    infos = []
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        batch_reviews=dict(window=0.01, size=3),
+        hooks=[infos.append],
+    )
+
+    queries = []
+
+    async def callback(url, **_kwargs):
+        queries.append(url.raw_query_string)
+
+        # review 3 doesn't exist
+        ids = [int(review_id) for review_id in url.query.getall('ids[]')]
+        return CallbackResult(payload={
+            'reviews': [{'id': review_id} for review_id in ids if review_id != 3]
+        })
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews\?.*'), callback=callback, repeat=True)
+
+    results = await asyncio.gather(
+        client.reviews.get_info(1, fields=['state']),
+        client.reviews.get_info(1, fields=['state']),
+        client.reviews.get_info(2),
+        client.reviews.get_info(3),
+        client.reviews.get_info(4),
+        client.reviews.get_info(5),
+        return_exceptions=True,
+    )
+
+    # size limit splits reviews without fields, 1 is requested with fields
+    assert len(queries) == 3
+    assert client.review_batcher.batches == 3
+    assert queries[0] == 'ids%5B%5D=2&ids%5B%5D=3&ids%5B%5D=4&max=3'
+
+    assert results[0] == results[1] == {'review': {}}
+    assert results[0]['review'] is not results[1]['review']
+    assert results[2] == {'review': {'id': 2}}
+    assert isinstance(results[3], SwarmNotFoundError)
+    assert results[5] == {'review': {'id': 5}}
+
+    # batch requests are reported as calls they serve
+    assert [info.operation for info in infos] == ['Reviews.get_info'] * 3
+
+    with pytest.raises(SwarmError):
+        SwarmAsyncClient('http://server/api/v9', 'user', 'password', batch_reviews=dict(size=0))
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_info_batch_task_referenced(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', batch_reviews={})
+    received = asyncio.Event()
+    release = asyncio.Event()
+
+    async def callback(_url, **_kwargs):
+        received.set()
+        await release.wait()
+        return CallbackResult(payload={'reviews': [{'id': 1}]})
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews\?.*'), callback=callback)
+
+    call = asyncio.ensure_future(client.reviews.get_info(1))
+    await received.wait()
+
+    # batch request in flight is kept by batcher, not only by event loop
+    assert len(client.review_batcher._tasks) == 1
+    gc.collect()
+
+    release.set()
+    assert await call == {'review': {'id': 1}}
+    assert not client.review_batcher._tasks
+
+    await client.close()
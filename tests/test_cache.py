@@ -0,0 +1,280 @@
+import json
+import re
+
+import pytest
+import responses
+
+from aioresponses import CallbackResult
+
+from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from helixswarm.cache import ResponseCache
+
+PROJECTS_DATA = {
+    'projects': [
+        {'id': 'testproject1', 'name': 'TestProject 1'},
+        {'id': 'testproject2', 'name': 'TestProject 2'}
+    ]
+}
+
+
+def test_cache_argument_validation():
+    with pytest.raises(SwarmError):
+        SwarmClient('http://server/api/v9', 'user', 'password', cache=dict(strange=1))
+
+    with pytest.raises(SwarmError):
+        SwarmClient('http://server/api/v9', 'user', 'password', cache=dict(size=0))
+
+
+def test_cache_lru_and_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('helixswarm.cache.time.monotonic', lambda: now[0])
+
+    cache = ResponseCache(size=2, ttl={'projects': 10})
+    assert cache.get_ttl('projects/swarm') == 10
+    assert cache.get_ttl('reviews/1') is None
+
+    for i in range(3):
+        cache.set(cache.make_key('GET', 'projects/{}'.format(i), None), {'id': i}, 10)
+
+    # first one is evicted as least recently used
+    assert len(cache) == 2
+    assert cache.get(cache.make_key('GET', 'projects/0', None)) is None
+    assert cache.get(cache.make_key('GET', 'projects/1', None)) == {'id': 1}
+
+    now[0] += 11
+    assert cache.get(cache.make_key('GET', 'projects/1', None)) is None
+
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_cache_key():
+    key1 = ResponseCache.make_key('get', '/projects', {'fields': 'id', 'workflow': [1, 2]})
+    key2 = ResponseCache.make_key('GET', 'projects', {'workflow': [1, 2], 'fields': 'id'})
+    assert key1 == key2
+    assert hash(key1) == hash(key2)
+
+
+@responses.activate
+def test_cache_hit_and_invalidate():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/projects'),
+        json=PROJECTS_DATA
+    )
+
+    responses.add(
+        responses.PATCH,
+        re.compile(r'.*/api/v\d+/projects/testproject1'),
+        json={'project': {'id': 'testproject1'}}
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password', cache={})
+
+    response = client.projects.get()
+    response['projects'].clear()
+
+    # cached value is not affected by caller changes
+    response = client.projects.get()
+    assert len(response['projects']) == 2
+    assert len(responses.calls) == 1
+
+    # other parameters are cached separately
+    client.projects.get(fields=['id'])
+    assert len(responses.calls) == 2
+
+    client.projects.edit('testproject1', name='New name', members=['bruno'])
+    client.projects.get()
+    assert len(responses.calls) == 4
+
+    assert client.cache.hits == 1
+    assert client.cache.misses == 3
+
+
+@responses.activate
+def test_cache_disabled_for_endpoint():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        json={'review': {'id': 1}}
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password', cache={})
+
+    client.reviews.get_info(1)
+    client.reviews.get_info(1)
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_cache(aiohttp_mock):
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        cache=dict(ttl={'projects': 60}),
+    )
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/projects'), payload=PROJECTS_DATA)
+
+    response = await client.projects.get()
+    assert len(response['projects']) == 2
+
+    response = await client.projects.get()
+    assert len(response['projects']) == 2
+
+    assert client.cache.hits == 1
+    assert client.cache.misses == 1
+
+    await client.close()
+
+
+def test_revalidate_argument_validation():
+    with pytest.raises(SwarmError):
+        SwarmClient('http://server/api/v9', 'user', 'password', revalidate=dict(ttl=1))
+
+    with pytest.raises(SwarmError):
+        SwarmClient('http://server/api/v9', 'user', 'password', revalidate=dict(size=0))
+
+
+@responses.activate
+def test_revalidate():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        json={'review': {'id': 1}},
+        headers={'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        status=304
+    )
+
+    decoded = []
+
+    def json_loads(body):
+        decoded.append(body)
+        return json.loads(body)
+
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        revalidate={},
+        json_loads=json_loads,
+    )
+
+    response = client.reviews.get_info(1)
+    response['review']['id'] = 2
+
+    response = client.reviews.get_info(1)
+    assert response == {'review': {'id': 1}}
+
+    assert 'If-None-Match' not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+    assert responses.calls[1].request.headers['If-Modified-Since'] == \
+        'Wed, 21 Oct 2015 07:28:00 GMT'
+
+    # stored body is decoded again instead of being downloaded
+    assert len(decoded) == 2
+    assert decoded[0] == decoded[1]
+    assert client.validators.revalidated == 1
+
+
+@responses.activate
+def test_revalidate_evicted():
+    client = SwarmClient('http://server/api/v9', 'user', 'password', revalidate={})
+    validators = []
+
+    def callback(request):
+        validators.append(request.headers.get('If-None-Match'))
+
+        if len(validators) == 2:
+            # stored response is evicted while conditional request is in flight
+            client.validators.clear()
+            return 304, {}, ''
+
+        headers = {'ETag': '"v{}"'.format(len(validators))}
+        return 200, headers, json.dumps({'review': {'id': 1}})
+
+    responses.add_callback(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        callback=callback,
+    )
+
+    assert client.reviews.get_info(1) == {'review': {'id': 1}}
+    assert client.reviews.get_info(1) == {'review': {'id': 1}}
+
+    # request is sent again without validators
+    assert validators == [None, '"v1"', None]
+    assert client.validators.revalidated == 0
+    assert client.validators.get_headers(('GET', 'reviews/1', ())) == {'If-None-Match': '"v3"'}
+
+
+@responses.activate
+def test_not_modified_without_validators():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        status=304
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password')
+
+    with pytest.raises(SwarmError):
+        client.reviews.get_info(1)
+
+
+@pytest.mark.asyncio
+async def test_async_revalidate(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', revalidate={})
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        payload={'review': {'id': 1}},
+        headers={'ETag': '"v1"'},
+    )
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews/1'), status=304)
+
+    response = await client.reviews.get_info(1)
+    assert response == {'review': {'id': 1}}
+
+    response = await client.reviews.get_info(1)
+    assert response == {'review': {'id': 1}}
+
+    headers = list(aiohttp_mock.requests.values())[0][1].kwargs['headers']
+    assert headers['If-None-Match'] == '"v1"'
+    assert client.validators.revalidated == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_revalidate_evicted(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', revalidate={})
+    validators = []
+
+    async def callback(_url, **kwargs):
+        validators.append((kwargs.get('headers') or {}).get('If-None-Match'))
+
+        if len(validators) == 2:
+            # stored response is evicted while conditional request is in flight
+            client.validators.clear()
+            return CallbackResult(status=304)
+
+        headers = {'ETag': '"v{}"'.format(len(validators))}
+        return CallbackResult(payload={'review': {'id': 1}}, headers=headers)
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews/1'), callback=callback, repeat=True)
+
+    assert await client.reviews.get_info(1) == {'review': {'id': 1}}
+    assert await client.reviews.get_info(1) == {'review': {'id': 1}}
+
+    assert validators == [None, '"v1"', None]
+    assert client.validators.revalidated == 0
+
+    await client.close()
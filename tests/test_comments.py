@@ -42,6 +42,26 @@ def test_get():
     assert response['topic'] == 'reviews/911'
 
 
+@responses.activate
+def test_iter():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/comments'),
+        json={'topic': 'reviews/911', 'comments': {'35': {'id': 35}}, 'lastSeen': 35}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/comments'),
+        json={'topic': 'reviews/911', 'comments': {}, 'lastSeen': None}
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password')
+
+    comments = list(client.comments.iter(topic='reviews/911'))
+    assert comments == [{'id': 35}]
+
+
 def test_get_exception():
     client = SwarmClient('http://server/api/v4', 'user', 'password')
 
@@ -0,0 +1,173 @@
+import asyncio
+import re
+
+import pytest
+import responses
+
+from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from helixswarm.concurrency import ConcurrencyLimiter
+
+
+@pytest.mark.parametrize('adaptive_concurrency', [
+    dict(minimum=0),
+    dict(initial=200),
+    dict(minimum=10, maximum=5),
+    dict(backoff=1),
+    dict(tolerance=1),
+    dict(strange=1),
+])
+def test_adaptive_concurrency_argument_validation(adaptive_concurrency):
+    with pytest.raises(SwarmError):
+        SwarmClient(
+            'http://server/api/v9',
+            'user',
+            'password',
+            adaptive_concurrency=adaptive_concurrency,
+        )
+
+
+def test_aimd(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('helixswarm.concurrency.time.monotonic', lambda: now[0])
+
+    limiter = ConcurrencyLimiter(initial=2, maximum=4)
+
+    # window grows only while it's fully used
+    limiter.acquire()
+    limiter.release(0.1)
+    assert limiter.limit == 2
+
+    for _ in range(10):
+        limit = limiter.limit
+        for _ in range(limit):
+            limiter.acquire()
+        for _ in range(limit):
+            limiter.release(0.1)
+
+    assert limiter.limit == 4
+
+    # requests sent with old window decrease it once
+    for _ in range(4):
+        limiter.acquire()
+    for _ in range(4):
+        limiter.release(0.1, overloaded=True)
+
+    assert limiter.limit == 2
+    assert limiter.decreases == 1
+
+    # latency spike
+    now[0] += 1
+    limiter.acquire()
+    limiter.release(1.0)
+    assert limiter.limit == 1
+
+    # never below minimum
+    now[0] += 1
+    limiter.acquire()
+    limiter.release(0.1, overloaded=True)
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+
+
+@responses.activate
+def test_adaptive_concurrency():
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        adaptive_concurrency=dict(initial=2, maximum=2),
+        pool=dict(size=8),
+    )
+
+    in_flight = []
+
+    def callback(_request):
+        in_flight.append(client.concurrency_limiter.in_flight)
+        return 200, {}, '{"review": {"id": 1}}'
+
+    responses.add_callback(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/\d+'),
+        callback=callback,
+    )
+
+    client.map(client.reviews.get_info, range(20))
+
+    assert len(in_flight) == 20
+    assert max(in_flight) <= 2
+    assert client.concurrency_limiter.in_flight == 0
+
+
+@responses.activate
+def test_adaptive_concurrency_overload():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/1'),
+        status=503
+    )
+
+    infos = []
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        adaptive_concurrency=dict(initial=10),
+        hooks=[infos.append],
+    )
+
+    with pytest.raises(SwarmError):
+        client.reviews.get_info(1)
+
+    assert infos[0].concurrency_limit == 10
+    assert client.concurrency_limiter.limit == 5
+    assert client.concurrency_limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_adaptive_concurrency(aiohttp_mock):
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        adaptive_concurrency=dict(initial=3, maximum=3),
+    )
+
+    in_flight = []
+
+    async def callback(_url, **_kwargs):
+        in_flight.append(client.concurrency_limiter.in_flight)
+        await asyncio.sleep(0.01)
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/\d+'),
+        payload={'review': {'id': 1}},
+        callback=callback,
+        repeat=True,
+    )
+
+    await asyncio.gather(*[client.reviews.get_info(i) for i in range(10)])
+
+    assert len(in_flight) == 10
+    assert max(in_flight) == 3
+    assert client.concurrency_limiter.in_flight == 0
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_acquire_cancel():
+    limiter = ConcurrencyLimiter(initial=1)
+    await limiter.acquire_async()
+
+    waiter = asyncio.ensure_future(limiter.acquire_async())
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    limiter.release()
+    assert limiter.in_flight == 0
+
+    await limiter.acquire_async()
+    assert limiter.in_flight == 1
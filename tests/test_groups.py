@@ -59,6 +59,27 @@ def test_groups_get():
     assert 'groups' in response
 
 
+@responses.activate
+def test_groups_iter():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/groups'),
+        json={'groups': [{'Group': 'test-group'}], 'lastSeen': 'test-group'}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/groups'),
+        json={'groups': [], 'lastSeen': None}
+    )
+
+    client = SwarmClient('http://server/api/v2', 'user', 'password')
+
+    groups = list(client.groups.iter(keywords='test-group'))
+    assert [group['Group'] for group in groups] == ['test-group']
+    assert 'after=test-group' in responses.calls[1].request.url
+
+
 @responses.activate
 def test_groups_get_info():
     data = {
@@ -0,0 +1,74 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+# generous limit, without third party HTTP libraries package import takes
+# a few milliseconds
+IMPORT_TIME_LIMIT = 0.1
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code + ';import sys;print(*sys.modules)'],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def get_import_time(stderr, module):
+    for line in stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$', line)
+        if match and match.group(3) == module:
+            return int(match.group(1)) / 10 ** 6
+
+    raise AssertionError('{} is not imported'.format(module))
+
+
+@pytest.mark.parametrize('code, loaded, not_loaded', [
+    (
+        'import helixswarm',
+        [],
+        ['aiohttp', 'requests', 'urllib3', 'helixswarm.swarm'],
+    ),
+    (
+        'from helixswarm import SwarmClient',
+        ['requests'],
+        ['aiohttp', 'asyncio', 'helixswarm.endpoints.reviews'],
+    ),
+    (
+        'from helixswarm import SwarmAsyncClient',
+        ['aiohttp'],
+        ['requests', 'helixswarm.endpoints.reviews'],
+    ),
+    (
+        'from helixswarm import SwarmClient;'
+        'SwarmClient("http://server/api/v9", "user", "password").reviews',
+        ['requests', 'helixswarm.endpoints.reviews'],
+        ['aiohttp', 'helixswarm.endpoints.projects'],
+    ),
+])
+def test_lazy_import(code, loaded, not_loaded):
+    modules = set(run(code).stdout.split())
+
+    for module in loaded:
+        assert module in modules
+
+    for module in not_loaded:
+        assert module not in modules
+
+
+def test_import_time():
+    result = run('import helixswarm')
+    assert get_import_time(result.stderr, 'helixswarm') < IMPORT_TIME_LIMIT
+
+
+def test_lazy_attributes():
+    import helixswarm  # pylint: disable=import-outside-toplevel
+
+    assert 'SwarmClient' in dir(helixswarm)
+
+    with pytest.raises(AttributeError):
+        helixswarm.UnknownClient  # pylint: disable=pointless-statement
@@ -1,8 +1,15 @@
+import asyncio
+import json
 import re
 
+from urllib.parse import parse_qsl, urlparse
+
 import pytest
 import responses
 
+from aioresponses import CallbackResult
+from multidict import MultiDict
+
 from helixswarm import (
     SwarmAsyncClient,
     SwarmClient,
@@ -104,6 +111,105 @@ def test_get_parameters():
     assert len(reviews['reviews']) == 2
 
 
+@responses.activate
+def test_iter():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews'),
+        json={'lastSeen': 2, 'reviews': [{'id': 1}, {'id': 2}], 'totalCount': 3}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews'),
+        json={'lastSeen': 3, 'reviews': [{'id': 3}], 'totalCount': 3}
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews'),
+        json={'lastSeen': None, 'reviews': [], 'totalCount': 3}
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password')
+
+    reviews = list(client.reviews.iter(limit=2, states=['needsReview']))
+    assert [review['id'] for review in reviews] == [1, 2, 3]
+
+    assert 'after' not in responses.calls[0].request.url
+    assert 'after=2' in responses.calls[1].request.url
+    assert 'after=3' in responses.calls[2].request.url
+
+
+@pytest.mark.asyncio
+async def test_iter_async(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password')
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews'),
+        payload={'lastSeen': 2, 'reviews': [{'id': 1}, {'id': 2}]},
+    )
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews'),
+        payload={'lastSeen': None, 'reviews': []},
+    )
+
+    reviews = [review async for review in client.reviews.iter(limit=2)]
+    assert [review['id'] for review in reviews] == [1, 2]
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_async_prefetch(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', prefetch=2)
+
+    for page in range(3):
+        aiohttp_mock.get(
+            re.compile(r'.*/api/v\d+/reviews'),
+            payload={'lastSeen': page + 1, 'reviews': [{'id': page + 1}]},
+        )
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews'),
+        payload={'lastSeen': None, 'reviews': []},
+    )
+
+    reviews = [review async for review in client.reviews.iter(limit=1)]
+    assert [review['id'] for review in reviews] == [1, 2, 3]
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_async_prefetch_exception(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', prefetch=1)
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews'),
+        payload={'lastSeen': 1, 'reviews': [{'id': 1}]},
+    )
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews'),
+        payload={'error': 'Server error'},
+        status=500,
+    )
+
+    reviews = []
+    with pytest.raises(SwarmError):
+        async for review in client.reviews.iter():
+            reviews.append(review)
+
+    assert reviews == [{'id': 1}]
+
+    with pytest.raises(SwarmError):
+        SwarmAsyncClient('http://server/api/v9', 'user', 'password', prefetch=-1)
+
+    await client.close()
+
+
 def test_get_exceptions():
     client = SwarmClient('http://server/api/v1.2', 'user', 'password')
 
@@ -177,6 +283,95 @@ def test_get_info():
     assert reviews['review']['id'] == 12204
 
 
+def _get_reviews(query):
+    # review 3 doesn't exist
+    ids = [int(review_id) for review_id in query.getall('ids[]')]
+    return {'reviews': [{'id': review_id} for review_id in ids if review_id != 3]}
+
+
+@responses.activate
+def test_get_many():
+    queries = []
+    query_strings = []
+
+    def callback(request):
+        query_strings.append(urlparse(request.url).query)
+        query = MultiDict(parse_qsl(urlparse(request.url).query))
+        queries.append(query)
+        return 200, {}, json.dumps(_get_reviews(query))
+
+    responses.add_callback(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews.*'),
+        callback=callback,
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password')
+
+    response = client.reviews.get_many([1, 2, 3, 4, 5, 1], fields=['state'], chunk_size=2)
+
+    assert list(response['reviews']) == [1, 2, 4, 5]
+    assert response['missing'] == [3]
+
+    assert len(queries) == 3
+    assert all(query['fields'] == 'state,id' for query in queries)
+    assert sorted(query['max'] for query in queries) == ['1', '2', '2']
+
+    assert sorted(query_strings) == [
+        'max=1&fields=state%2Cid&ids%5B%5D=5',
+        'max=2&fields=state%2Cid&ids%5B%5D=1&ids%5B%5D=2',
+        'max=2&fields=state%2Cid&ids%5B%5D=3&ids%5B%5D=4',
+    ]
+
+    with pytest.raises(SwarmError):
+        client.reviews.get_many([1], chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_get_many_async(aiohttp_mock):
+    infos = []
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', hooks=[infos.append])
+
+    async def callback(url, **_kwargs):
+        return CallbackResult(payload=_get_reviews(url.query))
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews.*'), callback=callback, repeat=True)
+
+    response = await client.reviews.get_many(range(1, 6), chunk_size=2)
+
+    assert list(response['reviews']) == [1, 2, 4, 5]
+    assert response['missing'] == [3]
+    assert [info.operation for info in infos] == ['Reviews.get_many'] * 3
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_many_async_pool(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', pool=dict(size=2))
+
+    in_flight = []
+    most = 0
+
+    async def callback(url, **_kwargs):
+        nonlocal most
+        in_flight.append(url)
+        most = max(most, len(in_flight))
+        await asyncio.sleep(0.001)
+        in_flight.remove(url)
+        return CallbackResult(payload=_get_reviews(url.query))
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews.*'), callback=callback, repeat=True)
+
+    response = await client.reviews.get_many(range(1, 21), chunk_size=2)
+
+    # no more requests at once than connections in pool
+    assert len(response['reviews']) == 19
+    assert most == 2
+
+    await client.close()
+
+
 @responses.activate
 def test_get_info_error():
     data = {
@@ -371,6 +566,64 @@ def test_get_latest_revision_and_change_exception():
         client.reviews.get_latest_revision_and_change(12345)
 
 
+VERSIONS = {
+    1: [{'change': 10}, {'change': 12}],
+    2: [],
+}
+
+
+def _get_versions(query):
+    ids = [int(review_id) for review_id in query.getall('ids[]')]
+    return {'reviews': [
+        {'id': review_id, 'versions': VERSIONS[review_id]}
+        for review_id in ids if review_id in VERSIONS
+    ]}
+
+
+@responses.activate
+def test_get_latest_revisions_and_changes():
+    queries = []
+
+    def callback(request):
+        queries.append(urlparse(request.url).query)
+        query = MultiDict(parse_qsl(urlparse(request.url).query))
+        return 200, {}, json.dumps(_get_versions(query))
+
+    responses.add_callback(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews.*'),
+        callback=callback,
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password')
+
+    result = client.reviews.get_latest_revisions_and_changes([1, 2, 3])
+
+    # all ids are sent, not only the last one
+    assert queries == ['max=3&fields=versions%2Cid&ids%5B%5D=1&ids%5B%5D=2&ids%5B%5D=3']
+
+    assert result[1] == (2, 12)
+    assert isinstance(result[2], SwarmError)
+    assert isinstance(result[3], SwarmNotFoundError)
+
+
+@pytest.mark.asyncio
+async def test_get_latest_revisions_and_changes_async(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password')
+
+    async def callback(url, **_kwargs):
+        return CallbackResult(payload=_get_versions(url.query))
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/reviews.*'), callback=callback, repeat=True)
+
+    result = await client.reviews.get_latest_revisions_and_changes([1, 3], chunk_size=1)
+
+    assert result[1] == (2, 12)
+    assert isinstance(result[3], SwarmNotFoundError)
+
+    await client.close()
+
+
 @responses.activate
 def test_create():
     data = {
@@ -0,0 +1,124 @@
+import json
+import re
+
+import pytest
+import responses
+
+from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from helixswarm.stream import ItemParser
+
+REVIEWS = {
+    'lastSeen': 2,
+    'reviews': [{'id': 1, 'description': 'unicode ✓'}, {'id': 2, 'votes': [1.5, None, True]}],
+    'totalCount': 3,
+}
+
+
+@pytest.mark.parametrize('size', [1, 3, 16, 1024])
+def test_item_parser(size):
+    body = json.dumps(REVIEWS, ensure_ascii=False, indent=2).encode()
+
+    parser = ItemParser('reviews')
+    items = []
+
+    for start in range(0, len(body), size):
+        items += parser.feed(body[start:start + size])
+
+    items += parser.close()
+
+    assert items == REVIEWS['reviews']
+    assert parser.fields == {'lastSeen': 2, 'totalCount': 3}
+
+
+def test_item_parser_split():
+    body = b'{"lastSeen":1.5e3,"reviews":[-12.25,3E-2,{"id":7},0,true],"totalCount":10}'
+    expected = json.loads(body)
+
+    # chunk boundary at every byte, including inside of numbers
+    for offset in range(len(body) + 1):
+        parser = ItemParser('reviews')
+        items = parser.feed(body[:offset]) + parser.feed(body[offset:]) + parser.close()
+
+        assert items == expected['reviews'], offset
+        assert parser.fields == {'lastSeen': 1500.0, 'totalCount': 10}, offset
+
+
+def test_item_parser_object():
+    parser = ItemParser('comments')
+    items = parser.feed(b'{"comments": {"1": {"id": 1}, "2": {"id": 2}}, "lastSeen": null}')
+
+    assert items + parser.close() == [{'id': 1}, {'id': 2}]
+    assert parser.fields == {'lastSeen': None}
+
+
+@pytest.mark.parametrize('body', [b'{"reviews": [{"id": 1}', b'[]', b'{} {}'])
+def test_item_parser_invalid(body):
+    parser = ItemParser('reviews')
+
+    with pytest.raises(SwarmError):
+        parser.feed(body)
+        parser.close()
+
+
+@responses.activate
+def test_stream():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews\?.*after=2.*'),
+        json={'lastSeen': None, 'reviews': [{'id': 3}]},
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews.*'),
+        json=REVIEWS,
+    )
+
+    infos = []
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        stream=True,
+        hooks=[infos.append],
+    )
+
+    reviews = list(client.reviews.iter())
+
+    assert [review['id'] for review in reviews] == [1, 2, 3]
+    assert [(info.operation, info.status) for info in infos] == [('Reviews.iter', 200)] * 2
+
+
+@responses.activate
+def test_stream_error():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews.*'),
+        json={'error': 'Internal error'},
+        status=500,
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password', stream=True)
+
+    with pytest.raises(SwarmError):
+        list(client.reviews.iter())
+
+
+@pytest.mark.asyncio
+async def test_async_stream(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', stream=True)
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/comments.*after=2.*'), payload={
+        'lastSeen': None,
+        'comments': {'3': {'id': 3}},
+    })
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/comments.*'), payload={
+        'lastSeen': 2,
+        'comments': {'1': {'id': 1}, '2': {'id': 2}},
+    })
+
+    comments = [comment async for comment in client.comments.iter()]
+    assert [comment['id'] for comment in comments] == [1, 2, 3]
+
+    await client.close()
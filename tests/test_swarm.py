@@ -1,12 +1,28 @@
+import asyncio
+import copy
+import json
 import re
+import ssl
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
+from types import SimpleNamespace
 
 import aiohttp
 import pytest
+import requests
 import responses
 
-from helixswarm import SwarmAsyncClient, SwarmClient, SwarmError
+from aioresponses import CallbackResult
+
+from helixswarm import (
+    SwarmAsyncClient,
+    SwarmClient,
+    SwarmError,
+    SwarmNotFoundError,
+)
+from helixswarm.coalesce import RequestCoalescer
 
 GET_VERSION_DATA = {
     'apiVersions': [1, 1.1, 1.2, 2, 3, 4, 5, 6, 7, 8, 9],
@@ -52,6 +68,74 @@ def test_retry_argument_validation():
         )
 
 
+def test_pool_argument_validation():
+    with pytest.raises(SwarmError):
+        SwarmClient(
+            'http://server/api/v9',
+            'user',
+            'password',
+            pool=dict(size=10, strange_argument=1)
+        )
+
+    with pytest.raises(SwarmError):
+        SwarmAsyncClient(
+            'http://server/api/v9',
+            'user',
+            'password',
+            pool=dict(per_host=0)
+        )
+
+
+def test_sync_client_pool():
+    context = ssl.create_default_context()
+
+    client = SwarmClient(
+        'https://server/api/v9',
+        'user',
+        'password',
+        pool=dict(size=32, keepalive_timeout=60),
+        ssl_context=context,
+    )
+
+    adapter = client.session.adapters['https://']
+    assert adapter._pool_maxsize == 32
+    assert adapter.poolmanager.connection_pool_kw['ssl_context'] is context
+
+    usage = client.get_pool_usage()
+    assert usage['size'] == 32
+    assert usage['in_use'] == usage['idle'] == usage['requests'] == 0
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_pool():
+    context = ssl.create_default_context()
+
+    client = SwarmAsyncClient(
+        'https://server/api/v9',
+        'user',
+        'password',
+        pool=dict(size=200, per_host=50, keepalive_timeout=60, dns_ttl=300),
+        ssl_context=context,
+    )
+
+    assert client.connector._ssl is context
+
+    usage = client.get_pool_usage()
+    assert usage == dict(size=200, per_host=50, in_use=0, idle=0)
+
+    # connector internals may change with aiohttp version
+    connector = client.connector
+    client.connector = SimpleNamespace(limit=100, limit_per_host=0)
+
+    usage = client.get_pool_usage()
+    assert usage == dict(size=100, per_host=0, in_use=None, idle=None)
+
+    client.connector = connector
+    await client.close()
+
+
 @responses.activate
 def test_response_invalid_json():
     responses.add(
@@ -82,6 +166,52 @@ def test_response_non_ok():
         client.get_version()
 
 
+@responses.activate
+def test_json_loads():
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/version'),
+        json=GET_VERSION_DATA,
+        status=200
+    )
+
+    bodies = []
+
+    def json_loads(body):
+        bodies.append(body)
+        return json.loads(body)
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password', json_loads=json_loads)
+
+    version = client.get_version()
+    assert version['year'] == '2018'
+    assert isinstance(bodies[0], bytes)
+
+
+@pytest.mark.asyncio
+async def test_async_json_loads(aiohttp_mock):
+    bodies = []
+
+    def json_loads(body):
+        bodies.append(body)
+        return json.loads(body)
+
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        json_loads=json_loads,
+    )
+
+    aiohttp_mock.get('http://server/api/v9/version', payload=GET_VERSION_DATA)
+
+    version = await client.get_version()
+    assert version['year'] == '2018'
+    assert isinstance(bodies[0], bytes)
+
+    await client.close()
+
+
 @responses.activate
 def test_sync_client():
     responses.add(
@@ -107,21 +237,94 @@ def test_sync_client():
 
 @responses.activate
 def test_sync_client_retry():
-    # responses library does`t support Retry mock
-    # https://github.com/getsentry/responses/issues/135
-    # so, just cover code of retry constructor
     client = SwarmClient(
         'http://server/api/v9',
         'user',
         'password',
         retry=dict(
             total=10,
-            factor=1,
+            factor=0.01,
             statuses=[400, 500],
         )
     )
 
-    assert client.session.adapters['http://'].max_retries.status_forcelist == [400, 500]
+    assert client.retry.statuses == [400, 500]
+
+    responses.add(
+        responses.GET,
+        'http://server/api/v9/version',
+        json={'error': 'Server error'},
+        status=500,
+    )
+
+    responses.add(
+        responses.GET,
+        'http://server/api/v9/version',
+        json=GET_VERSION_DATA,
+        status=200,
+    )
+
+    version = client.get_version()
+    assert version['year'] == '2018'
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_sync_client_retry_exception():
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        retry=dict(
+            total=1,
+            factor=0.01,
+            statuses=[500],
+        )
+    )
+
+    responses.add(
+        responses.GET,
+        'http://server/api/v9/version',
+        body=requests.ConnectionError(),
+    )
+
+    with pytest.raises(SwarmError):
+        client.get_version()
+
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_sync_client_map():
+    for review_id in (1, 2, 4):
+        responses.add(
+            responses.GET,
+            re.compile(r'.*/api/v\d+/reviews/{}$'.format(review_id)),
+            json={'review': {'id': review_id}},
+        )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/reviews/3$'),
+        json={'error': 'Not Found'},
+        status=404,
+    )
+
+    client = SwarmClient('http://server/api/v9', 'user', 'password', pool=dict(size=4))
+
+    reviews = client.map(client.reviews.get_info, range(1, 5))
+    assert reviews[0]['review']['id'] == 1
+    assert reviews[1]['review']['id'] == 2
+    assert isinstance(reviews[2], SwarmNotFoundError)
+    assert reviews[3]['review']['id'] == 4
+
+    with pytest.raises(SwarmError):
+        client.map(client.reviews.get_info, [1], max_workers=5)
+
+    with pytest.raises(SwarmError):
+        client.map(client.reviews.get_info, [1], max_workers=0)
+
+    client.close()
 
 
 @pytest.mark.asyncio
@@ -146,6 +349,178 @@ async def test_async_client(aiohttp_mock):
         await client.close()
 
 
+@pytest.mark.asyncio
+async def test_async_client_gather(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password')
+
+    for review_id in (1, 2, 4):
+        aiohttp_mock.get(
+            'http://server/api/v9/reviews/{}'.format(review_id),
+            payload={'review': {'id': review_id}},
+        )
+
+    aiohttp_mock.get(
+        'http://server/api/v9/reviews/3',
+        payload={'error': 'Not Found'},
+        status=404,
+    )
+
+    calls = (client.reviews.get_info(i) for i in range(1, 5))
+    results = [r async for r in client.gather(calls, concurrency=2, ordered=True)]
+
+    assert [index for index, _ in results] == [0, 1, 2, 3]
+    assert results[0][1]['review']['id'] == 1
+    assert isinstance(results[2][1], SwarmNotFoundError)
+
+    with pytest.raises(SwarmError):
+        async for _ in client.gather([], concurrency=0):
+            pass
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_gather_concurrency():
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password')
+
+    running = []
+    running_max = []
+
+    async def call(delay):
+        running.append(delay)
+        running_max.append(len(running))
+        await asyncio.sleep(delay)
+        running.remove(delay)
+        return delay
+
+    calls = [call(d) for d in (0.03, 0.01, 0.02, 0.01, 0)]
+    results = [r async for r in client.gather(calls, concurrency=3)]
+
+    assert max(running_max) == 3
+    assert sorted(index for index, _ in results) == [0, 1, 2, 3, 4]
+    assert results[0] == (1, 0.01)
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesce(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', coalesce=True)
+
+    # each mock responds only once
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/1\?fields=versions'),
+        payload={'review': {'versions': [{'change': 1}, {'change': 5}]}},
+    )
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/1$'),
+        payload={'review': {'id': 1}},
+    )
+
+    results = await asyncio.gather(
+        client.reviews.get_latest_revision_and_change(1),
+        client.reviews.get_latest_revision_and_change(1),
+        client.reviews.get_info(1),
+        client.reviews.get_info(1),
+    )
+
+    assert results[0] == results[1] == (2, 5)
+    assert results[2] == results[3] == {'review': {'id': 1}}
+    assert results[2] is not results[3]
+    assert not client.coalescer._in_flight
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesce_copies(aiohttp_mock, monkeypatch):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', coalesce=True)
+
+    aiohttp_mock.get(
+        re.compile(r'.*/api/v\d+/reviews/1$'),
+        payload={'review': {'id': 1}},
+    )
+
+    copies = []
+
+    def deepcopy(value):
+        copies.append(copy.deepcopy(value))
+        return copies[-1]
+
+    monkeypatch.setattr('helixswarm.coalesce.copy', SimpleNamespace(deepcopy=deepcopy))
+
+    async def get_and_change():
+        response = await client.reviews.get_info(1)
+        response['review']['id'] = 2
+        return response
+
+    results = await asyncio.gather(
+        get_and_change(),
+        client.reviews.get_info(1),
+        client.reviews.get_info(1),
+    )
+
+    # only callers which joined the first one get copies
+    assert copies == [{'review': {'id': 1}}] * 2
+    assert results[0] == {'review': {'id': 2}}
+    assert results[1] == results[2] == {'review': {'id': 1}}
+    assert results[1] is not results[2]
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_join_finished():
+    coalescer = RequestCoalescer()
+    event = asyncio.Event()
+    calls = []
+
+    async def send():
+        await event.wait()
+        calls.append(1)
+        return {'review': {'id': len(calls)}}
+
+    async def join_later():
+        # resumed in the same loop iteration as request finishes
+        await event.wait()
+        return await coalescer.request('key', send)
+
+    leader = asyncio.ensure_future(coalescer.request('key', send))
+    for _ in range(2):
+        await asyncio.sleep(0)
+
+    late = asyncio.ensure_future(join_later())
+    await asyncio.sleep(0)
+
+    event.set()
+
+    assert await leader == {'review': {'id': 1}}
+    assert await late == {'review': {'id': 2}}
+    assert not coalescer._in_flight
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesce_exception(aiohttp_mock):
+    client = SwarmAsyncClient('http://server/api/v9', 'user', 'password', coalesce=True)
+
+    aiohttp_mock.get(
+        'http://server/api/v9/reviews/1',
+        payload={'error': 'Not Found'},
+        status=404,
+    )
+
+    results = await asyncio.gather(
+        client.reviews.get_info(1),
+        client.reviews.get_info(1),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, SwarmNotFoundError) for result in results)
+
+    await client.close()
+
+
 @pytest.mark.asyncio
 async def test_async_client_retry(aiohttp_mock):
     client = SwarmAsyncClient(
@@ -246,6 +621,162 @@ def test_update_auth():
 ###############################################################################
 
 
+@responses.activate
+def test_update_auth_concurrent():
+    updates = []
+
+    def update():
+        updates.append(threading.get_ident())
+        return 'user_new', 'password_new'
+
+    old_auth = requests.auth._basic_auth_str('user_old', 'password_old')
+    barrier = threading.Barrier(10, timeout=5)
+
+    def callback(request):
+        # all requests are rejected before credentials are updated
+        if request.headers['Authorization'] == old_auth:
+            barrier.wait()
+            return 401, {}, ''
+        return 200, {}, json.dumps(GET_VERSION_DATA)
+
+    responses.add_callback(
+        responses.GET,
+        re.compile(r'.*/api/v\d+/version'),
+        callback=callback,
+    )
+
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user_old',
+        'password_old',
+        auth_update_callback=update
+    )
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        versions = list(executor.map(lambda _: client.get_version(), range(10)))
+
+    assert len(updates) == 1
+    assert all(version['year'] == '2018' for version in versions)
+    assert len(responses.calls) == 20
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_update_auth_concurrent(aiohttp_mock):
+    updates = []
+
+    async def update():
+        updates.append(1)
+        await asyncio.sleep(0.01)
+        return 'user_new', 'password_new'
+
+    async def callback(_url, **kwargs):
+        if kwargs['auth'].login == 'user_old':
+            await asyncio.sleep(0.01)
+            return CallbackResult(status=401)
+        return CallbackResult(payload=GET_VERSION_DATA)
+
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/version'), callback=callback, repeat=True)
+
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user_old',
+        'password_old',
+        auth_update_callback=update
+    )
+
+    versions = await asyncio.gather(*[client.get_version() for _ in range(20)])
+
+    assert len(updates) == 1
+    assert all(version['year'] == '2018' for version in versions)
+
+    await client.close()
+
+
+@responses.activate
+def test_session_auth():
+    sessions = ['first']
+    basic_auth = requests.auth._basic_auth_str('user', 'password')
+
+    def login(request):
+        assert request.headers['Authorization'] == basic_auth
+        headers = {'Set-Cookie': 'SWARM={}; Path=/'.format(sessions[-1])}
+        return 200, headers, json.dumps({'isValid': True})
+
+    def version(request):
+        # credentials aren't sent, only cookie of current session
+        if 'Authorization' in request.headers:
+            return 400, {}, ''
+        if request.headers.get('Cookie') != 'SWARM=' + sessions[-1]:
+            return 401, {}, ''
+        return 200, {}, json.dumps(GET_VERSION_DATA)
+
+    responses.add_callback(responses.POST, re.compile(r'.*/api/v\d+/session'), callback=login)
+    responses.add_callback(responses.GET, re.compile(r'.*/api/v\d+/version'), callback=version)
+
+    infos = []
+    client = SwarmClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        session_auth=True,
+        hooks=[infos.append],
+    )
+
+    client.get_version()
+    client.get_version()
+    assert len(responses.calls) == 3
+
+    # session expired
+    sessions.append('second')
+    assert client.get_version()['year'] == '2018'
+
+    assert [info.operation for info in infos] == [
+        'Swarm.init_session',
+        'Swarm.get_version',
+        'Swarm.get_version',
+        'Swarm.init_session',
+        'Swarm.get_version',
+    ]
+    assert infos[-1].auth_refreshed
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_session_auth(aiohttp_mock):
+    logins = []
+
+    async def update():
+        return 'user', 'password_new'
+
+    async def login(_url, **kwargs):
+        logins.append(kwargs['auth'].password)
+        if kwargs['auth'].password != 'password_new':
+            return CallbackResult(status=401)
+        return CallbackResult(payload={'isValid': True})
+
+    aiohttp_mock.post(re.compile(r'.*/api/v\d+/session'), callback=login, repeat=True)
+    aiohttp_mock.get(re.compile(r'.*/api/v\d+/version'), payload=GET_VERSION_DATA, repeat=True)
+
+    client = SwarmAsyncClient(
+        'http://server/api/v9',
+        'user',
+        'password',
+        session_auth=True,
+        auth_update_callback=update,
+    )
+
+    await asyncio.gather(*[client.get_version() for _ in range(5)])
+
+    # session is created once with updated credentials
+    assert logins == ['password', 'password_new']
+    assert client.auth is None
+
+    await client.close()
+
+
 @responses.activate
 def test_check_auth():
     data = {